@@ -1,32 +1,74 @@
-__all__ = ['generate_age']
+__all__ = ['generate_age', 'generate_ages']
 # phoney/age.py
 """Age and birthdate generator."""
+import calendar
 import random
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
-def generate_age(min_age=18, max_age=80):
+
+def _check_ages(min_age, max_age):
+    if min_age > max_age:
+        raise ValueError(f"min_age ({min_age}) must not exceed max_age ({max_age})")
+
+
+def generate_age(min_age=18, max_age=80, today=None, rng=None):
     """
     Generate a random age and corresponding birthdate.
     
     Args:
         min_age: Minimum age to generate
         max_age: Maximum age to generate
+        today: Reference date (datetime.date). Defaults to the current date;
+            batch callers pass it once to avoid a clock read per row.
+        rng: Optional random.Random instance; defaults to the global random module
         
     Returns:
         tuple: (age, birthdate) where birthdate is a datetime.date object
     """
-    current_date = datetime.now().date()
-    birth_year = random.randint(current_date.year - max_age, current_date.year - min_age)
-    birth_month = random.randint(1, 12)
+    _check_ages(min_age, max_age)
+    rng = rng or random
+    current_date = today or datetime.now().date()
+    birth_year = rng.randint(current_date.year - max_age, current_date.year - min_age)
+    birth_month = rng.randint(1, 12)
     if birth_month == 2:
         max_day = 29 if (birth_year % 4 == 0 and birth_year % 100 != 0) or (birth_year % 400 == 0) else 28
     else:
         max_day = 30 if birth_month in [4, 6, 9, 11] else 31
-    birth_day = random.randint(1, max_day)
+    birth_day = rng.randint(1, max_day)
     birthdate = datetime(birth_year, birth_month, birth_day).date()
 
     age = current_date.year - birthdate.year
     if (current_date.month, current_date.day) < (birthdate.month, birthdate.day):
         age -= 1
 
-    return age, birthdate
\ No newline at end of file
+    return age, birthdate
+
+
+def generate_ages(n, min_age=18, max_age=80, today=None, rng=None):
+    """
+    Generate ``n`` (age, birthdate) pairs in one batch.
+
+    Years and months are drawn for the whole batch with two ``choices``
+    calls and month lengths come from a table built once, so a row costs
+    one draw for the day plus the date itself. Birthdates are distributed
+    like ``generate_age`` (uniform year, then month, then day).
+
+    Args:
+        n: Number of pairs.
+        min_age, max_age, today, rng: As for ``generate_age``.
+    Returns:
+        list: ``n`` tuples (age, birthdate).
+    """
+    _check_ages(min_age, max_age)
+    r = rng or random
+    current_date = today or datetime.now().date()
+    years = range(current_date.year - max_age, current_date.year - min_age + 1)
+    month_days = {(y, m): calendar.monthrange(y, m)[1] for y in years for m in range(1, 13)}
+    now = (current_date.month, current_date.day)
+    rand = r.random
+    pairs = []
+    append = pairs.append
+    for y, m in zip(r.choices(years, k=n), r.choices(range(1, 13), k=n)):
+        d = int(rand() * month_days[y, m]) + 1
+        append((current_date.year - y - (now < (m, d)), date(y, m, d)))
+    return pairs
@@ -1,5 +1,5 @@
 # phoney/agent.py
-__all__ = ['generate_user_agent']
+__all__ = ['generate_user_agent', 'generate_user_agents']
 """User agent generator for web scraping and testing."""
 import random
 
@@ -28,21 +28,56 @@ _VERSION_RANGES = {
     "ios": (15, 17)
 }
 
-def generate_user_agent(device_type="desktop"):
+def generate_user_agent(device_type="desktop", rng=None):
     """Generate realistic user agent string"""
+    rng = rng or random
     templates = _USER_AGENTS.get(device_type, _USER_AGENTS["desktop"])
-    template = random.choice(templates)
+    template = rng.choice(templates)
     
     if "Chrome" in template:
-        version = random.randint(*_VERSION_RANGES["chrome"])
+        version = rng.randint(*_VERSION_RANGES["chrome"])
     elif "Firefox" in template:
-        version = random.randint(*_VERSION_RANGES["firefox"])
+        version = rng.randint(*_VERSION_RANGES["firefox"])
     else:
-        version = random.randint(*_VERSION_RANGES["safari"])
+        version = rng.randint(*_VERSION_RANGES["safari"])
     
     if "{android_version}" in template:
-        template = template.replace("{android_version}", str(random.randint(10, 14)))
+        template = template.replace("{android_version}", str(rng.randint(10, 14)))
     if "{ios_version}" in template:
-        template = template.replace("{ios_version}", str(random.randint(15, 17)))
+        template = template.replace("{ios_version}", str(rng.randint(15, 17)))
     
-    return template.replace("{version}", str(version))
\ No newline at end of file
+    return template.replace("{version}", str(version))
+
+
+# device type -> (every user agent string, cumulative weights), built on first use
+_AGENT_TABLES = {}
+
+
+def _agent_table(device_type):
+    table = _AGENT_TABLES.get(device_type)
+    if table is None:
+        # Every (template, version, OS version) outcome of generate_user_agent with its probability
+        templates = _USER_AGENTS.get(device_type, _USER_AGENTS["desktop"])
+        agents, weights = [], []
+        for template in templates:
+            browser = "chrome" if "Chrome" in template else "firefox" if "Firefox" in template else "safari"
+            outcomes = [template.replace("{version}", str(v))
+                        for v in range(_VERSION_RANGES[browser][0], _VERSION_RANGES[browser][1] + 1)]
+            for key, placeholder in (("android", "{android_version}"), ("ios", "{ios_version}")):
+                if placeholder in template:
+                    lo, hi = _VERSION_RANGES[key]
+                    outcomes = [o.replace(placeholder, str(v)) for o in outcomes for v in range(lo, hi + 1)]
+            agents.extend(outcomes)
+            weights.extend([1 / (len(templates) * len(outcomes))] * len(outcomes))
+        cum, total = [], 0.0
+        for w in weights:
+            total += w
+            cum.append(total)
+        table = _AGENT_TABLES[device_type] = (agents, cum)
+    return table
+
+
+def generate_user_agents(n, device_type="desktop", rng=None):
+    """Generate ``n`` user agent strings with one weighted draw over every possible string."""
+    agents, cum = _agent_table(device_type)
+    return (rng or random).choices(agents, cum_weights=cum, k=n)
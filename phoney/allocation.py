@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, Iterator, List, Optional
+
+from .checksum import gs1_check_digit, luhn_check_digit, vin_check_digit
+from .vin import VIN_CHARS, VIN_RUNS
+
+ALLOCATOR_KINDS = ("imei", "ean13", "upca", "isbn13", "vin")
+ALLOCATOR_MODES = ("sequential", "permuted")
+
+_MASK64 = (1 << 64) - 1
+
+# Total code length (without check digit) and default prefix of the numeric kinds
+_NUMERIC_BODY = {"imei": 14, "ean13": 12, "upca": 11, "isbn13": 12}
+_DEFAULT_PREFIX = {"ean13": "", "upca": "", "isbn13": "978"}
+
+# VIS (positions 10-17): two VIN characters, then a six-digit serial
+_VIS_HEAD = len(VIN_CHARS) ** 2
+_VIS_SIZE = _VIS_HEAD * 10 ** 6
+
+
+def _splitmix64(x: int) -> int:
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+class FeistelPermutation:
+    """
+    Keyed bijection of ``range(size)``.
+
+    A balanced Feistel network permutes the smallest even-bit domain holding
+    ``size`` values (at most 4x larger); results outside ``range(size)`` are
+    fed through again ("cycle walking") until they land inside. Every index
+    maps to a distinct value, and a call costs a fixed number of rounds plus
+    fewer than 4 walks on average, independent of how many values were drawn.
+    """
+
+    __slots__ = ("size", "key", "rounds", "_half_bits", "_half_mask", "_round_keys")
+
+    def __init__(self, size: int, key: int, rounds: int = 4):
+        if size <= 0:
+            raise ValueError("size must be a positive integer")
+        if rounds < 3:
+            raise ValueError("rounds must be at least 3")
+        self.size = size
+        self.key = key & _MASK64
+        self.rounds = rounds
+        self._half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self._half_mask = (1 << self._half_bits) - 1
+        keys = []
+        k = self.key
+        for _ in range(rounds):
+            k = _splitmix64(k)
+            keys.append(k)
+        self._round_keys = tuple(keys)
+
+    def _encrypt(self, x: int) -> int:
+        bits, mask = self._half_bits, self._half_mask
+        left, right = x >> bits, x & mask
+        for k in self._round_keys:
+            f = ((right ^ k) * 0xBF58476D1CE4E5B9) & _MASK64
+            left, right = right, left ^ ((f ^ (f >> 31)) & mask)
+        return (left << bits) | right
+
+    def __call__(self, index: int) -> int:
+        if not 0 <= index < self.size:
+            raise ValueError(f"index must be in range(0, {self.size})")
+        x = self._encrypt(index)
+        while x >= self.size:
+            x = self._encrypt(x)
+        return x
+
+
+class IdentifierAllocator:
+    """
+    Hand out identifiers that share a prefix and never repeat.
+
+    Instead of drawing serials at random (which collides at scale), the
+    allocator walks the serial space behind a fixed prefix: the SNR after a
+    TAC for IMEIs, the digits after ``prefix`` for EAN-13/UPC-A/ISBN-13, and
+    the VIS after the first 8 characters for VINs. In 'permuted' mode
+    position ``i`` goes through a keyed FeistelPermutation, so consecutive
+    values look random but stay unique. Each value costs O(1), and
+    ``state()`` / ``from_state()`` let a long run resume where it stopped.
+
+    Usage:
+        from phoney import phoney
+        alloc = phoney.allocator("imei", prefix="35209900", mode="permuted")
+        batch = alloc.take(1_000_000)
+        saved = alloc.state()          # JSON-serializable
+        ...
+        alloc = IdentifierAllocator.from_state(saved)
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        prefix: Optional[str] = None,
+        mode: str = "sequential",
+        key: Optional[int] = None,
+        start: int = 0,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Args:
+            kind: One of ALLOCATOR_KINDS.
+            prefix: Fixed leading part: the 8-digit TAC for 'imei', the GS1 /
+                ISBN prefix for barcodes, or the first 8 VIN characters
+                (WMI + VDS) for 'vin'. Random for 'imei' and 'vin' if None.
+            mode: 'sequential' (serials in order) or 'permuted'.
+            key: Permutation key for 'permuted'; drawn from ``rng`` if None.
+            start: Position to start from (number of values already issued).
+            rng: Optional random.Random used for a missing prefix or key.
+        """
+        if kind not in ALLOCATOR_KINDS:
+            raise ValueError(f"kind must be one of {', '.join(ALLOCATOR_KINDS)}")
+        if mode not in ALLOCATOR_MODES:
+            raise ValueError(f"mode must be one of {', '.join(ALLOCATOR_MODES)}")
+        r = rng or random
+        self.kind = kind
+        self.mode = mode
+        self.prefix = self._check_prefix(kind, prefix, r)
+        if kind == "vin":
+            self.size = _VIS_SIZE
+            self._width = 0
+        else:
+            self._width = _NUMERIC_BODY[kind] - len(self.prefix)
+            self.size = 10 ** self._width
+        if mode == "permuted":
+            self.key = r.getrandbits(64) if key is None else key & _MASK64
+            self._permutation: Optional[FeistelPermutation] = FeistelPermutation(self.size, self.key)
+        else:
+            self.key = None
+            self._permutation = None
+        if not 0 <= start <= self.size:
+            raise ValueError(f"start must be between 0 and {self.size}")
+        self.position = start
+
+    @staticmethod
+    def _check_prefix(kind: str, prefix: Optional[str], rng) -> str:
+        if kind == "imei":
+            if prefix is None:
+                return f"{rng.randrange(10 ** 8):08d}"
+            tac = ''.join(filter(str.isdigit, prefix))
+            if len(tac) != 8:
+                raise ValueError("tac must be 8 digits")
+            return tac
+        if kind == "vin":
+            if prefix is None:
+                runs = [''.join(rng.choices(alphabet, k=k)) for alphabet, k in VIN_RUNS[:3]]
+                return ''.join(runs)
+            prefix = prefix.upper()
+            if len(prefix) != 8 or any(c not in VIN_CHARS for c in prefix):
+                raise ValueError("VIN prefix must be 8 characters from A-Z/0-9 without I, O, Q")
+            return prefix
+        prefix = _DEFAULT_PREFIX[kind] if prefix is None else prefix
+        if prefix and not (prefix.isdigit() and prefix.isascii()):
+            raise ValueError("prefix must contain only digits")
+        if len(prefix) >= _NUMERIC_BODY[kind]:
+            raise ValueError(f"prefix must be shorter than {_NUMERIC_BODY[kind]} digits to leave a serial")
+        return prefix
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def remaining(self) -> int:
+        return self.size - self.position
+
+    def serial(self, position: int) -> int:
+        """Serial number issued at ``position`` (the identity in 'sequential' mode)."""
+        if self._permutation is not None:
+            return self._permutation(position)
+        if not 0 <= position < self.size:
+            raise ValueError(f"position must be in range(0, {self.size})")
+        return position
+
+    def format(self, serial: int) -> str:
+        """Render serial number ``serial`` as a full identifier with its check digit."""
+        if self.kind == "vin":
+            head, tail = divmod(serial, 10 ** 6)
+            first, second = divmod(head, len(VIN_CHARS))
+            body = f"{self.prefix}{VIN_CHARS[first]}{VIN_CHARS[second]}{tail:06d}"
+            return f"{body[:8]}{vin_check_digit(body)}{body[8:]}"
+        body = f"{self.prefix}{serial:0{self._width}d}"
+        check = luhn_check_digit(body) if self.kind == "imei" else gs1_check_digit(body)
+        return f"{body}{check}"
+
+    def allocate(self) -> str:
+        """Issue the next identifier; raises ValueError once the serial space is used up."""
+        if self.position >= self.size:
+            raise ValueError(f"{self.kind} allocator exhausted after {self.size} values")
+        value = self.format(self.serial(self.position))
+        self.position += 1
+        return value
+
+    def take(self, n: int) -> List[str]:
+        """Issue the next ``n`` identifiers."""
+        if n > self.remaining:
+            raise ValueError(f"only {self.remaining} {self.kind} values left, {n} requested")
+        fmt, serial = self.format, self.serial
+        start = self.position
+        values = [fmt(serial(i)) for i in range(start, start + max(n, 0))]
+        self.position += len(values)
+        return values
+
+    def __iter__(self) -> Iterator[str]:
+        while self.position < self.size:
+            yield self.allocate()
+
+    def state(self) -> Dict[str, Any]:
+        """Everything needed to resume: kind, prefix, mode, key and position."""
+        return {
+            "kind": self.kind,
+            "prefix": self.prefix,
+            "mode": self.mode,
+            "key": self.key,
+            "position": self.position,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "IdentifierAllocator":
+        """Rebuild an allocator saved with ``state()``; it continues at the saved position."""
+        return cls(state["kind"], prefix=state["prefix"], mode=state["mode"], key=state.get("key"),
+                   start=state.get("position", 0))
+
+
+def allocator(kind: str, prefix: Optional[str] = None, mode: str = "sequential", key: Optional[int] = None,
+              start: int = 0, rng: Optional[random.Random] = None) -> IdentifierAllocator:
+    """Create an IdentifierAllocator; see IdentifierAllocator for the arguments."""
+    return IdentifierAllocator(kind, prefix=prefix, mode=mode, key=key, start=start, rng=rng)
+
+
+__all__ = ["IdentifierAllocator", "FeistelPermutation", "allocator", "ALLOCATOR_KINDS", "ALLOCATOR_MODES"]
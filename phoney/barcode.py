@@ -1,53 +1,71 @@
 from __future__ import annotations
 
 import random
-from typing import Tuple
-
-
-def _luhn(digits: str) -> int:
-    s = 0
-    alt = False
-    for ch in digits[::-1]:
-        d = int(ch)
-        if alt:
-            d *= 2
-            if d > 9:
-                d -= 9
-        s += d
-        alt = not alt
-    return (10 - (s % 10)) % 10
-
-
-def _ean13_checksum(digits12: str) -> int:
-    s = 0
-    for i, ch in enumerate(digits12):
-        d = int(ch)
-        s += d if i % 2 == 0 else 3 * d
-    return (10 - (s % 10)) % 10
-
-
-def generate_ean13(prefix: str = "") -> str:
-    body = (prefix + "".join(str(random.randint(0, 9)) for _ in range(max(0, 12 - len(prefix)))))[:12]
-    cd = _ean13_checksum(body)
+from typing import Optional
+
+from .checksum import gs1_check_digit, _numeric_codes
+
+
+def _check_prefix(prefix: str) -> None:
+    # Same rule as the batch variants; the GS1 tables would otherwise read non-digits as 0
+    if prefix and not (prefix.isdigit() and prefix.isascii()):
+        raise ValueError("prefix must contain only digits")
+
+
+def generate_ean13(prefix: str = "", rng: Optional[random.Random] = None) -> str:
+    _check_prefix(prefix)
+    rng = rng or random
+    body = (prefix + "".join(str(rng.randint(0, 9)) for _ in range(max(0, 12 - len(prefix)))))[:12]
+    cd = gs1_check_digit(body)
     return body + str(cd)
 
 
-def generate_upca(prefix: str = "") -> str:
+def generate_upca(prefix: str = "", rng: Optional[random.Random] = None) -> str:
+    _check_prefix(prefix)
+    rng = rng or random
     # UPC-A is 12 digits; EAN-13 with leading 0
-    upc11 = (prefix + "".join(str(random.randint(0, 9)) for _ in range(max(0, 11 - len(prefix)))))[:11]
-    # EAN-13 checksum on 0 + upc11
-    cd = _ean13_checksum("0" + upc11)
+    upc11 = (prefix + "".join(str(rng.randint(0, 9)) for _ in range(max(0, 11 - len(prefix)))))[:11]
+    # Same GS1 check digit as the EAN-13 "0" + upc11
+    cd = gs1_check_digit(upc11)
     return upc11 + str(cd)
 
 
-def generate_isbn13(group_prefix: str = "978") -> str:
-    body = (group_prefix + "".join(str(random.randint(0, 9)) for _ in range(max(0, 12 - len(group_prefix)))))[:12]
-    cd = _ean13_checksum(body)
+def generate_isbn13(group_prefix: str = "978", rng: Optional[random.Random] = None) -> str:
+    _check_prefix(group_prefix)
+    rng = rng or random
+    body = (group_prefix + "".join(str(rng.randint(0, 9)) for _ in range(max(0, 12 - len(group_prefix)))))[:12]
+    cd = gs1_check_digit(body)
     return body + str(cd)
 
 
+def generate_ean13s(n: int, prefix: str = "", rng: Optional[random.Random] = None,
+                    backend: Optional[str] = None, as_: str = "str"):
+    """
+    ``n`` EAN-13 codes at once; ``prefix`` is shared by every row and cut to 12 digits like ``generate_ean13``.
+
+    ``backend`` is 'numpy', 'python' or None (NumPy when available); ``as_`` is
+    'str' for a list or 'numpy' for an ``S13`` array.
+    """
+    return _numeric_codes(n, prefix, 13, "gs1", rng, backend, as_)
+
+
+def generate_upcas(n: int, prefix: str = "", rng: Optional[random.Random] = None,
+                   backend: Optional[str] = None, as_: str = "str"):
+    """``n`` UPC-A codes at once; see ``generate_ean13s``."""
+    return _numeric_codes(n, prefix, 12, "gs1", rng, backend, as_)
+
+
+def generate_isbn13s(n: int, group_prefix: str = "978", rng: Optional[random.Random] = None,
+                     backend: Optional[str] = None, as_: str = "str"):
+    """``n`` ISBN-13 codes at once; see ``generate_ean13s``."""
+    return _numeric_codes(n, group_prefix, 13, "gs1", rng, backend, as_)
+
+
 __all__ = [
     "generate_ean13",
     "generate_upca",
     "generate_isbn13",
+    "generate_ean13s",
+    "generate_upcas",
+    "generate_isbn13s",
 ]
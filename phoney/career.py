@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import json
 import random
+import threading
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 DATA_DIR = Path(__file__).parent / "data" / "career"
 
@@ -280,54 +282,180 @@ DEFAULT_COMPANIES: Dict[str, List[str]] = {
 }
 
 
-def _job_families() -> Dict[str, List[str]]:
-    data = _load_json(DATA_DIR / "job_families.json")
-    return data if isinstance(data, dict) and data else DEFAULT_JOB_FAMILIES
-
-
-def _skills_map() -> Dict[str, List[str]]:
-    data = _load_json(DATA_DIR / "skills.json")
-    return data if isinstance(data, dict) and data else DEFAULT_SKILLS
-
-
-def _salary_ranges(locale: str) -> Dict[str, Dict[str, Tuple[int, int, str]]]:
-    data = _load_json(DATA_DIR / f"salary_ranges.{locale}.json")
-    if isinstance(data, dict) and data:
-        normalized: Dict[str, Dict[str, Tuple[int, int, str]]] = {}
-        for fam, levels in data.items():
-            normalized[fam] = {}
-            for lvl, payload in levels.items():
-                if isinstance(payload, dict):
-                    lo, hi = int(payload["min"]), int(payload["max"])
-                    cur = payload.get("currency", "USD")
-                else:
-                    lo, hi, cur = payload
-                normalized[fam][lvl] = (lo, hi, cur)
-        return normalized
-    return DEFAULT_SALARY_RANGES.get(locale, DEFAULT_SALARY_RANGES.get("en_US", {}))
-
-
-def _companies_for_locale(locale: str) -> List[str]:
-    lines = _load_lines(DATA_DIR / f"companies.{locale}.txt")
-    if lines:
-        return lines
-    return DEFAULT_COMPANIES.get(locale, DEFAULT_COMPANIES.get("en_US", ["Acme Corp"]))
-
-
-def _pick_family(family: Optional[str]) -> str:
-    families = _job_families()
-    return family if family in families else random.choice(list(families.keys()))
-
-
-def _pick_level(level: Optional[str]) -> str:
+def _freeze_salary_ranges(data: Dict[str, Dict[str, object]]) -> Mapping[str, Mapping[str, Tuple[int, int, str]]]:
+    normalized: Dict[str, Mapping[str, Tuple[int, int, str]]] = {}
+    for fam, levels in data.items():
+        bands: Dict[str, Tuple[int, int, str]] = {}
+        for lvl, payload in levels.items():
+            if isinstance(payload, dict):
+                lo, hi = int(payload["min"]), int(payload["max"])
+                cur = payload.get("currency", "USD")
+            else:
+                lo, hi, cur = payload
+            bands[lvl] = (lo, hi, cur)
+        normalized[fam] = MappingProxyType(bands)
+    return MappingProxyType(normalized)
+
+
+class CareerRegistry:
+    """
+    Process-wide cache of the career datasets.
+
+    Job families, skills, salary bands and company names are read from
+    ``data/career`` (or the built-in defaults) the first time they are
+    requested and kept as read-only mappings of tuples afterwards, so job
+    titles, salaries and employment histories do no file I/O once warm.
+
+    Usage:
+        from phoney.career import career_registry
+        career_registry.job_families()['designer']    # tuple of titles
+        career_registry.salary_ranges('en_GB')        # family -> level -> (min, max, currency)
+        career_registry.invalidate('en_GB')           # drop one locale
+        career_registry.reload()                      # drop everything and re-read
+    """
+
+    def __init__(self, data_dir: Path = DATA_DIR):
+        self.data_dir = data_dir
+        self._lock = threading.RLock()
+        self._job_families: Optional[Mapping[str, Tuple[str, ...]]] = None
+        self._family_names: Tuple[str, ...] = ()
+        self._skills: Optional[Mapping[str, Tuple[str, ...]]] = None
+        self._salary_ranges: Dict[str, Mapping[str, Mapping[str, Tuple[int, int, str]]]] = {}
+        self._companies: Dict[str, Tuple[str, ...]] = {}
+
+    def job_families(self) -> Mapping[str, Tuple[str, ...]]:
+        """Return the family -> tuple of base titles mapping from job_families.json."""
+        families = self._job_families
+        if families is None:
+            with self._lock:
+                if self._job_families is None:
+                    data = _load_json(self.data_dir / "job_families.json")
+                    if not (isinstance(data, dict) and data):
+                        data = DEFAULT_JOB_FAMILIES
+                    frozen = MappingProxyType({k: tuple(v) for k, v in data.items()})
+                    self._family_names = tuple(frozen)
+                    self._job_families = frozen
+                families = self._job_families
+        return families
+
+    def family_names(self) -> Tuple[str, ...]:
+        """Return the job family keys, in file order."""
+        self.job_families()
+        return self._family_names
+
+    def skills(self) -> Mapping[str, Tuple[str, ...]]:
+        """Return the family -> tuple of skills mapping from skills.json."""
+        skills = self._skills
+        if skills is None:
+            with self._lock:
+                if self._skills is None:
+                    data = _load_json(self.data_dir / "skills.json")
+                    if not (isinstance(data, dict) and data):
+                        data = DEFAULT_SKILLS
+                    self._skills = MappingProxyType({k: tuple(v) for k, v in data.items()})
+                skills = self._skills
+        return skills
+
+    def salary_ranges(self, locale: str) -> Mapping[str, Mapping[str, Tuple[int, int, str]]]:
+        """
+        Return the salary bands of a locale.
+
+        Returns:
+            Mapping: family -> level -> (min, max, currency), from
+            salary_ranges.<locale>.json, else DEFAULT_SALARY_RANGES (en_US
+            for locales without defaults).
+        """
+        ranges = self._salary_ranges.get(locale)
+        if ranges is not None:
+            return ranges
+        with self._lock:
+            ranges = self._salary_ranges.get(locale)
+            if ranges is None:
+                data = _load_json(self.data_dir / f"salary_ranges.{locale}.json")
+                if not (isinstance(data, dict) and data):
+                    data = DEFAULT_SALARY_RANGES.get(locale, DEFAULT_SALARY_RANGES.get("en_US", {}))
+                ranges = self._salary_ranges[locale] = _freeze_salary_ranges(data)
+        return ranges
+
+    def companies(self, locale: str) -> Tuple[str, ...]:
+        """Return the company names of a locale from companies.<locale>.txt (or the defaults)."""
+        companies = self._companies.get(locale)
+        if companies is not None:
+            return companies
+        with self._lock:
+            companies = self._companies.get(locale)
+            if companies is None:
+                lines = _load_lines(self.data_dir / f"companies.{locale}.txt")
+                if not lines:
+                    lines = DEFAULT_COMPANIES.get(locale, DEFAULT_COMPANIES.get("en_US", ["Acme Corp"]))
+                companies = self._companies[locale] = tuple(lines)
+        return companies
+
+    def invalidate(self, locale: Optional[str] = None) -> None:
+        """
+        Drop cached data so the next access reads from disk again.
+
+        Args:
+            locale: Only forget this locale's salary bands and companies. If
+                None, every cached dataset is dropped.
+        """
+        with self._lock:
+            if locale is not None:
+                self._salary_ranges.pop(locale, None)
+                self._companies.pop(locale, None)
+                return
+            self._job_families = None
+            self._family_names = ()
+            self._skills = None
+            self._salary_ranges = {}
+            self._companies = {}
+
+    def reload(self) -> None:
+        """Invalidate everything and eagerly re-read the datasets of every locale seen so far."""
+        with self._lock:
+            locales = set(self._salary_ranges) | set(self._companies)
+            self.invalidate()
+            self.job_families()
+            self.skills()
+            for locale in sorted(locales):
+                self.salary_ranges(locale)
+                self.companies(locale)
+
+
+career_registry = CareerRegistry()
+
+
+def _job_families() -> Mapping[str, Tuple[str, ...]]:
+    return career_registry.job_families()
+
+
+def _skills_map() -> Mapping[str, Tuple[str, ...]]:
+    return career_registry.skills()
+
+
+def _salary_ranges(locale: str) -> Mapping[str, Mapping[str, Tuple[int, int, str]]]:
+    return career_registry.salary_ranges(locale)
+
+
+def _companies_for_locale(locale: str) -> Tuple[str, ...]:
+    return career_registry.companies(locale)
+
+
+def _pick_family(family: Optional[str], rng=random) -> str:
+    if family is not None and family in _job_families():
+        return family
+    return rng.choice(career_registry.family_names())
+
+
+def _pick_level(level: Optional[str], rng=random) -> str:
     if level in LEVELS_ORDERED:
         return level
-    return random.choice(["Junior", "Mid", "Senior", "Lead"])
+    return rng.choice(["Junior", "Mid", "Senior", "Lead"])
 
 
-def _title_from_family_and_level(family: str, level: str) -> str:
+def _title_from_family_and_level(family: str, level: str, rng=random) -> str:
     families = _job_families()
-    base = random.choice(families[family])
+    base = rng.choice(families[family])
     if level in {"Manager", "Director", "VP", "C-level"}:
         core = base.replace(" Engineer", "").replace(" Designer", "").replace(" Scientist", "")
         if level == "Manager":
@@ -353,10 +481,16 @@ def _title_from_family_and_level(family: str, level: str) -> str:
     return f"{level} {base}"
 
 
-def generate_job_title(locale: str = "en_US", family: Optional[str] = None, level: Optional[str] = None) -> Dict[str, str]:
-    fam = _pick_family(family)
-    lvl = _pick_level(level)
-    title = _title_from_family_and_level(fam, lvl)
+def generate_job_title(
+    locale: str = "en_US",
+    family: Optional[str] = None,
+    level: Optional[str] = None,
+    rng: Optional[random.Random] = None,
+) -> Dict[str, str]:
+    rng = rng or random
+    fam = _pick_family(family, rng)
+    lvl = _pick_level(level, rng)
+    title = _title_from_family_and_level(fam, lvl, rng)
     return {"title": title, "family": fam, "level": lvl, "locale": locale}
 
 
@@ -373,13 +507,20 @@ def _salary_for(locale: str, family: str, level: str) -> Optional[Tuple[int, int
     return None
 
 
-def generate_salary(locale: str = "en_US", family: Optional[str] = None, level: Optional[str] = None, title: Optional[str] = None) -> Dict[str, object]:
-    fam = _pick_family(family)
-    lvl = _pick_level(level)
-    rng = _salary_for(locale, fam, lvl)
-    if not rng:
-        rng = (50000, 100000, "USD")
-    lo, hi, currency = rng
+def generate_salary(
+    locale: str = "en_US",
+    family: Optional[str] = None,
+    level: Optional[str] = None,
+    title: Optional[str] = None,
+    rng: Optional[random.Random] = None,
+) -> Dict[str, object]:
+    rng = rng or random
+    fam = _pick_family(family, rng)
+    lvl = _pick_level(level, rng)
+    band = _salary_for(locale, fam, lvl)
+    if not band:
+        band = (50000, 100000, "USD")
+    lo, hi, currency = band
     return {
         "family": fam,
         "level": lvl,
@@ -392,9 +533,9 @@ def generate_salary(locale: str = "en_US", family: Optional[str] = None, level:
     }
 
 
-def _random_date_between(start: date, end: date) -> date:
+def _random_date_between(start: date, end: date, rng=random) -> date:
     days = (end - start).days
-    return start if days <= 0 else start + timedelta(days=random.randint(0, days))
+    return start if days <= 0 else start + timedelta(days=rng.randint(0, days))
 
 
 def generate_employment_history(
@@ -403,24 +544,26 @@ def generate_employment_history(
     family: Optional[str] = None,
     min_jobs: int = 1,
     max_jobs: int = 5,
+    rng: Optional[random.Random] = None,
 ) -> List[Dict[str, object]]:
-    fam = _pick_family(family)
+    rng = rng or random
+    fam = _pick_family(family, rng)
     today = date.today()
     window_start = today - timedelta(days=int(years * 365.25))
-    num_jobs = max(min_jobs, min(max_jobs, random.randint(min_jobs, max_jobs)))
+    num_jobs = max(min_jobs, min(max_jobs, rng.randint(min_jobs, max_jobs)))
 
     companies = _companies_for_locale(locale)
     entries: List[Dict[str, object]] = []
     current_end = today
     for _ in range(num_jobs):
-        duration_days = random.randint(365, 365 * 4)
+        duration_days = rng.randint(365, 365 * 4)
         start_dt = max(window_start, current_end - timedelta(days=duration_days))
         if start_dt >= current_end:
             break
-        job = generate_job_title(locale=locale, family=fam)
-        sal = generate_salary(locale=locale, family=fam, level=job["level"], title=job["title"])
+        job = generate_job_title(locale=locale, family=fam, rng=rng)
+        sal = generate_salary(locale=locale, family=fam, level=job["level"], title=job["title"], rng=rng)
         entries.append({
-            "company": random.choice(companies),
+            "company": rng.choice(companies),
             "title": job["title"],
             "family": fam,
             "level": job["level"],
@@ -429,7 +572,7 @@ def generate_employment_history(
             "salary": sal,
             "locale": locale,
         })
-        current_end = start_dt - timedelta(days=random.randint(14, 120))
+        current_end = start_dt - timedelta(days=rng.randint(14, 120))
         if current_end <= window_start:
             break
 
@@ -437,12 +580,20 @@ def generate_employment_history(
     return entries
 
 
-def generate_skills(family: str, level: Optional[str] = None, count: Optional[int] = None) -> List[str]:
+def generate_skills(
+    family: str,
+    level: Optional[str] = None,
+    count: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+) -> List[str]:
+    rng = rng or random
     skills_map = _skills_map()
-    skills = skills_map.get(family, [])
+    skills = skills_map.get(family)
     if not skills:
         return []
-    random.shuffle(skills)
+    # Shuffle a copy: the cached tuple is shared by every caller
+    skills = list(skills)
+    rng.shuffle(skills)
     lvl = level if level in LEVELS_ORDERED else None
     base_n = 8
     if lvl in {"Senior", "Lead", "Staff", "Principal"}:
@@ -470,6 +621,8 @@ def experience_level_from_years(years: float) -> str:
 
 
 __all__ = [
+    "CareerRegistry",
+    "career_registry",
     "generate_job_title",
     "generate_salary",
     "generate_employment_history",
@@ -0,0 +1,281 @@
+"""
+Check-digit kernels shared by the identifier and payment generators.
+
+Every algorithm is table-driven: a body (``str``, ``bytes`` or a
+non-negative ``int`` for the numeric schemes) is turned into ASCII bytes and
+mapped through 256-entry lookup tables with ``bytes.translate``, so there is
+no per-character ``int()`` call. Batch variants take a sequence of bodies, or
+with NumPy installed an ``(n, length)`` array of digit values, and return all
+check digits at once.
+"""
+from __future__ import annotations
+
+import random
+import string
+from operator import mul
+from typing import Iterable, List, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:  # optional: batch kernels fall back to per-body loops
+    np = None
+
+Body = Union[str, bytes, int]
+
+
+def _table(fn) -> bytes:
+    return bytes(fn(c - 48) if 48 <= c <= 57 else 0 for c in range(256))
+
+
+# Digit value, doubled-and-folded value (Luhn) and tripled value mod 10 (GS1), by code point
+_PLAIN = _table(lambda d: d)
+_LUHN_DOUBLED = _table(lambda d: 2 * d - 9 if d > 4 else 2 * d)
+_TRIPLED = _table(lambda d: 3 * d % 10)
+
+# VIN transliteration (ISO 3779); I, O and Q are not allowed and map to 0
+VIN_TRANSLITERATION = {c: v for c, v in zip("ABCDEFGHJKLMNPRSTUVWXYZ", [1,2,3,4,5,6,7,8,1,2,3,4,5,7,9,2,3,4,5,6,7,8,9])}
+VIN_TRANSLITERATION.update({str(i): i for i in range(10)})
+VIN_WEIGHTS = (8, 7, 6, 5, 4, 3, 2, 10, 0, 9, 8, 7, 6, 5, 4, 3, 2)
+_VIN_VALUES = bytes(VIN_TRANSLITERATION.get(chr(c), 0) for c in range(256))
+_VIN_ALLOWED = frozenset(VIN_TRANSLITERATION)
+
+# Letters map to 10..35 for the ISO 7064 mod-97 check
+_IBAN_NUMERIC = str.maketrans({c: str(i) for i, c in enumerate(string.ascii_uppercase, 10)})
+
+
+def _raw(body: Body) -> bytes:
+    if isinstance(body, bytes):
+        return body
+    if isinstance(body, int):
+        return str(body).encode('ascii')
+    return body.encode('ascii')
+
+
+def _is_digits(value: str, length: int) -> bool:
+    return isinstance(value, str) and len(value) == length and value.isdigit() and value.isascii()
+
+
+# Luhn (ISO/IEC 7812): IMEI, payment cards
+
+def luhn_sum(body: Body, double_rightmost: bool = True) -> int:
+    """Luhn sum of ``body`` read right to left; the rightmost digit is doubled if ``double_rightmost``."""
+    rev = _raw(body)[::-1]
+    first, second = (_LUHN_DOUBLED, _PLAIN) if double_rightmost else (_PLAIN, _LUHN_DOUBLED)
+    return sum(rev[0::2].translate(first)) + sum(rev[1::2].translate(second))
+
+
+def luhn_check_digit(body: Body) -> int:
+    """Digit that makes ``body`` + digit pass the Luhn check."""
+    return -luhn_sum(body) % 10
+
+
+def is_valid_luhn(number: Body) -> bool:
+    return luhn_sum(number, double_rightmost=False) % 10 == 0
+
+
+def is_valid_imei(imei: str) -> bool:
+    """15 digits with a valid Luhn check digit."""
+    return _is_digits(imei, 15) and is_valid_luhn(imei)
+
+
+def is_valid_card_number(number: str) -> bool:
+    """12-19 digits (spaces allowed) with a valid Luhn check digit."""
+    digits = number.replace(' ', '') if isinstance(number, str) else number
+    return isinstance(digits, str) and 12 <= len(digits) <= 19 and digits.isdigit() and digits.isascii() \
+        and is_valid_luhn(digits)
+
+
+# GS1 mod 10: EAN-13, UPC-A, ISBN-13
+
+def gs1_sum(body: Body, triple_rightmost: bool = True) -> int:
+    """GS1 weighted sum mod 10 per digit; weights 3, 1, 3, ... from the right if ``triple_rightmost``."""
+    rev = _raw(body)[::-1]
+    first, second = (_TRIPLED, _PLAIN) if triple_rightmost else (_PLAIN, _TRIPLED)
+    return sum(rev[0::2].translate(first)) + sum(rev[1::2].translate(second))
+
+
+def gs1_check_digit(body: Body) -> int:
+    """GS1 check digit: weights 3, 1, 3, ... from the rightmost body digit."""
+    return -gs1_sum(body) % 10
+
+
+def is_valid_gs1(code: Body) -> bool:
+    raw = _raw(code)
+    return len(raw) > 1 and gs1_check_digit(raw[:-1]) == raw[-1] - 48
+
+
+def is_valid_ean13(code: str) -> bool:
+    return _is_digits(code, 13) and is_valid_gs1(code)
+
+
+def is_valid_upca(code: str) -> bool:
+    return _is_digits(code, 12) and is_valid_gs1(code)
+
+
+def is_valid_isbn13(code: str) -> bool:
+    """ISBN-13: an EAN-13 in the 978/979 Bookland prefix (hyphens allowed)."""
+    digits = code.replace('-', '') if isinstance(code, str) else code
+    return is_valid_ean13(digits) and digits.startswith(('978', '979'))
+
+
+# VIN (ISO 3779 / 49 CFR 565)
+
+def vin_check_digit(vin: Body) -> str:
+    """
+    Check character for a VIN: '0'-'9' or 'X'.
+
+    Accepts a full 17-character VIN (position 9 is ignored, its weight is 0)
+    or the 16 characters without the check position.
+    """
+    raw = _raw(vin)
+    if len(raw) == 16:
+        raw = raw[:8] + b'0' + raw[8:]
+    remainder = sum(map(mul, raw.translate(_VIN_VALUES), VIN_WEIGHTS)) % 11
+    return 'X' if remainder == 10 else str(remainder)
+
+
+def is_valid_vin(vin: str) -> bool:
+    return (isinstance(vin, str) and len(vin) == 17 and all(c in _VIN_ALLOWED for c in vin)
+            and vin_check_digit(vin) == vin[8])
+
+
+# IBAN (ISO 13616 / ISO 7064 mod 97-10)
+
+def iban_check_digits(country: str, bban: str) -> str:
+    """ISO 13616 check digits: 98 - (BBAN + country + '00' as a number) mod 97."""
+    numeric = f"{bban}{country}00".translate(_IBAN_NUMERIC)
+    return f"{98 - int(numeric) % 97:02d}"
+
+
+def is_valid_iban(iban: str) -> bool:
+    compact = iban.replace(' ', '').upper() if isinstance(iban, str) else ''
+    if len(compact) < 5 or not compact.isalnum() or not compact.isascii():
+        return False
+    return int((compact[4:] + compact[:4]).translate(_IBAN_NUMERIC)) % 97 == 1
+
+
+# Batch entry points
+
+def _digit_matrix(bodies):
+    return np is not None and isinstance(bodies, np.ndarray) and bodies.ndim == 2
+
+
+def luhn_check_digits(bodies: Union[Iterable[Body], "np.ndarray"]) -> Union[List[int], "np.ndarray"]:
+    """
+    Luhn check digits for many bodies.
+
+    Args:
+        bodies: Iterable of str/bytes/int bodies, or an ``(n, length)`` NumPy
+            array of digit values 0-9 (all bodies the same length).
+    Returns:
+        list of ints, or a uint8 array for array input.
+    """
+    if _digit_matrix(bodies):
+        m = bodies.astype(np.int64)[:, ::-1]
+        doubled = m[:, 0::2] * 2
+        total = (doubled - 9 * (doubled > 9)).sum(axis=1) + m[:, 1::2].sum(axis=1)
+        return ((-total) % 10).astype(np.uint8)
+    return [luhn_check_digit(body) for body in bodies]
+
+
+def gs1_check_digits(bodies: Union[Iterable[Body], "np.ndarray"]) -> Union[List[int], "np.ndarray"]:
+    """GS1 (EAN/UPC/ISBN) check digits for many bodies; same input forms as ``luhn_check_digits``."""
+    if _digit_matrix(bodies):
+        m = bodies.astype(np.int64)[:, ::-1]
+        total = 3 * m[:, 0::2].sum(axis=1) + m[:, 1::2].sum(axis=1)
+        return ((-total) % 10).astype(np.uint8)
+    return [gs1_check_digit(body) for body in bodies]
+
+
+def vin_check_digits(vins: Union[Iterable[Body], "np.ndarray"]) -> Union[List[str], "np.ndarray"]:
+    """
+    VIN check characters for many VINs.
+
+    Args:
+        vins: Iterable of 16/17-character VINs, or an ``(n, 17)`` NumPy array
+            of transliterated values (position 9 is ignored).
+    Returns:
+        list of '0'-'9'/'X', or an array of remainders 0-10 (10 means 'X') for array input.
+    """
+    if _digit_matrix(vins):
+        return (vins.astype(np.int64) @ np.asarray(VIN_WEIGHTS, dtype=np.int64)) % 11
+    return [vin_check_digit(vin) for vin in vins]
+
+
+# Bulk code generation shared by the identifier batch APIs
+
+CODE_BATCH_FORMATS = ("str", "numpy")
+
+# Random digits drawn per randrange call in the pure-Python path
+_PY_CHUNK_DIGITS = 256
+
+_SUMS = {'luhn': luhn_sum, 'gs1': gs1_sum}
+_BATCH_KERNELS = {'luhn': luhn_check_digits, 'gs1': gs1_check_digits}
+
+
+def _check_code_batch_args(as_: str, backend: Optional[str]) -> bool:
+    if as_ not in CODE_BATCH_FORMATS:
+        raise ValueError(f"as_ must be one of {', '.join(CODE_BATCH_FORMATS)}")
+    if backend not in (None, "numpy", "python"):
+        raise ValueError("backend must be 'numpy', 'python' or None")
+    if np is None and (backend == "numpy" or as_ == "numpy"):
+        raise ValueError("NumPy is required for backend='numpy' and as_='numpy'")
+    return np is not None and backend != "python"
+
+
+def _random_digit_strings(n: int, k: int, rng) -> List[str]:
+    # Several rows per randrange call: one big uniform integer, cut into k-digit slices
+    if k == 0:
+        return [''] * n
+    per_draw = max(1, _PY_CHUNK_DIGITS // k)
+    width = per_draw * k
+    bound = 10 ** width
+    randrange = rng.randrange
+    out: List[str] = []
+    extend = out.extend
+    for _ in range(0, n, per_draw):
+        block = f"{randrange(bound):0{width}d}"
+        extend(block[i:i + k] for i in range(0, width, k))
+    del out[n:]
+    return out
+
+
+def _numeric_codes(n: int, prefix: str, length: int, scheme: str, rng, backend: Optional[str], as_: str):
+    """
+    ``n`` codes of ``length`` digits: ``prefix``, uniform random digits and a
+    ``scheme`` ('luhn' or 'gs1') check digit, as a list of str or an ``S{length}`` array.
+    """
+    use_numpy = _check_code_batch_args(as_, backend)
+    if prefix and not (prefix.isdigit() and prefix.isascii()):
+        raise ValueError("prefix must contain only digits")
+    prefix = prefix[:length - 1]
+    k = length - 1 - len(prefix)
+    n = max(n, 0)
+    r = rng or random
+
+    if use_numpy:
+        gen = np.random.default_rng(r.getrandbits(64) if rng is not None else None)
+        digits = np.empty((n, length), dtype=np.uint8)
+        digits[:, :len(prefix)] = np.frombuffer(prefix.encode('ascii'), dtype=np.uint8) - 48
+        digits[:, len(prefix):-1] = gen.integers(0, 10, size=(n, k), dtype=np.uint8)
+        digits[:, -1] = _BATCH_KERNELS[scheme](digits[:, :-1])
+        digits += 48
+        codes = digits.view(f'S{length}').ravel()
+        return codes if as_ == 'numpy' else codes.astype(str).tolist()
+
+    # The prefix's weights are fixed by the number of random digits after it
+    body_sum = _SUMS[scheme]
+    prefix_sum = body_sum(prefix, k % 2 == 0)
+    codes = [f"{prefix}{body}{-(prefix_sum + body_sum(body)) % 10}" for body in _random_digit_strings(n, k, r)]
+    if as_ == 'numpy':
+        return np.array(codes, dtype=f'S{length}')
+    return codes
+
+
+__all__ = [
+    'luhn_sum', 'luhn_check_digit', 'is_valid_luhn', 'is_valid_imei', 'is_valid_card_number',
+    'gs1_sum', 'gs1_check_digit', 'is_valid_gs1', 'is_valid_ean13', 'is_valid_upca', 'is_valid_isbn13',
+    'vin_check_digit', 'is_valid_vin', 'iban_check_digits', 'is_valid_iban',
+    'luhn_check_digits', 'gs1_check_digits', 'vin_check_digits',
+    'VIN_TRANSLITERATION', 'VIN_WEIGHTS', 'CODE_BATCH_FORMATS',
+]
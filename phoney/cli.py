@@ -0,0 +1,196 @@
+"""
+Command line interface: ``python -m phoney``.
+
+Usage:
+  python -m phoney gen profile --count 10000000 --locale de_DE --format jsonl --workers 8 --seed 42 > out.jsonl
+  python -m phoney gen imei --count 1000000 --format csv -o imeis.csv.gz
+  python -m phoney gen resume --count 1000 --set family=software_engineer -o resumes.jsonl
+  python -m phoney gen resume --count 100000 --format markdown -o resumes.md.gz
+  python -m phoney kinds
+
+Only argparse is imported up front; the generators are imported once a
+command actually runs, so ``--help`` and argument errors return at once.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+FORMATS = ("jsonl", "csv", "parquet", "text", "markdown")
+
+# Rendered document formats, available for the resume kind only (phoney.resume.write_resumes)
+RESUME_TEXT_FORMATS = ("text", "markdown")
+
+# Writer arguments the gen command fills from its own options; --set may not pass them again
+_GEN_OPTIONS = ("format", "locale", "chunk_size", "compression", "workers", "seed", "rng", "progress")
+
+
+def _parse_value(text: str) -> Any:
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return {"true": True, "false": False, "none": None}.get(text.lower(), text)
+
+
+def _parse_settings(items: List[str]) -> Dict[str, Any]:
+    settings = {}
+    for item in items:
+        key, sep, value = item.partition("=")
+        if not sep or not key:
+            raise argparse.ArgumentTypeError(f"--set expects key=value, got '{item}'")
+        settings[key.replace("-", "_")] = _parse_value(value)
+    return settings
+
+
+def _check_settings(kind: str, settings: Dict[str, Any], locale: Optional[str], rendered: bool) -> None:
+    # Bind the full generator call before any output is opened, so a typo in a --set key or a missing
+    # required argument (generate_skills' family) is a usage error and not a traceback from the first
+    # shard. Exported kinds accept the arguments of their row generator or of their batch entry point
+    # (e.g. backend=); rendered resumes those of write_resumes.
+    import inspect
+
+    from .dataset import BATCH_KINDS, DATASET_KINDS, _resolve_kind
+
+    taken = [key for key in settings if key in _GEN_OPTIONS]
+    if taken:
+        raise ValueError(f"--set {taken[0]}: use the gen option instead")
+    name = _resolve_kind(kind)
+    if rendered:
+        if name != "resume":
+            return  # _write_rendered reports the format/kind mismatch
+        from .resume import write_resumes
+        targets = [(write_resumes, (0, None))]
+    else:
+        targets = [(DATASET_KINDS[name], ())] + ([(BATCH_KINDS[name], (0,))] if name in BATCH_KINDS else [])
+    call = dict(settings)
+    if locale is not None:
+        call["locale"] = locale
+    error = None
+    for fn, args in targets:
+        try:
+            inspect.signature(fn).bind(*args, rng=None, **call)
+            return
+        except TypeError as exc:
+            error = error or exc
+    raise ValueError(f"'{name}' generator: {error}")
+
+
+class _Progress:
+    """Single-line progress report on stderr, redrawn at most every ``interval`` seconds."""
+
+    def __init__(self, total: int, stream=sys.stderr, interval: float = 0.5):
+        self.total = total
+        self.stream = stream
+        self.interval = interval
+        self.start = time.perf_counter()
+        self._last = 0.0
+
+    def __call__(self, rows: int) -> None:
+        now = time.perf_counter()
+        if now - self._last < self.interval and rows < self.total:
+            return
+        self._last = now
+        elapsed = now - self.start
+        rate = rows / elapsed if elapsed else 0.0
+        pct = 100.0 * rows / self.total if self.total else 100.0
+        self.stream.write(f"\r{rows:>14,} / {self.total:,} rows  {pct:5.1f}%  {rate:>12,.0f} rows/s")
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.stream.write("\n")
+        self.stream.flush()
+
+
+def _write_rendered(kind: str, n: int, path: Any, **options: Any) -> Dict[str, Any]:
+    if kind not in ("resume", "generate_resume"):
+        raise ValueError(f"--format {options['format']} is only available for the resume kind")
+    from .resume import write_resumes
+
+    return write_resumes(n, path, **options)
+
+
+def _cmd_gen(args: argparse.Namespace) -> int:
+    if args.format in RESUME_TEXT_FORMATS:
+        write = _write_rendered
+    else:
+        from .export import write
+
+    kwargs = _parse_settings(args.set or [])
+    _check_settings(args.kind, kwargs, args.locale, args.format in RESUME_TEXT_FORMATS)
+    to_stdout = args.output in (None, "-")
+    if to_stdout and args.format == "parquet" and sys.stdout.isatty():
+        print("refusing to write parquet to a terminal; use -o PATH or redirect stdout", file=sys.stderr)
+        return 2
+    show_progress = args.progress if args.progress is not None else sys.stderr.isatty()
+    progress = _Progress(args.count) if show_progress else None
+    target = sys.stdout.buffer if to_stdout else args.output
+    try:
+        stats = write(args.kind, args.count, target, format=args.format, locale=args.locale,
+                      chunk_size=args.chunk_size, compression=args.compression, workers=args.workers,
+                      seed=args.seed, progress=progress, **kwargs)
+    except BrokenPipeError:
+        # Reader went away (e.g. `| head`): stop quietly without a traceback on interpreter exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+    finally:
+        if progress is not None:
+            progress.close()
+    if not args.quiet:
+        print(f"{stats['rows']:,} rows, {stats['bytes'] / 1e6:,.1f} MB in {stats['seconds']:.2f}s "
+              f"({stats['rows_per_s']:,.0f} rows/s, {stats['mb_per_s']:.1f} MB/s)", file=sys.stderr)
+    return 0
+
+
+def _cmd_kinds(args: argparse.Namespace) -> int:
+    from .dataset import BATCH_KINDS, DATASET_KINDS
+
+    for name in sorted(DATASET_KINDS):
+        print(f"{name}{'  (batched)' if name in BATCH_KINDS else ''}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="phoney", description="Generate fake data from the command line.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("gen", help="stream rows of one generator kind to stdout or a file")
+    p.add_argument("kind", help="generator kind, e.g. profile, resume, phone, ipv4, imei (see `phoney kinds`)")
+    p.add_argument("-n", "--count", type=int, default=1000, help="number of rows (default 1000)")
+    p.add_argument("-l", "--locale", help="locale code passed to the generator, e.g. de_DE")
+    p.add_argument("-f", "--format", choices=FORMATS, default="jsonl",
+                   help="jsonl (default), csv, parquet; text or markdown for resume")
+    p.add_argument("-o", "--output", help="output path; '-' or omitted writes to stdout")
+    p.add_argument("-w", "--workers", type=int, default=1, help="worker processes (default 1)")
+    p.add_argument("-s", "--seed", type=int, help="dataset seed; the same seed gives the same rows for any --workers")
+    p.add_argument("--chunk-size", type=int, default=10_000, help="rows per chunk/shard (default 10000)")
+    p.add_argument("--compression", help="gzip or zstd (inferred from .gz/.zst); parquet codec for parquet")
+    p.add_argument("--set", action="append", metavar="KEY=VALUE",
+                   help="extra generator argument, repeatable (e.g. --set family=software_engineer)")
+    p.add_argument("--progress", action=argparse.BooleanOptionalAction, default=None,
+                   help="progress on stderr (default: when stderr is a terminal)")
+    p.add_argument("-q", "--quiet", action="store_true", help="no summary line on stderr")
+    p.set_defaults(func=_cmd_gen)
+
+    p = sub.add_parser("kinds", help="list generator kinds")
+    p.set_defaults(func=_cmd_kinds)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    except ValueError as exc:
+        parser.exit(2, f"phoney: error: {exc}\n")
+    except KeyboardInterrupt:
+        return 130
+
+
+__all__ = ["main", "build_parser"]
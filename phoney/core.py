@@ -0,0 +1,547 @@
+import sys
+import random
+from functools import partial
+from .person import generate_person
+from .phone import generate_phone, generate_phones
+from .emailgen import generate_email
+from .data_loader import load_email_domains, get_available_locales
+from .age import generate_age
+from .create_profile import generate_profile, generate_profiles, iter_profiles
+from .agent import generate_user_agent
+from .uuidgen import generate_uuid
+from .financial import generate_financial_data, generate_financial_batch
+from .username import (
+    generate_online_presence,
+    generate_username,
+    generate_password,
+    generate_social_handles
+)
+from .resume import generate_resume, generate_resumes, write_resumes
+from .career import (
+    generate_job_title,
+    generate_salary,
+    generate_employment_history,
+    generate_skills,
+    experience_level_from_years,
+)
+from .internet import (
+    generate_tld,
+    generate_domain,
+    generate_hostname,
+    generate_url,
+    generate_ipv4,
+    generate_ipv6,
+    generate_mac,
+    generate_ipv4_batch,
+    generate_ipv6_batch,
+)
+from .imei import generate_imei, generate_imeis
+from .vin import generate_vin, generate_vins
+from .barcode import (
+    generate_ean13,
+    generate_upca,
+    generate_isbn13,
+    generate_ean13s,
+    generate_upcas,
+    generate_isbn13s,
+)
+from .checksum import (
+    is_valid_imei,
+    is_valid_vin,
+    is_valid_ean13,
+    is_valid_upca,
+    is_valid_isbn13,
+    is_valid_card_number,
+    is_valid_iban,
+)
+from .dataset import generate_dataset
+from .uniqueness import UniqueScope, unique
+from .allocation import IdentifierAllocator, allocator
+from .schema import Schema
+from . import export
+
+
+class Phoney:
+    """
+    Main class for generating fake data.
+
+    Usage:
+        from phoney import Phoney
+        phoney = Phoney()
+        
+        # Basic information
+        phoney.first_name(gender="male", locale="en_GB")
+        phoney.last_name(locale="fr_FR")
+        phoney.phone(locale="en_US")
+        phoney.email(first_name="jim", last_name="cooley", locale="en_US")
+        
+        # Online presence
+        phoney.username("John", "Smith")
+        phoney.password()
+        phoney.social_handle("John", "Smith", "twitter")
+        phoney.online_presence("John", "Smith")
+        
+    # Complete profiles
+        phoney.profile(locale="de_DE")
+
+        # Reproducible output from a private random stream
+        seeded = Phoney(seed=42)
+        seeded.profile(locale="en_GB")   # identical on every run
+    """
+    def __init__(self, seed=None, rng=None):
+        """
+        Args:
+            seed: Seed for a private random.Random owned by this instance.
+                Output is bit-identical across runs for the same seed
+                (wall-clock fields such as created_at and UUIDv1 excepted).
+            rng (random.Random): Use this generator instead of creating one.
+                If neither seed nor rng is given, the global random module
+                is used, as before.
+        """
+        if rng is None and seed is not None:
+            rng = random.Random(seed)
+        self.rng = rng
+    def first_name(self, gender=None, locale='en_US'):
+        """
+        Generate a first name.
+        Args:
+            gender (str): 'male' or 'female'. If None, random.
+            locale (str): Locale code (e.g. 'en_US').
+        Returns:
+            str: First name.
+        """
+        return generate_person(locale, gender, rng=self.rng)['first_name']
+
+    def last_name(self, gender=None, locale='en_US'):
+        """
+        Generate a last name.
+        Args:
+            gender (str): 'male' or 'female'. If None, random.
+            locale (str): Locale code.
+        Returns:
+            str: Last name.
+        """
+        return generate_person(locale, gender, rng=self.rng)['last_name']
+
+    def full_name(self, gender=None, locale='en_US'):
+        """
+        Generate a full name.
+        Args:
+            gender (str): 'male' or 'female'. If None, random.
+            locale (str): Locale code.
+        Returns:
+            str: Full name.
+        """
+        p = generate_person(locale, gender, rng=self.rng)
+        return f"{p['first_name']} {p['last_name']}"
+
+    def gender(self, locale='en_US'):
+        """
+        Generate a gender value.
+        Args:
+            locale (str): Locale code.
+        Returns:
+            str: Gender ('male' or 'female').
+        """
+        return generate_person(locale, rng=self.rng)['gender']
+
+    def phone(self, locale='en_US'):
+        """
+        Generate a phone number for the given locale.
+        Args:
+            locale (str): Locale code.
+        Returns:
+            str: Phone number.
+        """
+        return generate_phone(locale, rng=self.rng)
+
+    def phones(self, n, locale='en_US'):
+        """
+        Generate many phone numbers in one batch (vectorized with NumPy when installed).
+        Args:
+            n (int): Number of phone numbers.
+            locale (str): Locale code. If None, random per row.
+        Returns:
+            list: Phone numbers shaped like phone().
+        """
+        return generate_phones(n, locale, rng=self.rng)
+
+    def email(self, first_name=None, last_name=None, locale='en_US', age=None, birth_year=None):
+        """
+        Generate a realistic email address.
+        Args:
+            first_name (str): First name. If None, random.
+            last_name (str): Last name. If None, random.
+            locale (str): Locale code.
+            age (int): Age (optional).
+            birth_year (int): Birth year (optional).
+        Returns:
+            str: Email address.
+        """
+        if not first_name or not last_name:
+            p = generate_person(locale, rng=self.rng)
+            first_name = p['first_name']
+            last_name = p['last_name']
+        return generate_email(first_name, last_name, locale, age=age, birth_year=birth_year, rng=self.rng)
+
+    def age(self, min_age=18, max_age=80):
+        """
+        Generate a random age.
+        Args:
+            min_age (int): Minimum age.
+            max_age (int): Maximum age.
+        Returns:
+            int: Age.
+        """
+        return generate_age(min_age, max_age, rng=self.rng)[0]
+
+    def birthdate(self, min_age=18, max_age=80):
+        """
+        Generate a random birthdate.
+        Args:
+            min_age (int): Minimum age.
+            max_age (int): Maximum age.
+        Returns:
+            datetime.date: Birthdate.
+        """
+        return generate_age(min_age, max_age, rng=self.rng)[1]
+
+    def profile(self, locale='en_US', gender=None, fields=None):
+        """
+        Generate a complete fake profile.
+        Args:
+            locale (str): Locale code.
+            gender (str): 'male' or 'female'. If None, random.
+            fields (list): Optional subset of profile keys; only the generators they need run.
+        Returns:
+            dict: Profile with name, gender, age, birthdate, email, phone, locale.
+        """
+        return generate_profile(locale, gender, rng=self.rng, fields=fields)
+
+    def profiles(self, n, locale='en_US', gender=None, fields=None, output='rows'):
+        """
+        Generate many complete profiles in one batch.
+        Args:
+            n (int): Number of profiles.
+            locale (str): Locale code. If None, random per row.
+            gender (str): 'male' or 'female'. If None, random.
+            fields (list): Optional subset of profile keys; only the generators they need run.
+            output (str): 'rows', 'columns', 'arrow' (needs pyarrow) or 'pandas' (needs pandas).
+        Returns:
+            Profile dicts shaped like profile(), or flat columns for the other outputs.
+        """
+        return generate_profiles(n, locale=locale, gender=gender, fields=fields, rng=self.rng, output=output)
+
+    def iter_profiles(self, n=None, locale='en_US', gender=None, fields=None, chunk_size=1000):
+        """
+        Lazily yield profiles with bounded memory.
+        Args:
+            n (int): Number of profiles. If None, yields forever.
+            locale (str): Locale code. If None, random per row.
+            gender (str): 'male' or 'female'. If None, random.
+            fields (list): Optional subset of profile keys to keep.
+            chunk_size (int): Rows generated per internal batch.
+        Returns:
+            iterator: Profile dicts shaped like profile().
+        """
+        return iter_profiles(n, locale=locale, chunk_size=chunk_size, gender=gender, fields=fields, rng=self.rng)
+
+    def dataset(self, kind, n, workers=None, seed=None, **kwargs):
+        """
+        Generate n rows of any generator kind across worker processes.
+        Args:
+            kind (str): Generator name, e.g. 'profile', 'resume', 'imei'.
+            n (int): Number of rows.
+            workers (int): Worker processes (None = all cores, 1 = in-process).
+            seed (int): Dataset seed; same seed gives the same rows for any worker count.
+                If None, a seed is drawn from this instance's generator.
+        Returns:
+            iterator: Rows in order.
+        """
+        return generate_dataset(kind, n, workers=workers, seed=seed, rng=self.rng, **kwargs)
+
+    def write(self, kind, n, path, format='jsonl', workers=1, seed=None, **kwargs):
+        """
+        Stream n rows of any generator kind to a file (see phoney.export.write).
+        Args:
+            kind (str): Generator name, e.g. 'profile', 'resume', 'ipv4'.
+            n (int): Number of rows.
+            path (str): Output path (.gz/.zst compress) or a binary file object.
+            format (str): 'csv', 'jsonl' or 'parquet'.
+            workers (int): Worker processes for generation.
+            seed (int): Dataset seed; drawn from this instance's generator if None.
+        Returns:
+            dict: rows, bytes, file_bytes, seconds, rows_per_s and mb_per_s.
+        """
+        return export.write(kind, n, path, format=format, workers=workers, seed=seed, rng=self.rng, **kwargs)
+
+    def resume(self, locale: str | None = None, family: str | None = None, years: int = 8, format: str = 'dict',
+               fields: list | None = None):
+        """Generate a resume/CV. format in {'dict','text'}; fields selects top-level keys (dict only)."""
+        return generate_resume(locale=locale, family=family, years=years, format=format, rng=self.rng, fields=fields)
+
+    def resumes(self, n: int, locale: str | None = None, family: str | None = None, years: int = 8,
+                format: str = 'dict', workers: int | None = 1, seed: int | None = None, fields: list | None = None):
+        """
+        Generate many resumes in one batch, optionally across worker processes.
+        Args:
+            n (int): Number of resumes.
+            locale (str): Locale code (default en_US).
+            family (str): Job family bias. If None, random per resume.
+            years (int): Employment history window in years.
+            format (str): 'dict' or 'text'.
+            workers (int): Worker processes; None uses every CPU.
+            seed (int): Dataset seed; the same seed gives the same resumes for any workers.
+            fields (list): Optional subset of top-level resume keys; only the generators they need run.
+        Returns:
+            list: Resumes shaped like resume().
+        """
+        return generate_resumes(n, locale=locale, family=family, years=years, format=format, workers=workers,
+                                seed=seed, rng=self.rng, fields=fields)
+
+    def write_resumes(self, n, path, format='text', locale=None, family=None, workers=1, seed=None, **kwargs):
+        """
+        Render n resumes straight into a file (see phoney.resume.write_resumes).
+        Args:
+            n (int): Number of resumes.
+            path (str): Output path (.gz/.zst compress) or a binary file object.
+            format (str): 'text', 'markdown' or 'json'.
+            locale (str): Locale code (default en_US).
+            family (str): Job family bias. If None, random per resume.
+            workers (int): Worker processes for generation.
+            seed (int): Dataset seed; drawn from this instance's generator if None.
+        Returns:
+            dict: rows, bytes, file_bytes, seconds, rows_per_s and mb_per_s.
+        """
+        return write_resumes(n, path, format=format, locale=locale, family=family, workers=workers, seed=seed,
+                             rng=self.rng, **kwargs)
+
+    def user_agent(self, device_type="desktop"):
+        """
+        Generate browser user agent string
+        Args:
+            device_type: 'desktop' or 'mobile'
+        Returns:
+            str: User agent string
+        """
+        return generate_user_agent(device_type, rng=self.rng)
+    
+    def uuid(self, version=4):
+        """
+        Generate UUID
+        Args:
+            version: UUID version (1,3,4,5)
+        Returns:
+            str: UUID string
+        """
+        return generate_uuid(version, rng=self.rng)
+    
+    def username(self, first_name=None, last_name=None, locale='en_US'):
+        """
+        Generate a username based on name components.
+        Args:
+            first_name (str): First name. If None, generates random.
+            last_name (str): Last name. If None, generates random.
+            locale (str): Locale for random name generation if needed.
+        Returns:
+            str: Generated username
+        """
+        if not first_name or not last_name:
+            p = generate_person(locale, rng=self.rng)
+            first_name = p['first_name']
+            last_name = p['last_name']
+        return generate_username(first_name, last_name, rng=self.rng)
+
+    def password(self, length=12):
+        """
+        Generate a secure password.
+        Args:
+            length (int): Length of password
+        Returns:
+            str: Generated password
+        """
+        return generate_password(length, rng=self.rng)
+
+    def social_handle(self, first_name=None, last_name=None, platform='twitter', locale='en_US'):
+        """
+        Generate social media handle for specific platform.
+        Args:
+            first_name (str): First name. If None, generates random.
+            last_name (str): Last name. If None, generates random.
+            platform (str): Social platform ('twitter', 'instagram', 'tiktok', 'github')
+            locale (str): Locale for random name generation if needed.
+        Returns:
+            str: Social media handle
+        """
+        if not first_name or not last_name:
+            p = generate_person(locale, rng=self.rng)
+            first_name = p['first_name']
+            last_name = p['last_name']
+        return generate_social_handles(first_name, last_name, platform, rng=self.rng)
+
+    def online_presence(self, first_name=None, last_name=None, locale='en_US'):
+        """
+        Generate complete online presence including username and social handles.
+        Args:
+            first_name (str): First name. If None, generates random.
+            last_name (str): Last name. If None, generates random.
+            locale (str): Locale for random name generation if needed.
+        Returns:
+            dict: Online presence data including username, password, and social media handles
+        """
+        if not first_name or not last_name:
+            p = generate_person(locale, rng=self.rng)
+            first_name = p['first_name']
+            last_name = p['last_name']
+        return generate_online_presence(first_name, last_name, rng=self.rng)
+
+    def unique(self, mode="exact", capacity=None, error_rate=0.001, max_retries=8):
+        """
+        Open a scope whose usernames, emails and handles never repeat.
+        Args:
+            mode (str): 'exact' (compact fingerprint set) or 'bloom' (fixed memory; needs capacity).
+            capacity (int): Expected number of values.
+            error_rate (float): Bloom false-positive rate at capacity.
+            max_retries (int): Fresh draws before a numeric suffix is appended.
+        Returns:
+            UniqueScope: Use as ``with phoney.unique() as u: u.email()``; ``u.stats()`` reports
+            the collision rate and memory footprint.
+        """
+        return UniqueScope(mode=mode, capacity=capacity, error_rate=error_rate, max_retries=max_retries,
+                           rng=self.rng)
+
+    def allocator(self, kind, prefix=None, mode="sequential", key=None, start=0):
+        """
+        Allocate guaranteed-unique identifiers under one fixed prefix.
+        Args:
+            kind (str): 'imei', 'ean13', 'upca', 'isbn13' or 'vin'.
+            prefix (str): TAC, GS1/ISBN prefix, or the first 8 VIN characters (random for imei/vin if None).
+            mode (str): 'sequential' or 'permuted' (random-looking order, still unique).
+            key (int): Permutation key; drawn from this instance's rng if None.
+            start (int): Number of values already issued.
+        Returns:
+            IdentifierAllocator: ``.allocate()``, ``.take(n)``, ``.state()``; resume with
+            ``IdentifierAllocator.from_state(state)``.
+        """
+        return IdentifierAllocator(kind, prefix=prefix, mode=mode, key=key, start=start, rng=self.rng)
+
+    def schema(self, columns, locale='en_US'):
+        """
+        Compile a table definition into a fast row builder.
+        Args:
+            columns (dict): Column name -> generator spec, e.g. {"id": "uuid4", "name": "full_name",
+                "ip": ("ipv4", {"country": "GB"}), "salary": "salary.min"}.
+            locale (str): Locale passed to every generator that takes one.
+        Returns:
+            Schema: ``.row()``, ``.rows(n)``, ``.stream(n)`` and ``.dataset(n, workers, seed)``,
+            drawing from this instance's generator.
+        """
+        return Schema(columns, locale=locale, rng=self.rng)
+
+    # Career
+    def job_title(self, family=None, level=None, locale='en_US'):
+        return generate_job_title(locale=locale, family=family, level=level, rng=self.rng)
+
+    def salary(self, family=None, level=None, title=None, locale='en_US'):
+        return generate_salary(locale=locale, family=family, level=level, title=title, rng=self.rng)
+
+    def employment_history(self, years=10, locale='en_US', family=None, min_jobs=1, max_jobs=5):
+        return generate_employment_history(years=years, locale=locale, family=family, min_jobs=min_jobs, max_jobs=max_jobs, rng=self.rng)
+
+    def skills(self, family, level=None, count=None):
+        return generate_skills(family=family, level=level, count=count, rng=self.rng)
+
+    def experience_level(self, years):
+        return experience_level_from_years(years)
+
+    # Internet
+    def tld(self, locale=None):
+        return generate_tld(locale=locale, rng=self.rng)
+
+    def domain(self, tld=None, locale=None):
+        return generate_domain(tld=tld, locale=locale, rng=self.rng)
+
+    def hostname(self, domain=None, locale=None):
+        return generate_hostname(domain=domain, locale=locale, rng=self.rng)
+
+    def url(self, scheme='https', domain=None, path_segments=None, query_params=None, locale=None):
+        return generate_url(scheme=scheme, domain=domain, path_segments=path_segments, query_params=query_params, locale=locale, rng=self.rng)
+
+    def ipv4(self, country=None, locale=None, weighted=False):
+        return generate_ipv4(country=country, locale=locale, rng=self.rng, weighted=weighted)
+
+    def ipv6(self, global_unicast=True, country=None, locale=None, weighted=False):
+        return generate_ipv6(global_unicast=global_unicast, country=country, locale=locale, rng=self.rng,
+                             weighted=weighted)
+
+    def ipv4_batch(self, n, country=None, locale=None, as_="int", weighted=False):
+        return generate_ipv4_batch(n, country=country, locale=locale, as_=as_, weighted=weighted, rng=self.rng)
+
+    def ipv6_batch(self, n, global_unicast=True, country=None, locale=None, as_="int", weighted=False):
+        return generate_ipv6_batch(n, global_unicast=global_unicast, country=country, locale=locale, as_=as_,
+                                   weighted=weighted, rng=self.rng)
+
+    def mac(self):
+        return generate_mac(rng=self.rng)
+
+    # Other identifiers
+    def imei(self, tac=None):
+        return generate_imei(tac=tac, rng=self.rng)
+
+    def vin(self):
+        return generate_vin(rng=self.rng)
+
+    def ean13(self, prefix=""):
+        return generate_ean13(prefix=prefix, rng=self.rng)
+
+    def upca(self, prefix=""):
+        return generate_upca(prefix=prefix, rng=self.rng)
+
+    def isbn13(self, group_prefix="978"):
+        return generate_isbn13(group_prefix=group_prefix, rng=self.rng)
+
+    def imeis(self, n, tac=None, as_="str"):
+        return generate_imeis(n, tac=tac, rng=self.rng, as_=as_)
+
+    def vins(self, n, as_="str"):
+        return generate_vins(n, rng=self.rng, as_=as_)
+
+    def ean13s(self, n, prefix="", as_="str"):
+        return generate_ean13s(n, prefix=prefix, rng=self.rng, as_=as_)
+
+    def upcas(self, n, prefix="", as_="str"):
+        return generate_upcas(n, prefix=prefix, rng=self.rng, as_=as_)
+
+    def isbn13s(self, n, group_prefix="978", as_="str"):
+        return generate_isbn13s(n, group_prefix=group_prefix, rng=self.rng, as_=as_)
+
+    # Dynamic aliasing for simplicity: allow p.generate_* to call module functions directly.
+    def __getattr__(self, name):
+        # If someone calls p.generate_imei(...) or any generate_* API,
+        # return the top-level function with the same name using the module object.
+        if name.startswith("generate_"):
+            mod = sys.modules.get(__package__)
+            if mod is not None:
+                fn = getattr(mod, name, None)
+                if callable(fn):
+                    return fn if self.rng is None else partial(fn, rng=self.rng)
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    # Explicit generate_* wrappers for identifiers for maximum compatibility
+    def generate_imei(self, tac=None):
+        return generate_imei(tac=tac, rng=self.rng)
+
+    def generate_vin(self):
+        return generate_vin(rng=self.rng)
+
+    def generate_ean13(self, prefix=""):
+        return generate_ean13(prefix=prefix, rng=self.rng)
+
+    def generate_upca(self, prefix=""):
+        return generate_upca(prefix=prefix, rng=self.rng)
+
+    def generate_isbn13(self, group_prefix="978"):
+        return generate_isbn13(group_prefix=group_prefix, rng=self.rng)
+
+
+__all__ = ['Phoney']
@@ -1,63 +1,340 @@
-__all__ = ['generate_profile']
+__all__ = ['generate_profile', 'generate_profiles', 'iter_profiles', 'profile_steps', 'PROFILE_FIELDS',
+           'PROFILE_COLUMNS', 'PROFILE_OUTPUTS', 'PROFILE_STEPS', 'PROFILE_FIELD_STEPS']
 
+import importlib
+import os
 import random
 import uuid
 from datetime import datetime
 
 from .person import generate_person
-from .phone import generate_phone
+from .phone import generate_phone, generate_phones
 from .emailgen import generate_email
-from .age import generate_age
-from .agent import generate_user_agent
+from .age import generate_age, generate_ages
+from .agent import generate_user_agent, generate_user_agents
 from .data_loader import get_available_locales
 from .username import generate_username
-from .financial import FinancialDataGenerator
+from .financial import FinancialDataGenerator, generate_credit_cards
+from .projection import check_fields, resolve_steps
 
-def generate_profile(locale=None, gender=None, domain=None, uuid_version=4):
-    if locale is None:
-        locale = random.choice(get_available_locales())
-    
-    person = generate_person(locale, gender)
-    first_name = person['first_name']
-    last_name = person['last_name']
-    gender = person['gender']
-
-    age, birthdate = generate_age()
-    birth_year = birthdate.year
-
-    phone = generate_phone(locale)
-    email = generate_email(first_name, last_name, locale, domain=domain)
-    
-    user_agent = generate_user_agent()
-    
+PROFILE_FIELDS = (
+    'uuid', 'first_name', 'last_name', 'full_name', 'gender', 'age', 'birthdate',
+    'birth_year', 'email', 'phone', 'user_agent', 'username', 'credit_card',
+    'locale', 'created_at',
+)
+
+_FIELD_INDEX = {field: index for index, field in enumerate(PROFILE_FIELDS)}
+
+# Generator steps, in the order they draw from the rng
+PROFILE_STEPS = ('person', 'age', 'phone', 'email', 'user_agent', 'uuid', 'username', 'credit_card')
+
+# Profile field -> generator steps it is built from
+PROFILE_FIELD_STEPS = {
+    'uuid': ('uuid',), 'first_name': ('person',), 'last_name': ('person',), 'full_name': ('person',),
+    'gender': ('person',), 'age': ('age',), 'birthdate': ('age',), 'birth_year': ('age',),
+    'email': ('email',), 'phone': ('phone',), 'user_agent': ('user_agent',), 'username': ('username',),
+    'credit_card': ('credit_card',), 'locale': (), 'created_at': (),
+}
+
+# Step -> steps it reads from; name-based UUIDs (v3/v5) also hash the name
+_PROFILE_REQUIRES = {'email': ('person', 'age'), 'username': ('person',)}
+_NAMED_UUID_REQUIRES = dict(_PROFILE_REQUIRES, uuid=('person',))
+
+_ALL_STEPS = frozenset(PROFILE_STEPS)
+
+# The nested credit_card dict becomes these flat columns in column-oriented output
+CARD_COLUMNS = {
+    'credit_card_issuer': 'issuer', 'credit_card_number': 'number',
+    'credit_card_expiry': 'expiry', 'credit_card_cvv': 'cvv',
+}
+
+PROFILE_COLUMNS = tuple(c for f in PROFILE_FIELDS for c in (CARD_COLUMNS if f == 'credit_card' else (f,)))
+
+PROFILE_OUTPUTS = ('rows', 'columns', 'arrow', 'pandas')
+
+# Optional extras for output='arrow' / 'pandas', imported on first use
+_EXTRAS = {'arrow': 'pyarrow', 'pandas': 'pandas'}
+
+
+def _profile_uuid(uuid_version, first_name, last_name, domain, raw=None):
     if uuid_version in (3, 5):
         namespace = uuid.NAMESPACE_DNS
         name = f"{first_name}.{last_name}@{domain if domain else 'example.com'}"
-        profile_uuid = str(uuid.uuid3(namespace, name)) if uuid_version == 3 else str(uuid.uuid5(namespace, name))
-    elif uuid_version == 1:
-        profile_uuid = str(uuid.uuid1())
+        return str(uuid.uuid3(namespace, name)) if uuid_version == 3 else str(uuid.uuid5(namespace, name))
+    if uuid_version == 1:
+        return str(uuid.uuid1())
+    if raw is not None:
+        return str(uuid.UUID(bytes=raw, version=4))
+    return str(uuid.uuid4())
+
+
+# Hex digit of UUID byte 8's high nibble once the RFC 4122 variant bits are set
+_UUID_VARIANT = {c: f"{(int(c, 16) & 0x3) | 0x8:x}" for c in '0123456789abcdef'}
+
+
+def _uuid4_strings(entropy, n):
+    # Same strings as str(uuid.UUID(bytes=raw, version=4)) for each 16-byte slice, without UUID objects
+    h = entropy.hex()
+    variant = _UUID_VARIANT
+    return [f"{h[i:i + 8]}-{h[i + 8:i + 12]}-4{h[i + 13:i + 16]}-{variant[h[i + 16]]}{h[i + 17:i + 20]}-{h[i + 20:i + 32]}"
+            for i in range(0, 32 * n, 32)]
+
+
+def profile_steps(fields=None, uuid_version=4):
+    """
+    Generator steps (see PROFILE_STEPS) needed to produce ``fields``.
+
+    Args:
+        fields (list): Profile fields; None means all of PROFILE_FIELDS.
+        uuid_version (int): UUID version; 3 and 5 hash the name, so they pull in 'person'.
+    Returns:
+        frozenset: Steps to run, dependencies included.
+    """
+    if fields is None:
+        return _ALL_STEPS
+    requires = _NAMED_UUID_REQUIRES if uuid_version in (3, 5) else _PROFILE_REQUIRES
+    return resolve_steps(fields, PROFILE_FIELD_STEPS, requires)
+
+
+def _profile_values(locale, gender, domain, uuid_version, created_at, today, financial, raw_uuid, rng,
+                    steps=_ALL_STEPS, drawn=None):
+    # One profile as a tuple in PROFILE_FIELDS order; fields of skipped steps are None. ``drawn`` holds
+    # the (age, birthdate), phone, user agent, UUID and card generate_profiles drew for the whole batch.
+    first_name = last_name = full_name = age = birthdate = birth_year = None
+    phone = email = user_agent = profile_uuid = username = credit_card_info = None
+    if 'person' in steps:
+        person = generate_person(locale, gender, rng=rng)
+        first_name = person['first_name']
+        last_name = person['last_name']
+        full_name = f"{first_name} {last_name}"
+        gender = person['gender']
+    else:
+        gender = None
+
+    if drawn is None:
+        age_birthdate = generate_age(today=today, rng=rng) if 'age' in steps else None
+        if 'phone' in steps:
+            phone = generate_phone(locale, rng=rng)
     else:
-        profile_uuid = str(uuid.uuid4())
-    
-    created_at = datetime.now().isoformat()
-
-    username = generate_username(first_name, last_name, locale)
-    credit_card_info = FinancialDataGenerator(locale).generate()['credit_card']
-
-    return {
-        'uuid': profile_uuid,
-        'first_name': first_name,
-        'last_name': last_name,
-        'full_name': f"{first_name} {last_name}",
-        'gender': gender,
-        'age': age,
-        'birthdate': birthdate.isoformat(),
-        'birth_year': birth_year,
-        'email': email,
-        'phone': phone,
-        'user_agent': user_agent,
-        'username': username,
-        'credit_card': credit_card_info,
-        'locale': locale,
-        'created_at': created_at
-    }
\ No newline at end of file
+        age_birthdate, phone, user_agent, profile_uuid, credit_card_info = drawn
+    if age_birthdate is not None:
+        age, birthdate = age_birthdate
+        birth_year = birthdate.year
+        birthdate = birthdate.isoformat()
+
+    if 'email' in steps:
+        # The email's year/age suffix matches the profile instead of a second random age
+        email = generate_email(first_name, last_name, locale, age=age, birth_year=birth_year, domain=domain, rng=rng)
+
+    if drawn is None and 'user_agent' in steps:
+        user_agent = generate_user_agent(rng=rng)
+    if 'uuid' in steps and profile_uuid is None:
+        profile_uuid = _profile_uuid(uuid_version, first_name, last_name, domain, raw_uuid)
+
+    if 'username' in steps:
+        username = generate_username(first_name, last_name, locale, rng=rng)
+    if drawn is None and 'credit_card' in steps:
+        credit_card_info = financial._generate_credit_card()
+
+    return (
+        profile_uuid,
+        first_name,
+        last_name,
+        full_name,
+        gender,
+        age,
+        birthdate,
+        birth_year,
+        email,
+        phone,
+        user_agent,
+        username,
+        credit_card_info,
+        locale,
+        created_at,
+    )
+
+
+def _column_plan(fields):
+    # (column name, index into the value tuple, credit_card key or None) per output column
+    plan = []
+    for field in fields or PROFILE_FIELDS:
+        index = PROFILE_FIELDS.index(field)
+        if field == 'credit_card':
+            plan.extend((column, index, key) for column, key in CARD_COLUMNS.items())
+        else:
+            plan.append((field, index, None))
+    return plan
+
+
+def _convert_columns(columns, output):
+    if output == 'columns':
+        return columns
+    try:
+        module = importlib.import_module(_EXTRAS[output])
+    except ImportError:
+        raise ValueError(f"output='{output}' requires {_EXTRAS[output]} to be installed") from None
+    if output == 'arrow':
+        return module.table(columns)
+    return module.DataFrame(columns)
+
+
+def _check_fields(fields):
+    return check_fields(fields, PROFILE_FIELDS, 'profile')
+
+
+def _phones_for(locales, rng):
+    # One generate_phones call per distinct locale, scattered back into row order. The Python backend
+    # keeps seeded output independent of whether NumPy is installed.
+    groups = {}
+    for i, loc in enumerate(locales):
+        groups.setdefault(loc, []).append(i)
+    phones = [None] * len(locales)
+    for loc, index in groups.items():
+        for i, phone in zip(index, generate_phones(len(index), loc, rng=rng, backend='python')):
+            phones[i] = phone
+    return phones
+
+
+def _uuid_entropy(n, uuid_version, rng):
+    if uuid_version != 4:
+        return None
+    if rng is None:
+        return os.urandom(16 * n)
+    return rng.getrandbits(128 * n).to_bytes(16 * n, 'big')
+
+
+def generate_profile(locale=None, gender=None, domain=None, uuid_version=4, rng=None, fields=None):
+    fields = _check_fields(fields)
+    steps = profile_steps(fields, uuid_version)
+    if locale is None:
+        locale = (rng or random).choice(get_available_locales())
+    now = datetime.now()
+    financial = FinancialDataGenerator(locale, rng=rng) if 'credit_card' in steps else None
+    entropy = _uuid_entropy(1, uuid_version, rng) if 'uuid' in steps else None
+    values = _profile_values(locale, gender, domain, uuid_version, now.isoformat(), now.date(), financial, entropy,
+                             rng, steps)
+    if fields is None:
+        return dict(zip(PROFILE_FIELDS, values))
+    return {field: values[_FIELD_INDEX[field]] for field in fields}
+
+
+def generate_profiles(n, locale=None, gender=None, fields=None, domain=None, uuid_version=4, rng=None,
+                      output='rows'):
+    """
+    Generate many profiles at once with amortized per-row setup.
+
+    Steps that do not depend on another field are drawn for the whole batch
+    up front: ages via ``generate_ages``, phones via ``generate_phones`` (one
+    call per locale, Python backend), user agents via one weighted
+    ``choices`` call, UUID4s from one block of entropy, and cards via
+    ``generate_credit_cards``. Only the person, email and username, which
+    read each other, are built per row. Every row has the same shape as
+    ``generate_profile``; all rows in a batch share one ``created_at``.
+
+    With ``fields``, only the generators those fields depend on run (see
+    ``profile_steps``): ``['full_name', 'email']`` draws a person, an age and
+    an email, and skips the phone, user agent, UUID, username and card.
+
+    Column-oriented outputs append each value straight to its column list, so
+    no per-row dict is built; ``credit_card`` is flattened into the
+    ``credit_card_issuer/_number/_expiry/_cvv`` columns (see PROFILE_COLUMNS).
+
+    Args:
+        n (int): Number of profiles.
+        locale (str): Locale code. If None, each row picks a random locale.
+        gender (str): 'male' or 'female'. If None, random per row.
+        fields (list): Optional subset of PROFILE_FIELDS to generate for each row.
+        domain (str): Optional email domain override.
+        uuid_version (int): UUID version (1, 3, 4, 5).
+        rng (random.Random): Optional random source for reproducible batches.
+        output (str): 'rows' (list of dicts), 'columns' (dict of lists),
+            'arrow' (pyarrow.Table) or 'pandas' (pandas.DataFrame).
+    Returns:
+        list, dict, pyarrow.Table or pandas.DataFrame, depending on ``output``.
+    """
+    fields = _check_fields(fields)
+    if output not in PROFILE_OUTPUTS:
+        raise ValueError(f"output must be one of {', '.join(PROFILE_OUTPUTS)}")
+    plan = _column_plan(fields) if output != 'rows' else None
+    if n <= 0:
+        return [] if plan is None else _convert_columns({column: [] for column, _, _ in plan}, output)
+    r = rng or random
+    if locale is None:
+        locales = r.choices(get_available_locales(), k=n)
+    else:
+        locales = [locale] * n
+    genders = r.choices(('male', 'female'), k=n) if gender is None else [gender] * n
+    now = datetime.now()
+    created_at = now.isoformat()
+    today = now.date()
+    steps = profile_steps(fields, uuid_version)
+    # Steps that read no other step are drawn for the whole batch; person, email and username stay per row
+    nothing = [None] * n
+    ages = generate_ages(n, today=today, rng=rng) if 'age' in steps else nothing
+    phones = _phones_for(locales, rng) if 'phone' in steps else nothing
+    agents = generate_user_agents(n, rng=rng) if 'user_agent' in steps else nothing
+    if 'uuid' in steps and uuid_version == 4:
+        uuids = _uuid4_strings(_uuid_entropy(n, uuid_version, rng), n)
+    else:
+        uuids = nothing
+    cards = generate_credit_cards(n, rng=rng) if 'credit_card' in steps else nothing
+    if fields is not None:
+        picks = [(field, _FIELD_INDEX[field]) for field in fields]
+
+    profiles = []
+    append = profiles.append
+    if plan is not None:
+        columns = {column: [] for column, _, _ in plan}
+        sinks = [(columns[column].append, index, key) for column, index, key in plan]
+    for loc, gen, drawn in zip(locales, genders, zip(ages, phones, agents, uuids, cards)):
+        values = _profile_values(loc, gen, domain, uuid_version, created_at, today, None, None, rng, steps, drawn)
+        if plan is not None:
+            for sink, index, key in sinks:
+                sink(values[index] if key is None else values[index][key])
+            continue
+        if fields is None:
+            append(dict(zip(PROFILE_FIELDS, values)))
+        else:
+            append({field: values[index] for field, index in picks})
+    if plan is not None:
+        return _convert_columns(columns, output)
+    return profiles
+
+
+def iter_profiles(n=None, locale=None, chunk_size=1000, gender=None, fields=None, domain=None, uuid_version=4,
+                  rng=None):
+    """
+    Lazily yield profiles, generating them internally in chunks.
+
+    At most one chunk of ``chunk_size`` rows is alive at a time, so memory
+    stays flat regardless of ``n``; suitable for feeding bulk loaders or
+    message producers directly.
+
+    Arguments are checked here, so a bad ``chunk_size`` or unknown field
+    raises at the call rather than at the first ``next()``.
+
+    Args:
+        n (int): Number of profiles. If None, the iterator never ends.
+        locale (str): Locale code. If None, each row picks a random locale.
+        chunk_size (int): Rows generated per internal batch.
+        gender, fields, domain, uuid_version, rng: As for ``generate_profiles``.
+    Returns:
+        iterator: Profile dicts shaped like ``generate_profile``.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+    fields = _check_fields(fields)
+    return _iter_profiles(n, locale, chunk_size, gender, fields, domain, uuid_version, rng)
+
+
+def _iter_profiles(n, locale, chunk_size, gender, fields, domain, uuid_version, rng):
+    remaining = n
+    while remaining is None or remaining > 0:
+        size = chunk_size if remaining is None else min(chunk_size, remaining)
+        chunk = generate_profiles(size, locale=locale, gender=gender, fields=fields,
+                                  domain=domain, uuid_version=uuid_version, rng=rng)
+        if remaining is not None:
+            remaining -= size
+        yield from chunk
+        del chunk
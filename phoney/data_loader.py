@@ -42,58 +42,171 @@ def load_states():
     }
 
 import os
-import random
 import json
-from collections import defaultdict
+import threading
+from types import MappingProxyType
 
 BASE_DIR = os.path.join(os.path.dirname(__file__), 'data', 'name_data')
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
 
-def get_available_locales():
-    """Get all available locales from the name_data directory."""
-    locales = []
-    try:
-        for region in os.listdir(BASE_DIR):
-            region_path = os.path.join(BASE_DIR, region)
-            if os.path.isdir(region_path):
-                for locale in os.listdir(region_path):
-                    locale_path = os.path.join(region_path, locale)
-                    if os.path.isdir(locale_path):
-                        locales.append(locale)
-    except FileNotFoundError:
-        pass
-    return locales
+NAME_KINDS = ('male', 'female', 'last')
 
-def load_names(locale):
-    """Load names for a specific locale."""
-    names = {'male': [], 'female': [], 'last': []}
+
+def _read_names(path):
     try:
-        for region in os.listdir(BASE_DIR):
-            locale_path = os.path.join(BASE_DIR, region, locale)
-            if os.path.exists(locale_path):
-                for gender in names.keys():
-                    file_path = os.path.join(locale_path, f"{gender}.txt")
-                    if os.path.exists(file_path):
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            names[gender] = [line.strip() for line in f if line.strip()]
-                break
+        with open(path, 'r', encoding='utf-8') as f:
+            return tuple(line.strip() for line in f if line.strip())
     except FileNotFoundError:
-        pass
-    return names
+        return ()
 
-def load_phone_formats():
-    """Load phone number formats from JSON file."""
-    formats_path = os.path.join(os.path.dirname(__file__), 'data', 'phone_formats.json')
+
+def _read_json(path):
     try:
-        with open(formats_path, 'r', encoding='utf-8') as f:
+        with open(path, 'r', encoding='utf-8') as f:
             return json.load(f)
     except FileNotFoundError:
         return {}
 
+
+class LocaleRegistry:
+    """
+    Process-wide cache of locale datasets.
+
+    Name lists, phone formats and email domains are read from disk the first
+    time they are requested and kept as immutable tuples/mappings afterwards,
+    so steady-state generation does no file I/O.
+
+    Usage:
+        from phoney.data_loader import registry
+        registry.names('en_US')['male']   # tuple of male first names
+        registry.invalidate('en_US')      # drop one locale
+        registry.reload()                 # drop everything and re-scan
+    """
+
+    def __init__(self, base_dir=BASE_DIR, data_dir=DATA_DIR):
+        self.base_dir = base_dir
+        self.data_dir = data_dir
+        self._lock = threading.RLock()
+        self._locale_dirs = None
+        self._names = {}
+        self._phone_formats = None
+        self._email_domains = None
+
+    def _scan_locales(self):
+        locale_dirs = {}
+        try:
+            for region in sorted(os.listdir(self.base_dir)):
+                region_path = os.path.join(self.base_dir, region)
+                if os.path.isdir(region_path):
+                    for locale in sorted(os.listdir(region_path)):
+                        locale_path = os.path.join(region_path, locale)
+                        if os.path.isdir(locale_path):
+                            locale_dirs.setdefault(locale, locale_path)
+        except FileNotFoundError:
+            pass
+        return locale_dirs
+
+    def _locale_index(self):
+        locale_dirs = self._locale_dirs
+        if locale_dirs is None:
+            with self._lock:
+                if self._locale_dirs is None:
+                    self._locale_dirs = self._scan_locales()
+                locale_dirs = self._locale_dirs
+        return locale_dirs
+
+    def locales(self):
+        """Return a tuple of every locale that has name data."""
+        return tuple(self._locale_index())
+
+    def names(self, locale):
+        """
+        Return the name tables for a locale.
+
+        Returns:
+            Mapping: read-only mapping with 'male', 'female' and 'last' tuples,
+            plus 'first' (male + female) for gender-agnostic picks.
+        """
+        names = self._names.get(locale)
+        if names is not None:
+            return names
+        with self._lock:
+            names = self._names.get(locale)
+            if names is None:
+                locale_path = self._locale_index().get(locale)
+                tables = {}
+                for kind in NAME_KINDS:
+                    tables[kind] = _read_names(os.path.join(locale_path, f"{kind}.txt")) if locale_path else ()
+                tables['first'] = tables['male'] + tables['female']
+                names = MappingProxyType(tables)
+                self._names[locale] = names
+        return names
+
+    def phone_formats(self):
+        """Return the locale -> phone format mapping from phone_formats.json."""
+        formats = self._phone_formats
+        if formats is None:
+            with self._lock:
+                if self._phone_formats is None:
+                    data = _read_json(os.path.join(self.data_dir, 'phone_formats.json'))
+                    self._phone_formats = MappingProxyType(dict(data))
+                formats = self._phone_formats
+        return formats
+
+    def email_domains(self):
+        """Return the locale -> tuple of email domains mapping from email_domains.json."""
+        domains = self._email_domains
+        if domains is None:
+            with self._lock:
+                if self._email_domains is None:
+                    data = _read_json(os.path.join(self.data_dir, 'email_domains.json'))
+                    self._email_domains = MappingProxyType({k: tuple(v) for k, v in data.items()})
+                domains = self._email_domains
+        return domains
+
+    def invalidate(self, locale=None):
+        """
+        Drop cached data so the next access reads from disk again.
+
+        Args:
+            locale (str): Only forget this locale's name tables. If None,
+                every cached dataset (including the locale index) is dropped.
+        """
+        with self._lock:
+            if locale is not None:
+                self._names.pop(locale, None)
+                return
+            self._locale_dirs = None
+            self._names = {}
+            self._phone_formats = None
+            self._email_domains = None
+
+    def reload(self):
+        """Invalidate everything and eagerly re-read every dataset."""
+        with self._lock:
+            self.invalidate()
+            for locale in self._locale_index():
+                self.names(locale)
+            self.phone_formats()
+            self.email_domains()
+
+
+registry = LocaleRegistry()
+
+
+def get_available_locales():
+    """Get all available locales from the name_data directory."""
+    return list(registry.locales())
+
+def load_names(locale):
+    """Load names for a specific locale."""
+    names = registry.names(locale)
+    return {kind: list(names[kind]) for kind in NAME_KINDS}
+
+def load_phone_formats():
+    """Load phone number formats from JSON file."""
+    return dict(registry.phone_formats())
+
 def load_email_domains():
     """Load email domains from JSON file."""
-    domains_path = os.path.join(os.path.dirname(__file__), 'data', 'email_domains.json')
-    try:
-        with open(domains_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {}
\ No newline at end of file
+    return {k: list(v) for k, v in registry.email_domains().items()}
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .person import generate_person
+from .phone import generate_phone, generate_phones
+from .emailgen import generate_email
+from .age import generate_age
+from .create_profile import generate_profile, generate_profiles
+from .agent import generate_user_agent
+from .uuidgen import generate_uuid
+from .financial import generate_financial_data
+from .username import (
+    generate_online_presence,
+    generate_username,
+    generate_password,
+    generate_social_handles,
+)
+from .resume import generate_resume, generate_resumes
+from .career import (
+    generate_job_title,
+    generate_salary,
+    generate_employment_history,
+    generate_skills,
+)
+from .internet import (
+    generate_tld,
+    generate_domain,
+    generate_hostname,
+    generate_url,
+    generate_ipv4,
+    generate_ipv6,
+    generate_mac,
+)
+from .imei import generate_imei, generate_imeis
+from .vin import generate_vin, generate_vins
+from .barcode import (
+    generate_ean13,
+    generate_upca,
+    generate_isbn13,
+    generate_ean13s,
+    generate_upcas,
+    generate_isbn13s,
+)
+
+# Single-row generators addressable by kind name; each must accept rng=.
+DATASET_KINDS: Dict[str, Callable[..., Any]] = {
+    "person": generate_person,
+    "phone": generate_phone,
+    "email": generate_email,
+    "age": generate_age,
+    "profile": generate_profile,
+    "user_agent": generate_user_agent,
+    "uuid": generate_uuid,
+    "financial_data": generate_financial_data,
+    "online_presence": generate_online_presence,
+    "username": generate_username,
+    "password": generate_password,
+    "social_handles": generate_social_handles,
+    "resume": generate_resume,
+    "job_title": generate_job_title,
+    "salary": generate_salary,
+    "employment_history": generate_employment_history,
+    "skills": generate_skills,
+    "tld": generate_tld,
+    "domain": generate_domain,
+    "hostname": generate_hostname,
+    "url": generate_url,
+    "ipv4": generate_ipv4,
+    "ipv6": generate_ipv6,
+    "mac": generate_mac,
+    "imei": generate_imei,
+    "vin": generate_vin,
+    "ean13": generate_ean13,
+    "upca": generate_upca,
+    "isbn13": generate_isbn13,
+}
+
+# Kinds with a batch entry point taking (n, ..., rng=); used instead of a per-row loop.
+BATCH_KINDS: Dict[str, Callable[..., List[Any]]] = {
+    "profile": generate_profiles,
+    "phone": generate_phones,
+    "imei": generate_imeis,
+    "vin": generate_vins,
+    "ean13": generate_ean13s,
+    "upca": generate_upcas,
+    "isbn13": generate_isbn13s,
+    "resume": generate_resumes,
+}
+
+# Batch arguments used unless the caller passes them. The NumPy backends draw different values than
+# the Python ones for the same seed, so datasets pin the Python backend to stay identical with or
+# without NumPy installed.
+BATCH_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "phone": {"backend": "python"},
+    "imei": {"backend": "python"},
+    "vin": {"backend": "python"},
+    "ean13": {"backend": "python"},
+    "upca": {"backend": "python"},
+    "isbn13": {"backend": "python"},
+}
+
+DEFAULT_SHARD_SIZE = 10_000
+
+
+def _resolve_kind(kind: str) -> str:
+    name = kind[len("generate_"):] if kind.startswith("generate_") else kind
+    if name not in DATASET_KINDS:
+        raise ValueError(f"Unknown dataset kind '{kind}'. Valid kinds: {', '.join(sorted(DATASET_KINDS))}")
+    return name
+
+
+def shard_seed(seed: int, index: int) -> int:
+    """Derive the seed of shard ``index`` from the dataset seed (stable across processes and runs)."""
+    digest = hashlib.blake2b(f"{seed}:{index}".encode("ascii"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _batch_kwargs(name: str, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    # Arguments for the kind's batch entry point, or None when it has none or they do not bind to it
+    # (e.g. generate_phone's max_attempts); the per-row generator is used then
+    batch = BATCH_KINDS.get(name)
+    if batch is None:
+        return None
+    merged = {**BATCH_DEFAULTS.get(name, {}), **kwargs}
+    try:
+        inspect.signature(batch).bind(0, rng=None, **merged)
+    except TypeError:
+        return None
+    return merged
+
+
+def generate_shard(kind: str, index: int, count: int, seed: int, kwargs: Optional[Dict[str, Any]] = None) -> List[Any]:
+    """Generate one shard of ``count`` rows with its own derived random stream."""
+    name = _resolve_kind(kind)
+    rng = random.Random(shard_seed(seed, index))
+    kwargs = kwargs or {}
+    batch_kwargs = _batch_kwargs(name, kwargs)
+    if batch_kwargs is not None:
+        return BATCH_KINDS[name](count, rng=rng, **batch_kwargs)
+    fn = DATASET_KINDS[name]
+    return [fn(rng=rng, **kwargs) for _ in range(count)]
+
+
+def generate_dataset(
+    kind: str,
+    n: int,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    rng: Optional[random.Random] = None,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Generate ``n`` rows of ``kind`` across a process pool, streamed in order.
+
+    The rows are split into fixed-size shards and shard ``i`` draws from a
+    generator seeded with ``shard_seed(seed, i)``. Because sharding does not
+    depend on the pool, the same ``seed`` and ``shard_size`` yield the same
+    rows for any ``workers`` value. At most ``2 * workers`` shards are in
+    flight, so memory stays bounded for very large ``n``.
+
+    Args:
+        kind: Generator name, e.g. 'profile', 'resume', 'imei' (a 'generate_'
+            prefix is accepted too). See DATASET_KINDS.
+        n: Number of rows.
+        workers: Worker processes. None uses os.cpu_count(); 1 runs in-process.
+        seed: Dataset seed. If None, it is drawn from ``rng`` (or the OS).
+        shard_size: Rows per shard (part of the reproducibility contract).
+        rng: Optional random.Random used only to draw ``seed`` when it is None.
+        **kwargs: Passed to the generator, e.g. locale='de_DE'.
+
+    Yields:
+        Rows in shard order.
+    """
+    name = _resolve_kind(kind)
+    return stream_shards(partial(generate_shard, name, kwargs=kwargs), n, workers=workers, seed=seed,
+                         shard_size=shard_size, rng=rng)
+
+
+def stream_shards(
+    shard: Callable[[int, int, int], List[Any]],
+    n: int,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    rng: Optional[random.Random] = None,
+) -> Iterator[Any]:
+    """Run ``shard(index, count, seed)`` over the shards of ``n`` rows and stream the rows in order.
+
+    This is the engine behind ``generate_dataset``, for row sources that are
+    not a plain kind (e.g. a compiled ``phoney.schema.Schema``). ``shard``
+    must be picklable when ``workers`` > 1 and should seed its own generator
+    with ``shard_seed(seed, index)``; the arguments and the reproducibility
+    contract are those of ``generate_dataset``.
+    """
+    if shard_size <= 0:
+        raise ValueError("shard_size must be a positive integer")
+    if seed is None:
+        seed = (rng or random.SystemRandom()).getrandbits(64)
+    workers = workers or os.cpu_count() or 1
+    shards = [(i, min(shard_size, n - start)) for i, start in enumerate(range(0, max(n, 0), shard_size))]
+    return _stream(shard, shards, seed, workers)
+
+
+def _stream(shard: Callable[[int, int, int], List[Any]], shards: List[tuple], seed: int,
+            workers: int) -> Iterator[Any]:
+    if workers <= 1 or len(shards) <= 1:
+        for index, count in shards:
+            yield from shard(index, count, seed)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+        todo = iter(shards)
+        for index, count in todo:
+            pending.append(pool.submit(shard, index, count, seed))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            rows = pending.popleft().result()
+            nxt = next(todo, None)
+            if nxt is not None:
+                pending.append(pool.submit(shard, nxt[0], nxt[1], seed))
+            yield from rows
+
+
+__all__ = ["generate_dataset", "generate_shard", "stream_shards", "shard_seed", "DATASET_KINDS"]
@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import csv
+import importlib
+import io
+import json
+import os
+import random
+import time
+from itertools import islice
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from .dataset import DEFAULT_SHARD_SIZE, generate_dataset, generate_shard
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+EXPORT_COMPRESSIONS = ("gzip", "zstd")
+
+# Output buffer of the file writer; chunks are encoded in memory and written in one call each
+WRITE_BUFFER = 1 << 20
+
+_SUFFIX_COMPRESSION = {".gz": "gzip", ".gzip": "gzip", ".zst": "zstd", ".zstd": "zstd"}
+
+# Rows the Parquet writer may hold back while a column is still all None or empty lists in every
+# chunk seen so far; the file schema is the chunks' unified schema once every column has a type
+PARQUET_SCHEMA_ROWS = 10_000
+
+# Column names for kinds that yield tuples; others get kind_0, kind_1, ...
+_TUPLE_COLUMNS = {"age": ("age", "birthdate")}
+
+_dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str).encode
+
+
+def _infer_compression(path: Any, format: str) -> Optional[str]:
+    if format == "parquet" or not isinstance(path, (str, os.PathLike)):
+        return None
+    return _SUFFIX_COMPRESSION.get(os.path.splitext(os.fspath(path))[1].lower())
+
+
+def _record(kind: str, row: Any) -> Dict[str, Any]:
+    # Scalar kinds (phone, ipv4, imei, ...) become one column named after the kind
+    if isinstance(row, dict):
+        return row
+    if isinstance(row, tuple):
+        names = _TUPLE_COLUMNS.get(kind) or [f"{kind}_{i}" for i in range(len(row))]
+        return dict(zip(names, row))
+    return {kind: row}
+
+
+def _flatten(record: Dict[str, Any]) -> Dict[str, Any]:
+    # One level of nested dicts becomes prefixed columns (credit_card -> credit_card_number);
+    # anything deeper, and lists, is stored as a JSON string
+    flat = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            for sub, inner in value.items():
+                flat[f"{key}_{sub}"] = _dumps(inner) if isinstance(inner, (dict, list)) else inner
+        elif isinstance(value, list):
+            flat[key] = _dumps(value)
+        else:
+            flat[key] = value
+    return flat
+
+
+def _open_sink(path: Any, compression: Optional[str], level: Optional[int]):
+    """Binary sink plus the list of streams to close, innermost last."""
+    if hasattr(path, "write"):
+        raw, owned = path, []
+    else:
+        raw = open(path, "wb", buffering=WRITE_BUFFER)
+        owned = [raw]
+    if compression == "gzip":
+        import gzip
+        stream = gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6 if level is None else level, mtime=0)
+        return stream, [stream] + owned
+    if compression == "zstd":
+        try:
+            zstandard = importlib.import_module("zstandard")
+        except ImportError:
+            raise ValueError("compression='zstd' requires zstandard to be installed") from None
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        stream = compressor.stream_writer(raw, closefd=False)
+        return stream, [stream] + owned
+    return raw, owned
+
+
+def _chunks(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _csv_columns(kind: str, kwargs: Dict[str, Any]) -> List[str]:
+    # Known before the first row, so the header is written even for n=0: profiles use their column plan
+    # (PROFILE_COLUMNS, projected by fields=), other kinds the columns of one row built like a dataset shard
+    if kind == "profile":
+        from .create_profile import _check_fields, _column_plan
+        return [column for column, _, _ in _column_plan(_check_fields(kwargs.get("fields")))]
+    row = generate_shard(kind, 0, 1, 0, kwargs)[0]
+    if isinstance(row, (dict, tuple)):
+        return list(_flatten(_record(kind, row)))
+    return [kind]
+
+
+class _CsvEncoder:
+    """Encode chunks of rows as CSV under a header fixed up front; a row with other columns is an error."""
+
+    def __init__(self, kind: str, columns: List[str]):
+        self.kind = kind
+        self.columns = columns
+        self.header = (",".join(columns) + "\r\n").encode("utf-8")
+        self._known = frozenset(columns)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def encode(self, rows: List[Any]) -> bytes:
+        buffer, writer = self._buffer, self._writer
+        buffer.seek(0)
+        buffer.truncate()
+        if isinstance(rows[0], (dict, tuple)):
+            flat = [_flatten(_record(self.kind, row)) for row in rows]
+            extra = set().union(*flat) - self._known
+            if extra:
+                raise ValueError(f"'{self.kind}' rows have column(s) missing from the CSV header: "
+                                 f"{', '.join(sorted(extra))}")
+            columns = self.columns
+            writer.writerows([[row.get(c, "") for c in columns] for row in flat])
+        else:
+            # Scalar kinds: one column, no per-row dict; list rows (skills, employment_history) as JSON
+            if isinstance(rows[0], list):
+                rows = [_dumps(row) for row in rows]
+            writer.writerows(zip(rows))
+        return buffer.getvalue().encode("utf-8")
+
+
+def _jsonl_encoder(kind: str) -> Callable[[List[Any]], bytes]:
+    def encode(rows: List[Any]) -> bytes:
+        return ("\n".join([_dumps(_record(kind, row)) for row in rows]) + "\n").encode("utf-8")
+    return encode
+
+
+def write(
+    kind: str,
+    n: int,
+    path: Union[str, os.PathLike, BinaryIO],
+    format: str = "jsonl",
+    locale: Optional[str] = None,
+    chunk_size: int = DEFAULT_SHARD_SIZE,
+    compression: Optional[str] = None,
+    compression_level: Optional[int] = None,
+    workers: int = 1,
+    seed: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+    progress: Optional[Callable[[int], None]] = None,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """
+    Generate ``n`` rows of ``kind`` and stream them to ``path``.
+
+    Rows come from ``generate_dataset`` one chunk at a time: each chunk is
+    encoded in memory and handed to a buffered (optionally compressing)
+    writer, then dropped, so output files may be far larger than RAM. The
+    same ``seed`` and ``chunk_size`` produce the same rows for any
+    ``workers`` value.
+
+    Args:
+        kind: Generator name, e.g. 'profile', 'resume', 'ipv4', 'imei' (see DATASET_KINDS).
+        n: Number of rows.
+        path: Output path, or a binary file object (e.g. ``sys.stdout.buffer``).
+        format: 'csv', 'jsonl' or 'parquet'. CSV flattens one level of
+            nested dicts into prefixed columns and stores lists as JSON; its
+            header lists the kind's columns and is written even for n=0.
+        locale: Passed to the generator when given.
+        chunk_size: Rows per chunk (also the dataset shard size).
+        compression: 'gzip' or 'zstd' for csv/jsonl (inferred from a
+            .gz/.zst suffix when None); the column codec for parquet
+            (default snappy).
+        compression_level: Optional codec level.
+        workers: Worker processes for generation; 1 runs in-process.
+        seed: Dataset seed; drawn from ``rng`` (or the OS) if None.
+        rng: Optional random.Random used only to draw ``seed``.
+        progress: Optional callback receiving the number of rows written so far.
+        **kwargs: Extra generator arguments.
+    Returns:
+        dict: rows, bytes (encoded size before compression), file_bytes
+        (size on disk, None for file objects), seconds, rows_per_s and mb_per_s
+        (encoded MB per second).
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(EXPORT_FORMATS)}")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+    if compression is None:
+        compression = _infer_compression(path, format)
+    elif format != "parquet" and compression not in EXPORT_COMPRESSIONS:
+        raise ValueError(f"compression must be one of {', '.join(EXPORT_COMPRESSIONS)}")
+    if locale is not None:
+        kwargs["locale"] = locale
+
+    start = time.perf_counter()
+    rows = generate_dataset(kind, n, workers=workers, seed=seed, shard_size=chunk_size, rng=rng, **kwargs)
+    name = kind[len("generate_"):] if kind.startswith("generate_") else kind
+    if format == "parquet":
+        written, encoded = _write_parquet(name, rows, path, chunk_size, compression, compression_level, progress)
+    else:
+        columns = _csv_columns(name, kwargs) if format == "csv" else None
+        written, encoded = _write_text(name, rows, path, format, chunk_size, compression, compression_level,
+                                       progress, columns)
+    seconds = time.perf_counter() - start
+    file_bytes = os.path.getsize(path) if isinstance(path, (str, os.PathLike)) else None
+    if format == "parquet":
+        encoded = file_bytes if file_bytes is not None else encoded
+    return {
+        "rows": written,
+        "bytes": encoded,
+        "file_bytes": file_bytes,
+        "seconds": seconds,
+        "rows_per_s": written / seconds if seconds else 0.0,
+        "mb_per_s": encoded / seconds / 1e6 if seconds else 0.0,
+    }
+
+
+def _write_text(kind, rows, path, format, chunk_size, compression, level, progress, columns=None):
+    if format == "csv":
+        encoder = _CsvEncoder(kind, columns)
+        encode, header = encoder.encode, encoder.header
+    else:
+        encode, header = _jsonl_encoder(kind), b""
+    sink, owned = _open_sink(path, compression, level)
+    written = encoded = 0
+    try:
+        write_bytes = sink.write
+        if header:
+            write_bytes(header)
+            encoded += len(header)
+        for chunk in _chunks(rows, chunk_size):
+            data = encode(chunk)
+            write_bytes(data)
+            written += len(chunk)
+            encoded += len(data)
+            if progress is not None:
+                progress(written)
+    finally:
+        for stream in owned:
+            stream.close()
+        if not owned:
+            sink.flush()
+    return written, encoded
+
+
+def _has_null_type(pa, dtype) -> bool:
+    # True if an all-None column (or list/struct member) left Arrow without a type
+    if pa.types.is_null(dtype):
+        return True
+    if pa.types.is_struct(dtype):
+        return any(_has_null_type(pa, dtype.field(i).type) for i in range(dtype.num_fields))
+    if pa.types.is_list(dtype) or pa.types.is_large_list(dtype):
+        return _has_null_type(pa, dtype.value_type)
+    return False
+
+
+def _write_parquet(kind, rows, path, chunk_size, compression, level, progress):
+    try:
+        pa = importlib.import_module("pyarrow")
+        pq = importlib.import_module("pyarrow.parquet")
+    except ImportError:
+        raise ValueError("format='parquet' requires pyarrow to be installed") from None
+    writer = schema = None
+    pending: List[Any] = []
+    held = written = encoded = 0
+
+    def emit(table):
+        nonlocal written, encoded
+        writer.write_table(table)
+        written += table.num_rows
+        encoded += table.nbytes
+        if progress is not None:
+            progress(written)
+
+    def release():
+        nonlocal writer
+        writer = pq.ParquetWriter(path, schema, compression=compression or "snappy", compression_level=level)
+        for table in pending:
+            emit(table.cast(schema))
+        pending.clear()
+
+    try:
+        for chunk in _chunks(rows, chunk_size):
+            records = [_record(kind, row) for row in chunk]
+            if writer is not None:
+                emit(pa.Table.from_pylist(records, schema=schema))
+                continue
+            # Optional fields (resume awards, education gpa, ...) can be None or [] throughout a chunk, which
+            # Arrow types as null: hold chunks back until the unified schema has a type for every column
+            table = pa.Table.from_pylist(records)
+            schema = table.schema if schema is None else pa.unify_schemas([schema, table.schema],
+                                                                           promote_options="permissive")
+            pending.append(table)
+            held += table.num_rows
+            if held >= PARQUET_SCHEMA_ROWS or not any(_has_null_type(pa, t) for t in schema.types):
+                release()
+        if pending:
+            release()
+        if writer is None:
+            pq.write_table(pa.table({}), path)
+    finally:
+        if writer is not None:
+            writer.close()
+    return written, encoded
+
+
+__all__ = ["write", "EXPORT_FORMATS", "EXPORT_COMPRESSIONS"]
@@ -2,85 +2,197 @@ import random
 import string
 import datetime
 
-__all__ = ['FinancialDataGenerator', 'generate_financial_data']
+from .checksum import iban_check_digits, luhn_sum
+
+__all__ = ['FinancialDataGenerator', 'generate_financial_data', 'generate_financial_batch', 'generate_credit_cards',
+           'FINANCIAL_COLUMNS']
+
+CARD_ISSUERS = ('Visa', 'MasterCard', 'American Express', 'Discover')
+
+CARD_PREFIXES = {
+    'Visa': ('4',),
+    'MasterCard': ('51', '52', '53', '54', '55'),
+    'American Express': ('34', '37'),
+    'Discover': ('6011', '65'),
+}
+
+IBAN_COUNTRY_CODES = {
+    'en_US': 'US', 'en_GB': 'GB', 'fr_FR': 'FR',
+    'de_DE': 'DE', 'ja_JP': 'JP', 'zh_CN': 'CN',
+    'ko_KR': 'KR', 'ar_EG': 'EG', 'hi_IN': 'IN'
+}
+
+# BBAN layout per IBAN country as (alphabet, length) runs; other countries get 18 alphanumerics
+BBAN_FORMATS = {
+    'GB': ((string.ascii_uppercase, 4), (string.digits, 14)),
+    'DE': ((string.digits, 18),),
+    'FR': ((string.digits, 10), (string.ascii_uppercase + string.digits, 11), (string.digits, 2)),
+    'EG': ((string.digits, 25),),
+}
+DEFAULT_BBAN_FORMAT = ((string.ascii_uppercase + string.digits, 18),)
+
+BIC_LOCATIONS = ('MM', 'FF', 'XX')
+
+_MONTHS = tuple(f"{m:02d}" for m in range(1, 13))
+
+# Columns of generate_financial_batch, in order
+FINANCIAL_COLUMNS = (
+    'credit_card_issuer', 'credit_card_number', 'credit_card_expiry', 'credit_card_cvv', 'iban', 'bic',
+)
+
+class _IssuerTable:
+    """Per-issuer constants: length, CVV width and each prefix's precomputed Luhn sum."""
+
+    __slots__ = ('issuer', 'length', 'cvv_length', 'prefixes')
+
+    def __init__(self, issuer):
+        self.issuer = issuer
+        self.length = 15 if issuer == 'American Express' else 16
+        self.cvv_length = 4 if issuer == 'American Express' else 3
+        self.prefixes = []
+        for prefix in CARD_PREFIXES[issuer]:
+            random_digits = self.length - len(prefix) - 1
+            # The prefix's own parity is fixed by the random digits that follow it
+            self.prefixes.append((prefix, random_digits, luhn_sum(prefix, random_digits % 2 == 0)))
+        self.prefixes = tuple(self.prefixes)
+
+    def number(self, rng):
+        prefix, k, prefix_sum = rng.choice(self.prefixes)
+        body = f"{rng.randrange(10 ** k):0{k}d}"
+        total = prefix_sum + luhn_sum(body)
+        return f"{prefix}{body}{(10 - total % 10) % 10}"
+
+
+_ISSUER_TABLES = {issuer: _IssuerTable(issuer) for issuer in CARD_ISSUERS}
+
+
+def _format_iban(iban):
+    return ' '.join(iban[i:i+4] for i in range(0, len(iban), 4))
+
 
 class FinancialDataGenerator:
-    def __init__(self, locale='en_US'):
+    def __init__(self, locale='en_US', rng=None):
         self.locale = locale
-        
+        self.rng = rng or random
+        self.country = IBAN_COUNTRY_CODES.get(locale, 'US')
+        self.bban_format = BBAN_FORMATS.get(self.country, DEFAULT_BBAN_FORMAT)
+
     def generate(self):
         return {
             'credit_card': self._generate_credit_card(),
             'iban': self._generate_iban(),
             'bic': self._generate_bic()
         }
-    
+
     def _generate_credit_card(self):
-        issuer = random.choice(['Visa', 'MasterCard', 'American Express', 'Discover'])
+        table = _ISSUER_TABLES[self.rng.choice(CARD_ISSUERS)]
         return {
-            'issuer': issuer,
-            'number': self._generate_credit_card_number(issuer),
+            'issuer': table.issuer,
+            'number': table.number(self.rng),
             'expiry': self._generate_expiry_date(),
-            'cvv': self._generate_cvv(issuer)
+            'cvv': self._generate_cvv(table.issuer)
         }
-    
+
     def _generate_credit_card_number(self, issuer):
-        prefixes = {
-            'Visa': ['4'],
-            'MasterCard': ['51', '52', '53', '54', '55'],
-            'American Express': ['34', '37'],
-            'Discover': ['6011', '65']
-        }
-        
-        prefix = random.choice(prefixes[issuer])
-        length = 16 if issuer != 'American Express' else 15
-        digits = list(prefix) + [str(random.randint(0, 9)) for _ in range(length - len(prefix) - 1)]
-        
-        # Luhn algorithm implementation
-        total = 0
-        for i, digit in enumerate(reversed(digits)):
-            n = int(digit)
-            if i % 2 == 0:
-                n *= 2
-                total += n - 9 if n > 9 else n
-            else:
-                total += n
-        
-        check_digit = (10 - (total % 10)) % 10
-        return ''.join(digits) + str(check_digit)
-    
+        return _ISSUER_TABLES[issuer].number(self.rng)
+
     def _generate_expiry_date(self):
         current_year = datetime.datetime.now().year
-        return f"{random.randint(1, 12):02d}/{random.randint(current_year + 1, current_year + 5)}"
-    
+        return f"{self.rng.randint(1, 12):02d}/{self.rng.randint(current_year + 1, current_year + 5)}"
+
     def _generate_cvv(self, issuer):
-        length = 4 if issuer == 'American Express' else 3
-        return f"{random.randint(0, 10**length - 1):0{length}d}"
-    
+        length = _ISSUER_TABLES[issuer].cvv_length
+        return f"{self.rng.randint(0, 10**length - 1):0{length}d}"
+
     def _generate_iban(self):
-        country_codes = {
-            'en_US': 'US', 'en_GB': 'GB', 'fr_FR': 'FR', 
-            'de_DE': 'DE', 'ja_JP': 'JP', 'zh_CN': 'CN',
-            'ko_KR': 'KR', 'ar_EG': 'EG', 'hi_IN': 'IN'
-        }
-        country = country_codes.get(self.locale, 'US')
-        bban = ''.join(random.choices(string.ascii_uppercase + string.digits, k=18))
-        iban = f"{country}{random.randint(10,99):02d}{bban}"
-        return ' '.join(iban[i:i+4] for i in range(0, len(iban), 4))
-    
+        bban = ''.join(''.join(self.rng.choices(alphabet, k=k)) for alphabet, k in self.bban_format)
+        iban = f"{self.country}{iban_check_digits(self.country, bban)}{bban}"
+        return _format_iban(iban)
+
     def _generate_bic(self):
-        country_codes = {
-            'en_US': 'US', 'en_GB': 'GB', 'fr_FR': 'FR', 
-            'de_DE': 'DE', 'ja_JP': 'JP', 'zh_CN': 'CN',
-            'ko_KR': 'KR', 'ar_EG': 'EG', 'hi_IN': 'IN'
-        }
-        country = country_codes.get(self.locale, 'US')
-        bank_code = ''.join(random.choices(string.ascii_uppercase, k=4))
-        location = random.choice(['MM', 'FF', 'XX']) + random.choice(string.ascii_uppercase)
-        return f"{bank_code}{country}{location}"
+        bank_code = ''.join(self.rng.choices(string.ascii_uppercase, k=4))
+        location = self.rng.choice(BIC_LOCATIONS) + self.rng.choice(string.ascii_uppercase)
+        return f"{bank_code}{self.country}{location}"
+
+def generate_financial_data(locale: str = 'en_US', rng=None):
+    return FinancialDataGenerator(locale=locale, rng=rng).generate()
+
+
+def _chunks(choices, alphabet, k, n):
+    # One draw of n*k symbols, cut into n strings of length k
+    block = ''.join(choices(alphabet, k=n * k))
+    return [block[i:i + k] for i in range(0, n * k, k)]
+
+
+def _card_columns(n, r):
+    # Issuer, number, expiry and CVV columns of n cards
+    current_year = datetime.datetime.now().year
+    choices = r.choices
+    tables = [_ISSUER_TABLES[issuer] for issuer in choices(CARD_ISSUERS, k=n)]
+    numbers = [table.number(r) for table in tables]
+    months = choices(_MONTHS, k=n)
+    years = choices([str(y) for y in range(current_year + 1, current_year + 6)], k=n)
+    expiries = [f"{m}/{y}" for m, y in zip(months, years)]
+    cvv3, cvv4 = _chunks(choices, string.digits, 3, n), _chunks(choices, string.digits, 4, n)
+    cvvs = [c4 if table.cvv_length == 4 else c3 for table, c3, c4 in zip(tables, cvv3, cvv4)]
+    return [table.issuer for table in tables], numbers, expiries, cvvs
+
+
+def generate_credit_cards(n, rng=None):
+    """
+    Generate ``n`` credit cards shaped like ``FinancialDataGenerator._generate_credit_card``.
+
+    Issuers, expiries and CVVs are drawn for the whole batch at once; only
+    the card number is built per row.
+
+    Args:
+        n (int): Number of cards.
+        rng (random.Random): Optional random source for reproducible batches.
+    Returns:
+        list: Dicts with issuer, number, expiry and cvv.
+    """
+    columns = _card_columns(max(n, 0), rng or random)
+    return [{'issuer': issuer, 'number': number, 'expiry': expiry, 'cvv': cvv}
+            for issuer, number, expiry, cvv in zip(*columns)]
+
+
+def generate_financial_batch(n, locale='en_US', rng=None):
+    """
+    Generate ``n`` rows of card, IBAN and BIC data as columns.
+
+    Issuer tables, the locale's BBAN layout and the expiry year range are
+    resolved once per batch; card numbers get their Luhn digit from
+    precomputed prefix sums and the phoney.checksum kernels, and IBANs carry valid
+    ISO 13616 mod-97 check digits.
+
+    Args:
+        n (int): Number of rows.
+        locale (str): Locale code (selects the IBAN/BIC country).
+        rng (random.Random): Optional random source for reproducible batches.
+    Returns:
+        dict: Column name (see FINANCIAL_COLUMNS) -> list of ``n`` values.
+    """
+    r = rng or random
+    n = max(n, 0)
+    country = IBAN_COUNTRY_CODES.get(locale, 'US')
+    bban_format = BBAN_FORMATS.get(country, DEFAULT_BBAN_FORMAT)
+    choices = r.choices
+    upper = string.ascii_uppercase
+    issuers, numbers, expiries, cvvs = _card_columns(n, r)
 
-def generate_financial_data(locale: str = 'en_US'):
-    return FinancialDataGenerator(locale=locale).generate()
+    runs = [_chunks(choices, alphabet, k, n) for alphabet, k in bban_format]
+    bbans = [''.join(parts) for parts in zip(*runs)] if runs else [''] * n
+    ibans = [_format_iban(f"{country}{iban_check_digits(country, bban)}{bban}") for bban in bbans]
+    bics = [f"{bank}{country}{loc}{branch}" for bank, loc, branch in
+            zip(_chunks(choices, upper, 4, n), choices(BIC_LOCATIONS, k=n), choices(upper, k=n))]
+    return {
+        'credit_card_issuer': issuers,
+        'credit_card_number': numbers,
+        'credit_card_expiry': expiries,
+        'credit_card_cvv': cvvs,
+        'iban': ibans,
+        'bic': bics,
+    }
 
 # Example usage:
 if __name__ == "__main__":
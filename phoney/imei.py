@@ -3,39 +3,47 @@ from __future__ import annotations
 import random
 from typing import Optional
 
+from .checksum import luhn_check_digit, _numeric_codes
 
-def _luhn_check_digit(digits: str) -> int:
-    total = 0
-    # For IMEI, double every second digit from right (starting index 0 from right)
-    rev = list(map(int, digits[::-1]))
-    for i, d in enumerate(rev):
-        # When generating the check digit, the first body digit from the right
-        # (i == 0) must be doubled so that when the check digit is appended and
-        # a standard Luhn check runs (starting with no doubling on the check digit),
-        # the parity aligns.
-        if i % 2 == 0:
-            v = d * 2
-            total += v if v < 10 else (v - 9)
-        else:
-            total += d
-    return (10 - (total % 10)) % 10
-
-
-def generate_imei(tac: Optional[str] = None) -> str:
+
+def generate_imei(tac: Optional[str] = None, rng: Optional[random.Random] = None) -> str:
     """Generate a valid 15-digit IMEI number.
 
     - tac: optional 8-digit Type Allocation Code. If not provided, random 8 digits.
+    - rng: optional random.Random instance; defaults to the global random module.
     """
+    rng = rng or random
     if tac is None:
-        tac = "".join(str(random.randint(0, 9)) for _ in range(8))
+        tac = "".join(str(rng.randint(0, 9)) for _ in range(8))
     else:
         tac = ''.join(filter(str.isdigit, tac))
         if len(tac) != 8:
             raise ValueError("tac must be 8 digits")
-    snr = "".join(str(random.randint(0, 9)) for _ in range(6))
+    snr = "".join(str(rng.randint(0, 9)) for _ in range(6))
     body = tac + snr
-    cd = _luhn_check_digit(body)
+    cd = luhn_check_digit(body)
     return body + str(cd)
 
 
-__all__ = ["generate_imei"]
+def generate_imeis(n: int, tac: Optional[str] = None, rng: Optional[random.Random] = None,
+                   backend: Optional[str] = None, as_: str = "str"):
+    """Generate ``n`` valid IMEIs at once.
+
+    - tac: optional 8-digit Type Allocation Code shared by every row (validated
+      like ``generate_imei``). If not provided, each row gets random TAC digits.
+    - rng: optional random.Random; the NumPy backend seeds its generator from
+      it, so output is reproducible per backend.
+    - backend: 'numpy', 'python', or None to use NumPy when available.
+    - as_: 'str' for a list of str, 'numpy' for an ``S15`` array.
+
+    Digits are drawn in bulk (one array draw, or one ``randrange`` per ~18
+    rows) and check digits come from the ``phoney.checksum`` kernels.
+    """
+    if tac is not None:
+        tac = ''.join(filter(str.isdigit, tac))
+        if len(tac) != 8:
+            raise ValueError("tac must be 8 digits")
+    return _numeric_codes(n, tac or "", 15, "luhn", rng, backend, as_)
+
+
+__all__ = ["generate_imei", "generate_imeis"]
@@ -2,10 +2,19 @@ from __future__ import annotations
 
 import random
 import string
+import sys
+import threading
+from array import array
+from bisect import bisect_right
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 import ipaddress
 
+try:
+    import numpy as np
+except ImportError:  # optional: the batch generators fall back to pure Python
+    np = None
+
 DATA_DIR = Path(__file__).parent / "data" / "internet"
 
 DEFAULT_TLDS = [
@@ -116,6 +125,15 @@ def _country_from_locale(locale: Optional[str]) -> Optional[str]:
         return cc.upper()
     return None
 
+# Typical public blocks within each RIR's IPv4 space, used when a country has no prefix file
+REGION_DEFAULT_IPV4_PREFIXES = {
+    "RIPE": ["2.16.0.0/13", "5.0.0.0/8", "31.0.0.0/8", "81.0.0.0/8", "82.0.0.0/8"],
+    "APNIC": ["27.0.0.0/8", "36.0.0.0/8", "49.0.0.0/8", "58.0.0.0/8", "59.0.0.0/8", "60.0.0.0/8"],
+    "ARIN": ["3.0.0.0/8", "13.0.0.0/8", "23.0.0.0/8", "34.0.0.0/8", "44.0.0.0/8", "63.0.0.0/8"],
+    "LACNIC": ["177.0.0.0/8", "179.0.0.0/8", "186.0.0.0/8", "187.0.0.0/8", "189.0.0.0/8"],
+    "AFRINIC": ["41.0.0.0/8", "102.0.0.0/8", "105.0.0.0/8"],
+}
+
 def _load_prefixes(country: str) -> List[str]:
     path = DATA_DIR / f"ipv4_prefixes.{country}.txt"
     try:
@@ -158,20 +176,193 @@ def _cidr_range(cidr: str) -> Tuple[int, int]:
     last = network + size - 1
     return first, last
 
-def _random_ip_in_cidr(cidr: str) -> str:
-    first, last = _cidr_range(cidr)
+def _cidr6_range(cidr: str) -> Tuple[int, int]:
+    net = ipaddress.IPv6Network(cidr, strict=False)
+    return int(net.network_address), int(net.broadcast_address)
+
+
+class PrefixTable:
+    """
+    Parsed CIDR prefixes of one country or region as parallel integer arrays.
+
+    ``first[i]``/``last[i]`` are the inclusive bounds of prefix ``i``. IPv4
+    tables use ``array('I')`` (8 bytes per prefix); IPv6 bounds exceed 64 bits
+    and are kept as tuples of ints. ``cumulative`` (built on first use by
+    weighted sampling) holds running address counts for bisect lookups;
+    ``_np_bounds`` and ``_np_cumulative`` cache the NumPy columns of the IPv6
+    batch sampler.
+    """
+
+    __slots__ = ("first", "last", "_cumulative", "_np_bounds", "_np_cumulative")
+
+    def __init__(self, first: Sequence[int], last: Sequence[int]):
+        self.first = first
+        self.last = last
+        self._cumulative = None
+        self._np_bounds = None
+        self._np_cumulative = None
+
+    def __len__(self) -> int:
+        return len(self.first)
+
+    @property
+    def cumulative(self) -> Sequence[int]:
+        """Running totals of prefix sizes; ``cumulative[-1]`` is the table's address count."""
+        cumulative = self._cumulative
+        if cumulative is None:
+            total = 0
+            sums = []
+            for first, last in zip(self.first, self.last):
+                total += last - first + 1
+                sums.append(total)
+            # IPv4 totals fit in 64 bits; IPv6 totals do not
+            cumulative = self._cumulative = array("Q", sums) if isinstance(self.first, array) else tuple(sums)
+        return cumulative
+
+    def pick(self, rng=random, weighted: bool = False) -> int:
+        """Index of a prefix, uniform per prefix or (weighted) proportional to its size."""
+        if not weighted:
+            return rng.randrange(len(self.first))
+        cumulative = self.cumulative
+        return bisect_right(cumulative, rng.randrange(cumulative[-1]))
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the bounds and (if built) cumulative arrays."""
+        arrays = [self.first, self.last] + ([self._cumulative] if self._cumulative is not None else [])
+        size = sum(column.nbytes for column in self._np_bounds or ())
+        size += self._np_cumulative.nbytes if self._np_cumulative is not None else 0
+        for arr in arrays:
+            size += sys.getsizeof(arr)
+            if not isinstance(arr, array):
+                size += sum(sys.getsizeof(v) for v in arr)
+        return size
+
+    @classmethod
+    def from_cidrs(cls, cidrs: Iterable[str], version: int = 4) -> "PrefixTable":
+        parse = _cidr_range if version == 4 else _cidr6_range
+        bounds = []
+        for cidr in cidrs:
+            try:
+                bounds.append(parse(cidr))
+            except ValueError:
+                continue  # malformed line in a prefix file
+        if version == 4:
+            return cls(array("I", (f for f, _ in bounds)), array("I", (l for _, l in bounds)))
+        return cls(tuple(f for f, _ in bounds), tuple(l for _, l in bounds))
+
+
+class PrefixRegistry:
+    """
+    Process-wide cache of per-country IPv4/IPv6 prefix tables.
+
+    Each ``ipv4_prefixes.<CC>.txt`` / ``ipv6_prefixes.<CC>.txt`` file (or the
+    built-in default/regional blocks) is read and parsed the first time that
+    country is requested; afterwards sampling works on the cached integers only.
+
+    Usage:
+        from phoney.internet import prefix_registry
+        prefix_registry.ipv4('GB')           # PrefixTable
+        prefix_registry.invalidate('GB')     # e.g. after re-running build_prefixes
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._tables: Dict[Tuple[int, str], PrefixTable] = {}
+
+    def _get(self, version: int, key: str, load) -> PrefixTable:
+        table = self._tables.get((version, key))
+        if table is None:
+            with self._lock:
+                table = self._tables.get((version, key))
+                if table is None:
+                    table = self._tables[(version, key)] = PrefixTable.from_cidrs(load(), version)
+        return table
+
+    def ipv4(self, country: str) -> PrefixTable:
+        """IPv4 prefixes of a country (data file, else DEFAULT_IPV4_PREFIXES)."""
+        return self._get(4, country, lambda: _load_prefixes(country))
+
+    def ipv6(self, country: str) -> PrefixTable:
+        """IPv6 prefixes of a country from its data file (may be empty)."""
+        return self._get(6, country, lambda: _load_ipv6_prefixes(country))
+
+    def ipv4_region(self, region: str) -> PrefixTable:
+        """Typical IPv4 blocks of an RIR region (REGION_DEFAULT_IPV4_PREFIXES)."""
+        return self._get(4, "@" + region, lambda: REGION_DEFAULT_IPV4_PREFIXES.get(region, []))
+
+    def ipv6_region(self, region: str) -> PrefixTable:
+        """The /12 block of an RIR region (REGION_DEFAULT_IPV6_PREFIXES)."""
+        cidr = REGION_DEFAULT_IPV6_PREFIXES.get(region)
+        return self._get(6, "@" + region, lambda: [cidr] if cidr else [])
+
+    def invalidate(self, country: Optional[str] = None) -> None:
+        """Drop cached tables (one country, or everything when country is None)."""
+        with self._lock:
+            if country is None:
+                self._tables = {}
+            else:
+                self._tables.pop((4, country), None)
+                self._tables.pop((6, country), None)
+
+
+prefix_registry = PrefixRegistry()
+
+
+def _random_int_in_range(first: int, last: int, rng=random) -> int:
+    # Skip the network/broadcast addresses when the block has room for hosts
     if last - first >= 3:
-        n = random.randint(first + 1, last - 1)
-    else:
-        n = random.randint(first, last)
-    return _int_to_ip(n)
+        return rng.randint(first + 1, last - 1)
+    return rng.randint(first, last)
+
+def _random_int_in_ipv6_range(first: int, last: int, rng=random, whole: bool = False) -> int:
+    host_max = last - first
+    if host_max >= (1 << 64) - 1:
+        # Prefix of /64 or shorter: keep the network bits, randomize the lower 64 bits, within the
+        # first /64 by default or (whole, for weighted sampling) within any /64 of the prefix
+        if whole:
+            first += rng.randint(0, host_max >> 64) << 64
+        return first | rng.randint(1, (1 << 64) - 1)
+    if host_max >= 2:
+        return rng.randint(first + 1, last - 1)
+    return rng.randint(first, last)
+
+def _public_ipv4_ok(n: int) -> bool:
+    o1 = n >> 24
+    o2 = (n >> 16) & 0xFF
+    if o1 == 0 or o1 == 127 or o1 >= 224:
+        return False
+    if o1 == 10:
+        return False
+    if o1 == 169 and o2 == 254:
+        return False
+    if o1 == 172 and 16 <= o2 <= 31:
+        return False
+    if o1 == 192 and o2 == 168:
+        return False
+    return True
+
+def _sample_ipv4(table: PrefixTable, rng=random, weighted: bool = False) -> int:
+    first, last = table.first, table.last
+    for _ in range(5):
+        i = table.pick(rng, weighted)
+        n = _random_int_in_range(first[i], last[i], rng)
+        if _public_ipv4_ok(n):
+            return n
+    i = table.pick(rng, weighted)
+    return _random_int_in_range(first[i], last[i], rng)
+
+def _random_ip_in_cidr(cidr: str, rng=random) -> str:
+    first, last = _cidr_range(cidr)
+    return _int_to_ip(_random_int_in_range(first, last, rng))
 
 
-def _slug(n: int = 6) -> str:
-    return "".join(random.choice(string.ascii_lowercase + string.digits) for _ in range(n))
+def _slug(n: int = 6, rng=random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase + string.digits) for _ in range(n))
 
 
-def generate_tld(locale: Optional[str] = None) -> str:
+def generate_tld(locale: Optional[str] = None, rng: Optional[random.Random] = None) -> str:
+    rng = rng or random
     if locale:
         cc = _country_from_locale(locale)
         if cc:
@@ -181,19 +372,21 @@ def generate_tld(locale: Optional[str] = None) -> str:
                 for t in prefs:
                     if t in available:
                         return t
-                return random.choice(prefs)
-    return random.choice(_tlds())
+                return rng.choice(prefs)
+    return rng.choice(_tlds())
 
 
-def generate_domain(tld: str | None = None, locale: Optional[str] = None) -> str:
-    tld = tld or generate_tld(locale=locale)
-    name = random.choice(_words()) + "-" + _slug(4)
+def generate_domain(tld: str | None = None, locale: Optional[str] = None, rng: Optional[random.Random] = None) -> str:
+    rng = rng or random
+    tld = tld or generate_tld(locale=locale, rng=rng)
+    name = rng.choice(_words()) + "-" + _slug(4, rng)
     return f"{name}.{tld}"
 
 
-def generate_hostname(domain: str | None = None, locale: Optional[str] = None) -> str:
-    host = random.choice(["host", "app", "api", "web", "srv", "db", "cache"]) + "-" + _slug(3)
-    dom = domain or generate_domain(locale=locale)
+def generate_hostname(domain: str | None = None, locale: Optional[str] = None, rng: Optional[random.Random] = None) -> str:
+    rng = rng or random
+    host = rng.choice(["host", "app", "api", "web", "srv", "db", "cache"]) + "-" + _slug(3, rng)
+    dom = domain or generate_domain(locale=locale, rng=rng)
     return f"{host}.{dom}"
 
 
@@ -203,155 +396,344 @@ def generate_url(
     path_segments: list[str] | None = None,
     query_params: dict[str, str] | None = None,
     locale: Optional[str] = None,
+    rng: Optional[random.Random] = None,
 ) -> str:
-    dom = domain or generate_domain(locale=locale)
-    segs = path_segments or [random.choice(["api", "v1", "users", "search", "docs"]), _slug(5)]
+    rng = rng or random
+    dom = domain or generate_domain(locale=locale, rng=rng)
+    segs = path_segments or [rng.choice(["api", "v1", "users", "search", "docs"]), _slug(5, rng)]
     path = "/" + "/".join(segs)
     if query_params is None:
-        query_params = {"q": random.choice(_words()), "page": str(random.randint(1, 9))}
+        query_params = {"q": rng.choice(_words()), "page": str(rng.randint(1, 9))}
     query = "&".join(f"{k}={v}" for k, v in query_params.items()) if query_params else ""
     return f"{scheme}://{dom}{path}" + (f"?{query}" if query else "")
 
 
-def generate_ipv4(country: Optional[str] = None, locale: Optional[str] = None) -> str:
-    def ok(o1: int, o2: int) -> bool:
-        if o1 == 0 or o1 == 127 or o1 >= 224:
-            return False
-        if o1 == 10:
-            return False
-        if o1 == 169 and o2 == 254:
-            return False
-        if o1 == 172 and 16 <= o2 <= 31:
-            return False
-        if o1 == 192 and o2 == 168:
-            return False
-        return True
-
-    cc = (country or _country_from_locale(locale))
+def _ipv4_source(cc: Optional[str]) -> Optional[PrefixTable]:
+    """Prefix table for a country (or its region fallback); None means any public address."""
     if cc:
-        prefixes = _load_prefixes(cc)
-        if prefixes:
-            for _ in range(5):
-                ip = _random_ip_in_cidr(random.choice(prefixes))
-                o1, o2 = (int(x) for x in ip.split('.')[:2])
-                if ok(o1, o2):
-                    return ip
-            return _random_ip_in_cidr(random.choice(prefixes))
+        table = prefix_registry.ipv4(cc)
+        if table:
+            return table
         # Region fallback when no country-specific prefixes
         region = COUNTRY_TO_REGION.get(cc)
         if region:
             # Pick a typical public block within the RIR space for realism
-            region_blocks = {
-                "RIPE": ["2.16.0.0/13", "5.0.0.0/8", "31.0.0.0/8", "81.0.0.0/8", "82.0.0.0/8"],
-                "APNIC": ["27.0.0.0/8", "36.0.0.0/8", "49.0.0.0/8", "58.0.0.0/8", "59.0.0.0/8", "60.0.0.0/8"],
-                "ARIN": ["3.0.0.0/8", "13.0.0.0/8", "23.0.0.0/8", "34.0.0.0/8", "44.0.0.0/8", "63.0.0.0/8"],
-                "LACNIC": ["177.0.0.0/8", "179.0.0.0/8", "186.0.0.0/8", "187.0.0.0/8", "189.0.0.0/8"],
-                "AFRINIC": ["41.0.0.0/8", "102.0.0.0/8", "105.0.0.0/8"],
-            }
-            blocks = region_blocks.get(region, [])
-            if blocks:
-                for _ in range(5):
-                    ip = _random_ip_in_cidr(random.choice(blocks))
-                    o1, o2 = (int(x) for x in ip.split('.')[:2])
-                    if ok(o1, o2):
-                        return ip
-                return _random_ip_in_cidr(random.choice(blocks))
+            table = prefix_registry.ipv4_region(region)
+            if table:
+                return table
+    return None
 
+def _draw_ipv4(table: Optional[PrefixTable], rng=random, weighted: bool = False) -> int:
+    if table is not None:
+        return _sample_ipv4(table, rng, weighted)
     while True:
-        o1 = random.randint(1, 223)
-        o2 = random.randint(0, 255)
-        if not ok(o1, o2):
+        o1 = rng.randint(1, 223)
+        o2 = rng.randint(0, 255)
+        if not _public_ipv4_ok(o1 << 24 | o2 << 16):
             continue
-        o3 = random.randint(0, 255)
-        o4 = random.randint(1, 254)
-        return f"{o1}.{o2}.{o3}.{o4}"
+        o3 = rng.randint(0, 255)
+        o4 = rng.randint(1, 254)
+        return (o1 << 24) | (o2 << 16) | (o3 << 8) | o4
+
+def _ipv6_source(cc: Optional[str]) -> Tuple[Optional[PrefixTable], bool]:
+    """(table, is_region) for a country; the region fallback is a single /12 drawn without a pick."""
+    if cc:
+        table = prefix_registry.ipv6(cc)
+        if table:
+            return table, False
+        # No country-specific prefixes available: try region fallback (a single /12)
+        region = COUNTRY_TO_REGION.get(cc)
+        table = prefix_registry.ipv6_region(region) if region else None
+        if table:
+            return table, True
+    return None, False
+
+def _draw_ipv6(source: Tuple[Optional[PrefixTable], bool], global_unicast: bool = True, rng=random,
+               weighted: bool = False) -> int:
+    table, is_region = source
+    if table is not None:
+        i = 0 if is_region else table.pick(rng, weighted)
+        return _random_int_in_ipv6_range(table.first[i], table.last[i], rng, weighted)
+    if global_unicast:
+        # 2000::/3 => first group between 0x2000 and 0x3FFF
+        groups = [rng.randint(0x2000, 0x3FFF)] + [rng.randint(0, 0xFFFF) for _ in range(7)]
+    else:
+        # fallback: random 8 groups
+        groups = [rng.randint(0, 0xFFFF) for _ in range(8)]
+    n = 0
+    for g in groups:
+        n = (n << 16) | g
+    return n
+
+
+def generate_ipv4(
+    country: Optional[str] = None,
+    locale: Optional[str] = None,
+    rng: Optional[random.Random] = None,
+    weighted: bool = False,
+) -> str:
+    """Generate a public-looking IPv4 address, country/locale-aware when prefix data exists.
+
+    With ``weighted=True`` a prefix is chosen with probability proportional to
+    its size (bisect over cumulative address counts), so addresses are uniform
+    over the country's address space; by default every prefix is equally likely.
+    """
+    rng = rng or random
+    table = _ipv4_source(country or _country_from_locale(locale))
+    return _int_to_ip(_draw_ipv4(table, rng, weighted))
 
 
 def generate_ipv6(
     global_unicast: bool = True,
     country: Optional[str] = None,
     locale: Optional[str] = None,
+    rng: Optional[random.Random] = None,
+    weighted: bool = False,
 ) -> str:
     """Generate an IPv6 address.
 
     - If a country (or locale) is provided and corresponding IPv6 prefixes exist in data files,
       a random address from one of those prefixes will be generated.
+    - weighted=True picks that prefix proportionally to its size instead of uniformly and
+      draws from its whole range, so addresses are uniform over the country's address space;
+      by default an address falls in the prefix's first /64.
     - Otherwise, if global_unicast is True, the address will be in 2000::/3.
     - Else, a random valid IPv6 address will be generated and returned in canonical compressed form.
+    - rng: optional random.Random instance; defaults to the global random module.
     """
-    # Try country/locale-aware generation first via data files
-    cc = (country or _country_from_locale(locale))
-    if cc:
-        prefixes6 = _load_ipv6_prefixes(cc)
-        if prefixes6:
-            # Pick a prefix and generate a random address within it using ipaddress
-            cidr = random.choice(prefixes6)
-            try:
-                net = ipaddress.IPv6Network(cidr, strict=False)
-                # Avoid network and broadcast concepts (not applicable in IPv6 the same way),
-                # but skip all-zero interface identifier when possible by picking from full range.
-                # Choose a random integer within the network range
-                # net.num_addresses can be huge; sample a random 64-bit host part when prefix <= 64 for efficiency
-                if net.prefixlen <= 64:
-                    # Keep the first 64 bits fixed, randomize the lower 64 bits
-                    network_int = int(net.network_address)
-                    host_max = (1 << (128 - net.prefixlen)) - 1
-                    # Sample within the available host space
-                    host = random.randint(1, min(host_max, (1 << 64) - 1))
-                    addr_int = (network_int & (~host_max)) | host
-                else:
-                    # Smaller host space; sample uniformly
-                    first = int(net.network_address)
-                    last = int(net.broadcast_address)
-                    if last - first >= 2:
-                        addr_int = random.randint(first + 1, last - 1)
-                    else:
-                        addr_int = random.randint(first, last)
-                addr = ipaddress.IPv6Address(addr_int)
-                return addr.compressed
-            except Exception:
-                # If CIDR is malformed, fall through to global-unicast generation
-                pass
-
-        # No country-specific prefixes available: try region fallback
-        region = COUNTRY_TO_REGION.get(cc)
-        if region:
-            cidr = REGION_DEFAULT_IPV6_PREFIXES.get(region)
-            try:
-                net = ipaddress.IPv6Network(cidr, strict=False)
-                if net.prefixlen <= 64:
-                    network_int = int(net.network_address)
-                    host_max = (1 << (128 - net.prefixlen)) - 1
-                    host = random.randint(1, min(host_max, (1 << 64) - 1))
-                    addr_int = (network_int & (~host_max)) | host
-                else:
-                    first = int(net.network_address)
-                    last = int(net.broadcast_address)
-                    if last - first >= 2:
-                        addr_int = random.randint(first + 1, last - 1)
-                    else:
-                        addr_int = random.randint(first, last)
-                addr = ipaddress.IPv6Address(addr_int)
-                return addr.compressed
-            except Exception:
-                pass
+    rng = rng or random
+    source = _ipv6_source(country or _country_from_locale(locale))
+    return ipaddress.IPv6Address(_draw_ipv6(source, global_unicast, rng, weighted)).compressed
+
+
+IP_BATCH_FORMATS = ("int", "bytes", "str", "numpy")
+
+
+def _check_batch_args(as_: str, backend: Optional[str]) -> bool:
+    if as_ not in IP_BATCH_FORMATS:
+        raise ValueError(f"as_ must be one of {', '.join(IP_BATCH_FORMATS)}")
+    if backend not in (None, "numpy", "python"):
+        raise ValueError("backend must be 'numpy', 'python' or None")
+    if np is None and (backend == "numpy" or as_ == "numpy"):
+        raise ValueError("NumPy is required for backend='numpy' and as_='numpy'")
+    return np is not None and backend != "python"
+
+
+def _np_pick(table: PrefixTable, n: int, gen, weighted: bool):
+    if weighted:
+        cumulative = table.cumulative
+        if isinstance(cumulative, array):
+            cumulative = np.frombuffer(cumulative, dtype=np.uint64)
+            draws = gen.integers(0, int(cumulative[-1]), size=n, dtype=np.uint64)
+        else:
+            # IPv6 totals overflow uint64; float64 keeps the proportions to ~1e-16
+            if table._np_cumulative is None:
+                table._np_cumulative = np.array([float(c) for c in cumulative])
+            cumulative = table._np_cumulative
+            draws = gen.random(n) * cumulative[-1]
+        return np.searchsorted(cumulative, draws, side="right")
+    return gen.integers(0, len(table), size=n)
+
+
+def _np_public_ok(ips):
+    o1 = ips >> 24
+    o2 = (ips >> 16) & 0xFF
+    return ~((o1 == 0) | (o1 == 127) | (o1 >= 224) | (o1 == 10) | ((o1 == 169) & (o2 == 254))
+             | ((o1 == 172) & (o2 >= 16) & (o2 <= 31)) | ((o1 == 192) & (o2 == 168)))
+
+
+def _np_ipv4(table: Optional[PrefixTable], n: int, gen, weighted: bool):
+    if table is None:
+        out = np.empty(n, dtype=np.int64)
+        todo = np.arange(n)
+        while todo.size:
+            o1 = gen.integers(1, 224, size=todo.size)
+            o2 = gen.integers(0, 256, size=todo.size)
+            ok = _np_public_ok((o1 << 24) | (o2 << 16))
+            rows = todo[ok]
+            out[rows] = ((o1[ok] << 24) | (o2[ok] << 16) | (gen.integers(0, 256, size=rows.size) << 8)
+                         | gen.integers(1, 255, size=rows.size))
+            todo = todo[~ok]
+        return out.astype(np.uint32)
+
+    first = np.frombuffer(table.first, dtype=np.uint32).astype(np.int64)
+    last = np.frombuffer(table.last, dtype=np.uint32).astype(np.int64)
+    # Skip the network/broadcast addresses when the block has room for hosts
+    wide = last - first >= 3
+    low = np.where(wide, first + 1, first)
+    high = np.where(wide, last - 1, last)
+
+    def draw(size):
+        i = _np_pick(table, size, gen, weighted)
+        return gen.integers(low[i], high[i], endpoint=True)
+
+    out = draw(n)
+    # Same policy as the scalar path: up to five tries for a public address, then accept the sixth
+    todo = np.flatnonzero(~_np_public_ok(out))
+    for attempt in range(5):
+        if not todo.size:
+            break
+        redo = draw(todo.size)
+        if attempt < 4:
+            keep = _np_public_ok(redo)
+            out[todo[keep]] = redo[keep]
+            todo = todo[~keep]
+        else:
+            out[todo] = redo
+    return out.astype(np.uint32)
+
+
+def _np_ipv6_bounds(table: PrefixTable):
+    # 128-bit bounds as uint64 columns, built once per table like its cumulative counts
+    u64 = np.uint64
+    mask = (1 << 64) - 1
+    bounds = table._np_bounds = (
+        np.array([f >> 64 for f in table.first], dtype=u64),
+        np.array([f & mask for f in table.first], dtype=u64),
+        np.array([l >> 64 for l in table.last], dtype=u64),
+        # Sizes beyond 64 bits only matter as "wide"; cap them so they fit in uint64
+        np.array([min(l - f, mask) for f, l in zip(table.first, table.last)], dtype=u64),
+    )
+    return bounds
+
+
+def _np_ipv6(source: Tuple[Optional[PrefixTable], bool], n: int, global_unicast: bool, gen, weighted: bool):
+    """Sample n IPv6 addresses as (hi, lo) uint64 columns."""
+    u64 = np.uint64
+    table, is_region = source
+    if table is None:
+        hi = gen.integers(0, 1 << 64, size=n, dtype=u64, endpoint=False)
+        if global_unicast:
+            hi = (hi & u64((1 << 48) - 1)) | (gen.integers(0x2000, 0x3FFF, size=n, dtype=u64, endpoint=True) << u64(48))
+        return hi, gen.integers(0, 1 << 64, size=n, dtype=u64, endpoint=False)
+
+    mask = (1 << 64) - 1
+    first_hi, first_lo, last_hi, span = table._np_bounds or _np_ipv6_bounds(table)
+    i = np.zeros(n, dtype=np.intp) if is_region else _np_pick(table, n, gen, weighted)
+    span = span[i]
+    wide = span == u64(mask)
+    # /64 or shorter: keep the network bits, randomize the lower 64 bits
+    lo = np.where(wide, gen.integers(1, mask, size=n, dtype=u64, endpoint=True), u64(0))
+    hi = first_hi[i]
+    if weighted:
+        # Any /64 of a wide prefix, as on the scalar path
+        hi = hi + gen.integers(0, np.where(wide, last_hi[i] - hi, u64(0)), dtype=u64, endpoint=True)
+    narrow = ~wide
+    if narrow.any():
+        s = span[narrow]
+        inner = s >= u64(2)
+        offset = gen.integers(0, np.where(inner, s - u64(2), s), dtype=u64, endpoint=True)
+        lo[narrow] = first_lo[i][narrow] + offset + inner.astype(u64)
+    return hi, lo | np.where(wide, first_lo[i], u64(0))
+
+
+def generate_ipv4_batch(
+    n: int,
+    country: Optional[str] = None,
+    locale: Optional[str] = None,
+    as_: str = "int",
+    weighted: bool = False,
+    rng: Optional[random.Random] = None,
+    backend: Optional[str] = None,
+):
+    """Generate ``n`` IPv4 addresses at once, sampled like ``generate_ipv4``.
+
+    Prefix tables and region fallbacks are resolved once per batch and the
+    addresses are produced as 32-bit integers. With NumPy installed, every
+    step (prefix pick, offset, public-range check) is vectorized.
+
+    Args:
+        n: Number of addresses.
+        country, locale, weighted: As for ``generate_ipv4``.
+        as_: Output type.
+            'int'   -> array('I') of host-order integers
+            'bytes' -> packed big-endian bytes, 4 per address (network order)
+            'str'   -> list of dotted-quad strings
+            'numpy' -> numpy.ndarray of uint32 (requires NumPy)
+        rng: Optional random.Random. The NumPy backend seeds its generator
+            from it, so output is reproducible per backend.
+        backend: 'numpy', 'python', or None to use NumPy when available.
+    """
+    use_numpy = _check_batch_args(as_, backend)
+    r = rng or random
+    table = _ipv4_source(country or _country_from_locale(locale))
+    n = max(n, 0)
+
+    if use_numpy:
+        gen = np.random.default_rng(r.getrandbits(64) if rng is not None else None)
+        ips = _np_ipv4(table, n, gen, weighted)
+        if as_ == "numpy":
+            return ips
+        if as_ == "bytes":
+            return ips.astype(">u4").tobytes()
+        if as_ == "str":
+            return [_int_to_ip(x) for x in ips.tolist()]
+        return array("I", ips.tobytes())
+
+    ips = array("I", (_draw_ipv4(table, r, weighted) for _ in range(n)))
+    if as_ == "bytes":
+        if sys.byteorder == "little":
+            ips.byteswap()
+        return ips.tobytes()
+    if as_ == "str":
+        return [_int_to_ip(x) for x in ips]
+    return ips
+
+
+def generate_ipv6_batch(
+    n: int,
+    global_unicast: bool = True,
+    country: Optional[str] = None,
+    locale: Optional[str] = None,
+    as_: str = "int",
+    weighted: bool = False,
+    rng: Optional[random.Random] = None,
+    backend: Optional[str] = None,
+):
+    """Generate ``n`` IPv6 addresses at once, sampled like ``generate_ipv6``.
+
+    128-bit values do not fit a machine word, so the NumPy backend keeps each
+    address as a (hi, lo) pair of uint64 columns.
+
+    Args:
+        n: Number of addresses.
+        global_unicast, country, locale, weighted: As for ``generate_ipv6``.
+        as_: Output type.
+            'int'   -> list of 128-bit Python ints
+            'bytes' -> packed big-endian bytes, 16 per address (network order)
+            'str'   -> list of compressed address strings
+            'numpy' -> numpy.ndarray of shape (n, 2), uint64 [hi, lo] (requires NumPy)
+        rng, backend: As for ``generate_ipv4_batch``.
+    """
+    use_numpy = _check_batch_args(as_, backend)
+    r = rng or random
+    source = _ipv6_source(country or _country_from_locale(locale))
+    n = max(n, 0)
+
+    if use_numpy:
+        gen = np.random.default_rng(r.getrandbits(64) if rng is not None else None)
+        hi, lo = _np_ipv6(source, n, global_unicast, gen, weighted)
+        pairs = np.stack([hi, lo], axis=1) if n else np.empty((0, 2), dtype=np.uint64)
+        if as_ == "numpy":
+            return pairs
+        packed = pairs.astype(">u8").tobytes()
+        if as_ == "bytes":
+            return packed
+        ints = [int.from_bytes(packed[k:k + 16], "big") for k in range(0, len(packed), 16)]
+    else:
+        ints = [_draw_ipv6(source, global_unicast, r, weighted) for _ in range(n)]
+        if as_ == "bytes":
+            return b"".join(x.to_bytes(16, "big") for x in ints)
+    if as_ == "str":
+        return [ipaddress.IPv6Address(x).compressed for x in ints]
+    return ints
 
-    if global_unicast:
-        # 2000::/3 => first group between 0x2000 and 0x3FFF
-        first_group = random.randint(0x2000, 0x3FFF)
-        groups = [first_group] + [random.randint(0, 0xFFFF) for _ in range(7)]
-        addr = ipaddress.IPv6Address(":".join(f"{g:04x}" for g in groups))
-        return addr.compressed
-    # fallback: random 8 groups
-    groups = [random.randint(0, 0xFFFF) for _ in range(8)]
-    addr = ipaddress.IPv6Address(":".join(f"{g:04x}" for g in groups))
-    return addr.compressed
-
-
-def generate_mac() -> str:
-    first = random.randint(0x00, 0xFF)
+
+def generate_mac(rng: Optional[random.Random] = None) -> str:
+    rng = rng or random
+    first = rng.randint(0x00, 0xFF)
     first = (first | 0x02) & 0xFE
-    octets = [first] + [random.randint(0x00, 0xFF) for _ in range(5)]
+    octets = [first] + [rng.randint(0x00, 0xFF) for _ in range(5)]
     return ":".join(f"{b:02x}" for b in octets)
 
 
@@ -371,4 +753,9 @@ __all__ = [
     "generate_ipv4",
     "generate_ipv6",
     "generate_mac",
+    "generate_ipv4_batch",
+    "generate_ipv6_batch",
+    "PrefixRegistry",
+    "PrefixTable",
+    "prefix_registry",
 ]
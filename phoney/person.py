@@ -2,52 +2,53 @@ __all__ = ['generate_person']
 # phoney/person.py
 """Person information generator."""
 import random
-import os
-from .data_loader import load_names, get_available_locales
+from .data_loader import registry
 
 _fallback_names_cache = {}
 
-def generate_person(locale, gender=None):
+def generate_person(locale, gender=None, rng=None):
     """
     Generate a person with first name, last name, and gender.
     
     Args:
         locale: The locale to use for name generation (e.g., 'en_US')
         gender: Specific gender to generate ('male' or 'female'), or random if None
+        rng: Optional random.Random instance; defaults to the global random module
         
     Returns:
         dict: Dictionary with first_name, last_name, and gender
     """
-    names = load_names(locale)
+    rng = rng or random
+    names = registry.names(locale)
     
     if gender is None:
-        gender = random.choice(['male', 'female'])
+        gender = rng.choice(['male', 'female'])
     
     first_name = None
     if gender == 'male' and names['male']:
-        first_name = random.choice(names['male'])
+        first_name = rng.choice(names['male'])
     elif gender == 'female' and names['female']:
-        first_name = random.choice(names['female'])
+        first_name = rng.choice(names['female'])
     
     if not first_name:
-        all_first = names['male'] + names['female']
+        all_first = names['first']
         if all_first:
-            first_name = random.choice(all_first)
+            first_name = rng.choice(all_first)
         else:
             if locale not in _fallback_names_cache:
                 _fallback_names_cache[locale] = _get_locale_fallback_names(locale)
             fallback = _fallback_names_cache[locale]
-            first_name = random.choice(fallback['first'])
+            first_name = rng.choice(fallback['first'])
     
     last_name = None
     if names['last']:
-        last_name = random.choice(names['last'])
+        last_name = rng.choice(names['last'])
     
     if not last_name:
         if locale not in _fallback_names_cache:
             _fallback_names_cache[locale] = _get_locale_fallback_names(locale)
         fallback = _fallback_names_cache[locale]
-        last_name = random.choice(fallback['last'])
+        last_name = rng.choice(fallback['last'])
     
     return {
         'first_name': first_name,
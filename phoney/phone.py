@@ -1,10 +1,13 @@
-__all__ = ['generate_phone']
+__all__ = ['generate_phone', 'generate_phones']
 # phoney/phone.py
 import random
 import re
-import os
-import json
-from collections import defaultdict
+from .data_loader import registry
+
+try:
+    import numpy as np
+except ImportError:  # optional: generate_phones falls back to pure Python
+    np = None
 
 COUNTRY_CODES = {
     'en_US':'1','en_CA':'1','es_MX':'52','en_GB':'44','fr_FR':'33',
@@ -100,16 +103,16 @@ DEFAULT_FORMATS = {
     'ja_JP': '## #### ####',
     'ko_KR': '## #### ####',
     'zh_CN': '### #### ####',
-    'zh_TW': '#### ######',
+    'zh_TW': '### ### ###',
     'hi_IN': '#### ### ###',
     'id_ID': '8## #### #####',  # Fixed: 11-digit mobile format
     'th_TH': '### ### ###',
     'vi_VN': '### #######',
     'ms_MY': '### ### ###',
-    'fil_PH': '#### ### ####',
+    'fil_PH': '### ### ####',
     'ar_SA': '## ### ####',
     'he_IL': '## ### ####',
-    'en_AU': '#### ######',
+    'en_AU': '### ### ###',
     'en_NZ': '#### ######',
     'en_ZA': '## ### ####',
     'sw_KE': '### ######',
@@ -122,68 +125,242 @@ DEFAULT_FORMATS = {
 }
 
 def load_phone_formats():
-    """Load phone number formats from JSON file."""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    formats_path = os.path.join(current_dir, 'data', 'phone_formats.json')
-    
-    try:
-        with open(formats_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return DEFAULT_FORMATS
-
-def generate_phone(locale=None, max_attempts=500):
-    fmts = load_phone_formats()
-    if not locale or locale not in COUNTRY_CODES:
-        locale = random.choice(list(COUNTRY_CODES))
-    
-    fmt = DEFAULT_FORMATS.get(locale, fmts.get(locale, '(###) ###-####'))
+    """Load phone number formats from the shared locale registry."""
+    return registry.phone_formats() or DEFAULT_FORMATS
+
+_DIGITS = '0123456789'
+_TOKEN = re.compile(r'\(\?!(?P<ahead>[^)]*\)?)\)|\[(?P<cls>[^\]]+)\]|(?P<d>\\d)|(?P<lit>\d)|\{(?P<lo>\d+)(?:,(?P<hi>\d+))?\}|(?P<anchor>[\^$])')
+_plans = {}
+
+
+def _expand_class(body):
+    chars = []
+    i = 0
+    while i < len(body):
+        if i + 2 < len(body) and body[i + 1] == '-':
+            chars.extend(str(d) for d in range(int(body[i]), int(body[i + 2]) + 1))
+            i += 3
+        else:
+            chars.append(body[i])
+            i += 1
+    return ''.join(chars)
+
+
+def _parse_validator(pattern):
+    """Split a validator regex into digit atoms [charset, min, max] and lookaheads (atom index, literal)."""
+    atoms = []
+    lookaheads = []
+    pos = 0
+    while pos < len(pattern):
+        m = _TOKEN.match(pattern, pos)
+        if not m:
+            raise ValueError(f"Unsupported phone validator syntax: {pattern!r}")
+        pos = m.end()
+        if m.group('ahead') is not None:
+            literal = m.group('ahead').replace('(?:', '').replace(')', '')
+            lookaheads.append((len(atoms), literal))
+        elif m.group('cls'):
+            atoms.append([_expand_class(m.group('cls')), 1, 1])
+        elif m.group('d'):
+            atoms.append([_DIGITS, 1, 1])
+        elif m.group('lit'):
+            atoms.append([m.group('lit'), 1, 1])
+        elif m.group('lo'):
+            lo = int(m.group('lo'))
+            hi = int(m.group('hi')) if m.group('hi') else lo
+            atoms[-1][1:] = [lo, hi]
+    return atoms, lookaheads
+
+
+def _position_charsets(validator, needed):
+    if validator is None:
+        return [_DIGITS] * needed, []
+    atoms, lookaheads = _parse_validator(validator.pattern)
+    fixed = sum(lo for _, lo, _ in atoms)
+    extra = needed - fixed
+    charsets = []
+    starts = []
+    for charset, lo, hi in atoms:
+        starts.append(len(charsets))
+        count = lo + max(0, min(extra, hi - lo))
+        extra -= count - lo
+        charsets.extend([charset] * count)
+    starts.append(len(charsets))
+    if len(charsets) != needed:
+        return None, []
+    forbidden = [(starts[idx], literal) for idx, literal in lookaheads]
+    return charsets, forbidden
+
+
+def _compile_plan(fmt, validator):
+    """
+    Compile a format/validator pair into a sampling plan.
+
+    Returns (template, blocks): template has one '{}' per '#' in the format;
+    blocks are ('run', k) for k unconstrained digits, ('choice', options) for a
+    position or lookahead-constrained span listing only valid strings. Sampling
+    every block once always yields a valid number, so no retries are needed.
+    """
     needed = fmt.count('#')
-    country_code = COUNTRY_CODES[locale]
-    validator = VALIDATORS.get(locale)
-
-    for _ in range(max_attempts):
-        if locale == 'id_ID':
-            digits = ['8'] + [random.choice('0123456789') for _ in range(10)]
-            clean = ''.join(digits)
-            formatted = ''
-            digit_idx = 0
-            for char in fmt:
-                if char == '#':
-                    formatted += clean[digit_idx]
-                    digit_idx += 1
-                else:
-                    formatted += char
-            number_str = formatted
-        elif locale == 'en_GB':
-            digits = ['7'] + [random.choice('0123456789') for _ in range(9)]
-            clean = ''.join(digits)
-            formatted = ''
-            digit_idx = 0
-            for char in fmt:
-                if char == '#':
-                    formatted += clean[digit_idx]
-                    digit_idx += 1
-                else:
-                    formatted += char
-            number_str = formatted
+    charsets, forbidden = _position_charsets(validator, needed)
+    if charsets is None:
+        return None
+    span_end = {}
+    for start, literal in forbidden:
+        span_end[start] = max(span_end.get(start, start), start + len(literal))
+    blocks = []
+    pos = 0
+    while pos < needed:
+        if pos in span_end:
+            end = span_end[pos]
+            # Extend the span while later lookaheads overlap it
+            for start, literal in forbidden:
+                if pos <= start < end:
+                    end = max(end, start + len(literal))
+            end = min(end, needed)
+            options = ['']
+            for charset in charsets[pos:end]:
+                options = [o + ch for o in options for ch in charset]
+            bad = [(start - pos, literal) for start, literal in forbidden if pos <= start < end]
+            options = tuple(o for o in options if not any(o.startswith(lit, off) for off, lit in bad))
+            if not options:
+                return None
+            blocks.append(('choice', options))
+            pos = end
+        elif charsets[pos] == _DIGITS:
+            end = pos
+            while end < needed and charsets[end] == _DIGITS and end not in span_end:
+                end += 1
+            blocks.append(('run', end - pos))
+            pos = end
+        else:
+            blocks.append(('choice', tuple(charsets[pos])))
+            pos += 1
+    template = fmt.replace('{', '{{').replace('}', '}}').replace('#', '{}')
+    return template, tuple(blocks)
+
+
+def _plan_for(locale, fmt):
+    key = (locale, fmt)
+    plan = _plans.get(key)
+    if plan is None and key not in _plans:
+        plan = _plans[key] = _compile_plan(fmt, VALIDATORS.get(locale))
+    return plan
+
+
+def _locale_plan(locale):
+    fmt = DEFAULT_FORMATS.get(locale)
+    if fmt is None:
+        fmt = load_phone_formats().get(locale, '(###) ###-####')
+    plan = _plan_for(locale, fmt)
+    if plan is None:
+        raise ValueError(f"Phone format {fmt!r} cannot satisfy the {locale} validator")
+    template, blocks = plan
+    return f"+{COUNTRY_CODES[locale]} " + template, blocks
+
+
+def generate_phone(locale=None, max_attempts=500, rng=None):
+    """
+    Generate a phone number for a locale, formatted as '+<country code> <number>'.
+
+    Digits are drawn from a per-locale plan compiled once from DEFAULT_FORMATS
+    and VALIDATORS, so every draw is valid. max_attempts is kept for backward
+    compatibility and is no longer used.
+    """
+    rng = rng or random
+    if not locale or locale not in COUNTRY_CODES:
+        locale = rng.choice(list(COUNTRY_CODES))
+    template, blocks = _locale_plan(locale)
+
+    parts = []
+    for kind, arg in blocks:
+        if kind == 'run':
+            parts.append(f"{rng.randrange(10 ** arg):0{arg}d}")
         else:
-            digits = []
-            for char in fmt:
-                if char == '#':
-                    digits.append(random.choice('0123456789'))
-                else:
-                    digits.append(char)
-            number_str = ''.join(digits)
-            clean = re.sub(r'[^\d]', '', number_str)
+            parts.append(rng.choice(arg))
+    return template.format(*''.join(parts))
+
+
+def _phones_python(n, template, blocks, rng):
+    fill = template.format
+    runs = [(kind, arg, 10 ** arg if kind == 'run' else None) for kind, arg in blocks]
+    out = []
+    append = out.append
+    for _ in range(n):
+        parts = []
+        for kind, arg, limit in runs:
+            if kind == 'run':
+                parts.append(f"{rng.randrange(limit):0{arg}d}")
+            else:
+                parts.append(rng.choice(arg))
+        append(fill(*''.join(parts)))
+    return out
+
+
+def _phones_numpy(n, template, blocks, gen):
+    # Byte matrix of the rendered template; digit columns are overwritten in place
+    skeleton = template.replace('{{', '{').replace('}}', '}').replace('{}', '#')
+    rows = np.frombuffer(skeleton.encode('ascii'), dtype=np.uint8)
+    out = np.tile(rows, (n, 1))
+    slots = np.flatnonzero(rows == ord('#'))
+    col = 0
+    for kind, arg in blocks:
+        if kind == 'run':
+            out[:, slots[col:col + arg]] = gen.integers(48, 58, size=(n, arg), dtype=np.uint8)
+            col += arg
+        else:
+            width = len(arg[0])
+            options = np.frombuffer(''.join(arg).encode('ascii'), dtype=np.uint8).reshape(len(arg), width)
+            out[:, slots[col:col + width]] = options[gen.integers(0, len(arg), size=n)]
+            col += width
+    return out.view(f'S{len(skeleton)}').ravel().astype(str).tolist()
+
+
+def generate_phones(n, locale=None, rng=None, backend=None):
+    """
+    Generate ``n`` phone numbers at once, formatted exactly like ``generate_phone``.
+
+    With NumPy installed, every digit block of the locale's plan is drawn for
+    all rows in one array operation and written into a byte matrix of the
+    format, so there is no per-row Python work until the final str conversion.
+    Without NumPy the same plan is sampled in a tight Python loop.
+
+    Args:
+        n (int): Number of phone numbers.
+        locale (str): Locale code. If None, each row picks a random locale.
+        rng (random.Random): Optional random source. The NumPy backend seeds
+            its generator from it, so output is reproducible per backend.
+        backend (str): 'numpy', 'python', or None to use NumPy when available.
+    Returns:
+        list: List of formatted phone number strings.
+    """
+    if backend not in (None, 'numpy', 'python'):
+        raise ValueError("backend must be 'numpy', 'python' or None")
+    if backend == 'numpy' and np is None:
+        raise ValueError("backend='numpy' requires NumPy to be installed")
+    if n <= 0:
+        return []
+    r = rng or random
+    use_numpy = np is not None and backend != 'python'
 
-        if len(clean) != needed:
-            continue
+    if use_numpy:
+        gen = np.random.default_rng(r.getrandbits(64) if rng is not None else None)
 
-        if validator and not validator.fullmatch(clean):
-            continue
+    def batch(loc, count):
+        template, blocks = _locale_plan(loc)
+        if use_numpy:
+            return _phones_numpy(count, template, blocks, gen)
+        return _phones_python(count, template, blocks, r)
 
-        return f"+{country_code} {number_str}"
+    if locale and locale in COUNTRY_CODES:
+        return batch(locale, n)
 
-    print(f"DEBUG: Failed to generate valid number for {locale}. Format: {fmt}, Needed: {needed}, Attempts: {max_attempts}")
-    raise ValueError(f"Failed to generate valid number for {locale} after {max_attempts} attempts")
\ No newline at end of file
+    # Random locale per row: generate each locale's rows together, then scatter back
+    groups = {}
+    for i, loc in enumerate(r.choices(list(COUNTRY_CODES), k=n)):
+        groups.setdefault(loc, []).append(i)
+    result = [None] * n
+    for loc, index in groups.items():
+        for i, phone in zip(index, batch(loc, len(index))):
+            result[i] = phone
+    return result
@@ -0,0 +1,52 @@
+"""
+Field projection: work out which generator steps a subset of output fields needs.
+
+A record type describes, per output field, the generator steps that produce
+it, and per step the steps it reads from (email needs the person's name and
+age, a username needs the name, ...). Resolving the requested fields through
+that graph gives the set of steps to run; everything else is skipped.
+"""
+from __future__ import annotations
+
+from typing import FrozenSet, Iterable, Mapping, Sequence
+
+
+def resolve_steps(
+    fields: Iterable[str],
+    field_steps: Mapping[str, Sequence[str]],
+    requires: Mapping[str, Sequence[str]],
+) -> FrozenSet[str]:
+    """
+    Return the generator steps needed to produce ``fields``.
+
+    Args:
+        fields: Requested output fields (keys of ``field_steps``).
+        field_steps: Field -> steps whose output the field is built from.
+        requires: Step -> steps it depends on; followed transitively.
+    Returns:
+        frozenset: Every step that has to run, dependencies included.
+    """
+    needed = set()
+    pending = [step for field in fields for step in field_steps[field]]
+    while pending:
+        step = pending.pop()
+        if step not in needed:
+            needed.add(step)
+            pending.extend(requires.get(step, ()))
+    return frozenset(needed)
+
+
+def check_fields(fields, valid: Sequence[str], label: str):
+    """Validate a ``fields`` argument: None stays None, anything else becomes a tuple of known names."""
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = (fields,)
+    fields = tuple(fields)
+    unknown = [f for f in fields if f not in valid]
+    if unknown:
+        raise ValueError(f"Unknown {label} field(s): {', '.join(unknown)}. Valid fields: {', '.join(valid)}")
+    return fields
+
+
+__all__ = ["resolve_steps", "check_fields"]
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import io
+import json
+import os
 import random
+import time
 from datetime import date
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple, Union
 
 from .person import generate_person
 from .phone import generate_phone
@@ -16,9 +20,18 @@ from .career import (
     experience_level_from_years,
 )
 from .data_loader import load_cities, load_states, load_countries, load_streets
+from .projection import check_fields, resolve_steps
 
 
-__all__ = ["generate_resume"]
+RESUME_FORMATS = ("dict", "text")
+
+# Label and key of each skills group, in rendering order
+SKILL_GROUPS = (("Core", "core"), ("Secondary", "secondary"), ("Tools", "tools"), ("Soft", "soft"))
+
+_json_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str).encode
+
+__all__ = ["generate_resume", "generate_resumes", "render_resume", "write_resumes", "resume_steps",
+           "RESUME_FORMATS", "RESUME_FIELDS", "RESUME_SECTIONS", "RESUME_STEPS"]
 
 
 def _country_from_locale(locale: Optional[str]) -> Tuple[str, str]:
@@ -30,46 +43,64 @@ def _country_from_locale(locale: Optional[str]) -> Tuple[str, str]:
     return (cc, countries.get(cc, cc))
 
 
-def _location_for(locale: Optional[str]) -> Dict[str, str]:
-    loc = locale or "en_US"
-    cities = load_cities()
-    states = load_states()
-    city_list = cities.get(loc) or cities.get("default", ["Metropolis"]) 
-    state_list = states.get(loc) or states.get("default", ["State"]) 
-    city = random.choice(city_list) if city_list else "Metropolis"
-    state = random.choice(state_list) if state_list else "State"
-    cc, country_name = _country_from_locale(loc)
-    return {"city": city, "state": state, "country_code": cc, "country": country_name, "locale": loc}
+class _LocaleTables:
+    """Per-locale lookups of a resume (places, country, languages), resolved once per batch."""
+
+    __slots__ = ("locale", "cities", "states", "streets", "country_code", "country", "languages")
+
+    def __init__(self, locale: str):
+        cities = load_cities()
+        states = load_states()
+        streets = load_streets()
+        self.locale = locale
+        self.cities = cities.get(locale) or cities.get("default", ["Metropolis"])
+        self.states = states.get(locale) or states.get("default", ["State"])
+        self.streets = streets.get(locale) or streets.get("default", ["Main Street"])
+        self.country_code, self.country = _country_from_locale(locale)
+        self.languages = LANG_BY_LOCALE.get(locale, ["English"])
+
+
+def _location_from(tables: _LocaleTables, rng=random) -> Dict[str, str]:
+    city = rng.choice(tables.cities) if tables.cities else "Metropolis"
+    state = rng.choice(tables.states) if tables.states else "State"
+    return {"city": city, "state": state, "country_code": tables.country_code, "country": tables.country,
+            "locale": tables.locale}
 
 
-def _postal_code_for(locale: str) -> str:
+def _location_for(locale: Optional[str], rng=random) -> Dict[str, str]:
+    return _location_from(_LocaleTables(locale or "en_US"), rng)
+
+
+def _postal_code_for(locale: str, rng=random) -> str:
     cc, _ = _country_from_locale(locale)
+    return _postal_code(cc, rng)
+
+
+def _postal_code(cc: str, rng=random) -> str:
     if cc == "US":
-        base = f"{random.randint(10000, 99999)}"
-        return base if random.random() < 0.7 else f"{base}-{random.randint(1000,9999):04d}"
+        base = f"{rng.randint(10000, 99999)}"
+        return base if rng.random() < 0.7 else f"{base}-{rng.randint(1000,9999):04d}"
     if cc == "GB":
         # Roughly shaped like UK postcodes; not guaranteed valid but looks realistic
-        outcode = f"{random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}{random.randint(1,9)}{random.choice(['',''+random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')])}"
-        incode = f"{random.randint(1,9)}{random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}{random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}"
+        outcode = f"{rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}{rng.randint(1,9)}{rng.choice(['',''+rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')])}"
+        incode = f"{rng.randint(1,9)}{rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}{rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}"
         return f"{outcode} {incode}"
     if cc == "DE" or cc == "FR":
-        return f"{random.randint(10000, 99999)}"
+        return f"{rng.randint(10000, 99999)}"
     if cc == "JP":
-        return f"{random.randint(100, 999)}-{random.randint(1000, 9999)}"
+        return f"{rng.randint(100, 999)}-{rng.randint(1000, 9999)}"
     if cc == "CN":
-        return f"{random.randint(100000, 999999)}"
+        return f"{rng.randint(100000, 999999)}"
     if cc == "BR":
-        return f"{random.randint(10000, 99999)}-{random.randint(100, 999)}"
-    return f"{random.randint(10000, 99999)}"
+        return f"{rng.randint(10000, 99999)}-{rng.randint(100, 999)}"
+    return f"{rng.randint(10000, 99999)}"
 
 
-def _address_for(locale: str, location: Dict[str, str]) -> Dict[str, str]:
-    streets = load_streets()
-    choices = streets.get(locale) or streets.get("default", ["Main Street"]) 
-    street_name = random.choice(choices)
-    house_no = random.randint(10, 9999)
-    unit = f"Apt {random.randint(1, 999)}" if random.random() < 0.25 else ""
-    postal = _postal_code_for(locale)
+def _address_from(tables: _LocaleTables, location: Dict[str, str], rng=random) -> Dict[str, str]:
+    street_name = rng.choice(tables.streets)
+    house_no = rng.randint(10, 9999)
+    unit = f"Apt {rng.randint(1, 999)}" if rng.random() < 0.25 else ""
+    postal = _postal_code(tables.country_code, rng)
     return {
         "line1": f"{house_no} {street_name}",
         "line2": unit,
@@ -80,6 +111,10 @@ def _address_for(locale: str, location: Dict[str, str]) -> Dict[str, str]:
     }
 
 
+def _address_for(locale: str, location: Dict[str, str], rng=random) -> Dict[str, str]:
+    return _address_from(_LocaleTables(locale), location, rng)
+
+
 def _pick_degree_track(family: Optional[str]) -> Tuple[str, List[str]]:
     fam = family or "software_engineer"
     fam_l = fam.lower()
@@ -214,48 +249,62 @@ TOOLS_BY_FAMILY = {
 }
 
 
-def _bullets_for_role(family: str, skills: List[str]) -> List[str]:
-    verbs = [
-        "Led", "Designed", "Implemented", "Optimized", "Automated", "Migrated",
-        "Refactored", "Built", "Architected", "Improved", "Reduced",
-    ]
-    impacts = [
-        "performance by {x}%", "latency by {x}%", "costs by {x}%",
-        "deployment time by {x}%", "incident rate by {x}%", "defects by {x}%",
-        "test coverage to {x}%", "uptime to {x}%",
-    ]
-    objs = [
-        "microservices", "data pipelines", "CI/CD", "monitoring dashboards",
-        "APIs", "ETL workflows", "feature flags", "Kubernetes clusters",
-        "design systems", "experiments", "risk controls",
-    ]
+BULLET_VERBS = (
+    "Led", "Designed", "Implemented", "Optimized", "Automated", "Migrated",
+    "Refactored", "Built", "Architected", "Improved", "Reduced",
+)
+
+BULLET_IMPACTS = (
+    "performance by {x}%", "latency by {x}%", "costs by {x}%",
+    "deployment time by {x}%", "incident rate by {x}%", "defects by {x}%",
+    "test coverage to {x}%", "uptime to {x}%",
+)
+
+BULLET_OBJECTS = (
+    "microservices", "data pipelines", "CI/CD", "monitoring dashboards",
+    "APIs", "ETL workflows", "feature flags", "Kubernetes clusters",
+    "design systems", "experiments", "risk controls",
+)
+
+PROJECT_PREFIXES = ("Aurora", "Nimbus", "Atlas", "Echo", "Vertex", "Quantum", "Orion", "Harbor")
+
+PROJECT_OUTCOMES = (
+    "reduced costs by {x}%",
+    "improved performance by {x}%",
+    "cut deployment time by {x}%",
+    "increased retention by {x}%",
+)
+
+COURSEWORK = (
+    "Algorithms", "Distributed Systems", "Databases", "Operating Systems",
+    "Machine Learning", "Statistics", "Networks", "Cloud Computing",
+)
+
+CERT_ISSUERS = ("AWS", "Microsoft", "Google", "CNCF", "PMI", "Scrum.org")
+
+
+def _bullets_for_role(family: str, skills: List[str], rng=random) -> List[str]:
     bullets: List[str] = []
-    for _ in range(random.randint(3, 6)):
-        v = random.choice(verbs)
-        imp = random.choice(impacts).format(x=random.randint(10, 80))
-        obj = random.choice(objs)
-        tech = random.choice(skills) if skills else "Python"
+    for _ in range(rng.randint(3, 6)):
+        v = rng.choice(BULLET_VERBS)
+        imp = rng.choice(BULLET_IMPACTS).format(x=rng.randint(10, 80))
+        obj = rng.choice(BULLET_OBJECTS)
+        tech = rng.choice(skills) if skills else "Python"
         bullets.append(f"{v} {obj} using {tech}, improving {imp}.")
     return bullets
 
 
-def _project_snippets(skills: List[str]) -> List[Dict[str, str]]:
-    prefixes = ["Aurora", "Nimbus", "Atlas", "Echo", "Vertex", "Quantum", "Orion", "Harbor"]
+def _project_snippets(skills: List[str], rng=random) -> List[Dict[str, str]]:
     out = []
-    for _ in range(random.randint(2, 4)):
-        name = f"Project {random.choice(prefixes)}"
-        tech_list = random.sample(skills, k=min(len(skills), random.randint(2, 5))) if skills else ["Python"]
+    for _ in range(rng.randint(2, 4)):
+        name = f"Project {rng.choice(PROJECT_PREFIXES)}"
+        tech_list = rng.sample(skills, k=min(len(skills), rng.randint(2, 5))) if skills else ["Python"]
         tech = ", ".join(tech_list)
-        outcome = random.choice([
-            "reduced costs by {x}%",
-            "improved performance by {x}%",
-            "cut deployment time by {x}%",
-            "increased retention by {x}%",
-        ]).format(x=random.randint(10, 60))
-        desc = f"Built a {random.choice(['scalable','secure','high-availability','real-time'])} system using {tech}; {outcome}."
+        outcome = rng.choice(PROJECT_OUTCOMES).format(x=rng.randint(10, 60))
+        desc = f"Built a {rng.choice(['scalable','secure','high-availability','real-time'])} system using {tech}; {outcome}."
         out.append({
             "name": name,
-            "role": random.choice(["Lead Engineer", "Engineer", "Contributor", "Owner"]),
+            "role": rng.choice(["Lead Engineer", "Engineer", "Contributor", "Owner"]),
             "description": desc,
             "technologies": tech_list,
         })
@@ -269,303 +318,747 @@ def _summarize(years: int, title: str, skills: List[str]) -> str:
     )
 
 
-def _to_text(cv: Dict[str, Union[str, dict, list]]) -> str:
+# Section writers. Each takes the CV and the stream's bound ``write``; a
+# format is a fixed tuple of them (RESUME_SECTIONS), built once at import, so
+# rendering writes each line straight to the stream without a per-resume
+# list of lines or a final join.
+
+def _text_header(cv, write) -> None:
     p = cv["personal"]
-    lines: List[str] = []
-    lines.append(f"{p['first_name']} {p['last_name']} — {cv['headline']}")
-    lines.append(f"{p['email']} | {p['phone']} | {p['location']['city']}, {p['location']['state']} {p['location']['country']}")
+    loc = p["location"]
+    write(f"{p['first_name']} {p['last_name']} — {cv['headline']}\n")
+    write(f"{p['email']} | {p['phone']} | {loc['city']}, {loc['state']} {loc['country']}\n")
     addr = cv.get("address")
     if addr:
         line2 = f", {addr['line2']}" if addr.get('line2') else ""
-        lines.append(f"Address: {addr['line1']}{line2}, {addr['city']}, {addr['state']} {addr['postal_code']} {addr['country']}")
+        write(f"Address: {addr['line1']}{line2}, {addr['city']}, {addr['state']} {addr['postal_code']} {addr['country']}\n")
     handles = cv.get("online_presence", {})
     if handles.get("linkedin") or handles.get("github"):
         ln = []
         if handles.get("linkedin"): ln.append(f"LinkedIn: {handles['linkedin']}")
         if handles.get("github"): ln.append(f"GitHub: {handles['github']}")
         if handles.get("website"): ln.append(f"Web: {handles['website']}")
-        lines.append(" | ".join(ln))
-    lines.append("")
-    lines.append("Summary")
-    lines.append(cv["summary"])
-    if cv.get("summary_highlights"):
-        for h in cv["summary_highlights"]:
-            lines.append(f" - {h}")
-    lines.append("")
-    lines.append("Skills")
-    core = ", ".join(cv["skills"].get("core", []))
-    secondary = ", ".join(cv["skills"].get("secondary", []))
-    tools = ", ".join(cv["skills"].get("tools", []))
-    soft = ", ".join(cv["skills"].get("soft", []))
-    if core:
-        lines.append(f"Core: {core}")
-    if secondary:
-        lines.append(f"Secondary: {secondary}")
-    if tools:
-        lines.append(f"Tools: {tools}")
-    if soft:
-        lines.append(f"Soft: {soft}")
-    lines.append("")
-    lines.append("Experience")
+        write(" | ".join(ln) + "\n")
+
+
+def _text_summary(cv, write) -> None:
+    write(f"\nSummary\n{cv['summary']}\n")
+    for h in cv.get("summary_highlights") or ():
+        write(f" - {h}\n")
+
+
+def _text_skills(cv, write) -> None:
+    write("\nSkills\n")
+    skills = cv["skills"]
+    for label, key in SKILL_GROUPS:
+        values = skills.get(key)
+        if values:
+            write(f"{label}: {', '.join(values)}\n")
+
+
+def _text_experience(cv, write) -> None:
+    write("\nExperience\n")
     for r in cv["experience"]:
-        lines.append(f"{r['title']} — {r['company']} ({r['start_date']} to {r['end_date']})")
+        write(f"{r['title']} — {r['company']} ({r['start_date']} to {r['end_date']})\n")
         for b in r.get("responsibilities", []):
-            lines.append(f" - {b}")
+            write(f" - {b}\n")
+
+
+def _text_volunteer(cv, write) -> None:
     if cv.get("volunteer"):
-        lines.append("")
-        lines.append("Volunteer Experience")
+        write("\nVolunteer Experience\n")
         for v in cv["volunteer"]:
-            lines.append(f"{v['role']} — {v['organization']} ({v['start_date']} to {v['end_date']})")
-            if v.get("highlights"):
-                for b in v["highlights"]:
-                    lines.append(f" - {b}")
+            write(f"{v['role']} — {v['organization']} ({v['start_date']} to {v['end_date']})\n")
+            for b in v.get("highlights") or ():
+                write(f" - {b}\n")
+
+
+def _text_projects(cv, write) -> None:
     if cv.get("projects"):
-        lines.append("")
-        lines.append("Projects")
+        write("\nProjects\n")
         for pr in cv["projects"]:
-            lines.append(f"{pr['name']} ({pr.get('role','')}) — {', '.join(pr.get('technologies', []))}")
-            lines.append(f"  {pr['description']}")
+            write(f"{pr['name']} ({pr.get('role','')}) — {', '.join(pr.get('technologies', []))}\n")
+            write(f"  {pr['description']}\n")
+
+
+def _education_extra(ed) -> str:
+    extra = []
+    if ed.get("gpa"):
+        extra.append(f"GPA {ed['gpa']}")
+    if ed.get("coursework"):
+        extra.append("Coursework: " + ", ".join(ed["coursework"]))
+    return f" — {'; '.join(extra)}" if extra else ""
+
+
+def _text_education(cv, write) -> None:
     if cv.get("education"):
-        lines.append("")
-        lines.append("Education")
+        write("\nEducation\n")
         for ed in cv["education"]:
-            extra = []
-            if ed.get("gpa"):
-                extra.append(f"GPA {ed['gpa']}")
-            if ed.get("coursework"):
-                extra.append("Coursework: " + ", ".join(ed["coursework"]))
-            extra_str = f" — {'; '.join(extra)}" if extra else ""
-            lines.append(f"{ed['degree']} — {ed['institution']} ({ed['year']}){extra_str}")
+            write(f"{ed['degree']} — {ed['institution']} ({ed['year']}){_education_extra(ed)}\n")
+
+
+def _certification_line(c) -> str:
+    issuer = f" ({c['issuer']})" if isinstance(c, dict) and c.get('issuer') else ""
+    when = f", {c['year']}" if isinstance(c, dict) and c.get('year') else ""
+    name = c["name"] if isinstance(c, dict) else str(c)
+    return f"{name}{issuer}{when}"
+
+
+def _text_certifications(cv, write) -> None:
     if cv.get("certifications"):
-        lines.append("")
-        lines.append("Certifications")
+        write("\nCertifications\n")
         for c in cv["certifications"]:
-            issuer = f" ({c['issuer']})" if isinstance(c, dict) and c.get('issuer') else ""
-            when = f", {c['year']}" if isinstance(c, dict) and c.get('year') else ""
-            name = c["name"] if isinstance(c, dict) else str(c)
-            lines.append(f"- {name}{issuer}{when}")
-    if cv.get("languages"):
-        lines.append("")
-        if isinstance(cv["languages"], list) and cv["languages"] and isinstance(cv["languages"][0], dict):
-            lines.append("Languages:")
-            for lang in cv["languages"]:
-                lines.append(f" - {lang['language']} ({lang.get('proficiency','')})")
+            write(f"- {_certification_line(c)}\n")
+
+
+def _text_languages(cv, write) -> None:
+    languages = cv.get("languages")
+    if languages:
+        if isinstance(languages, list) and isinstance(languages[0], dict):
+            write("\nLanguages:\n")
+            for lang in languages:
+                write(f" - {lang['language']} ({lang.get('proficiency','')})\n")
         else:
-            lines.append("Languages: " + ", ".join(cv["languages"]))
+            write("\nLanguages: " + ", ".join(languages) + "\n")
     if cv.get("interests"):
-        lines.append("Interests: " + ", ".join(cv["interests"]))
+        write("Interests: " + ", ".join(cv["interests"]) + "\n")
+
+
+def _text_extras(cv, write) -> None:
     if cv.get("publications"):
-        lines.append("")
-        lines.append("Publications")
+        write("\nPublications\n")
         for pub in cv["publications"]:
-            lines.append(f"- {pub['title']} ({pub['venue']}, {pub['year']})")
+            write(f"- {pub['title']} ({pub['venue']}, {pub['year']})\n")
     if cv.get("awards"):
-        lines.append("")
-        lines.append("Awards")
+        write("\nAwards\n")
         for a in cv["awards"]:
-            lines.append(f"- {a['name']} ({a['year']})")
+            write(f"- {a['name']} ({a['year']})\n")
     if cv.get("references"):
-        lines.append("")
-        lines.append("References")
+        write("\nReferences\n")
         for r in cv["references"]:
-            lines.append(f"- {r['name']}, {r['title']} at {r['company']} — {r['email']} | {r['phone']}")
-    return "\n".join(lines)
+            write(f"- {r['name']}, {r['title']} at {r['company']} — {r['email']} | {r['phone']}\n")
 
 
-def generate_resume(
-    locale: Optional[str] = None,
-    family: Optional[str] = None,
-    years: int = 8,
-    format: str = "dict",
-) -> Union[Dict[str, Union[str, dict, list]], str]:
+def _md_header(cv, write) -> None:
+    p = cv["personal"]
+    loc = p["location"]
+    write(f"# {p['first_name']} {p['last_name']}\n\n**{cv['headline']}**\n\n")
+    write(f"{p['email']} · {p['phone']} · {loc['city']}, {loc['state']} {loc['country']}\n")
+    addr = cv.get("address")
+    if addr:
+        line2 = f", {addr['line2']}" if addr.get('line2') else ""
+        write(f"\n{addr['line1']}{line2}, {addr['city']}, {addr['state']} {addr['postal_code']} {addr['country']}\n")
+    handles = cv.get("online_presence", {})
+    links = []
+    for label, key in (("LinkedIn", "linkedin"), ("GitHub", "github"), ("Web", "website")):
+        value = handles.get(key)
+        if value:
+            # Handles are bare usernames; only real URLs become links
+            links.append(f"[{label}]({value})" if value.startswith(("http://", "https://")) else f"{label}: {value}")
+    if links:
+        write("\n" + " · ".join(links) + "\n")
+
+
+def _md_summary(cv, write) -> None:
+    write(f"\n## Summary\n\n{cv['summary']}\n")
+    highlights = cv.get("summary_highlights")
+    if highlights:
+        write("\n")
+        for h in highlights:
+            write(f"- {h}\n")
+
+
+def _md_skills(cv, write) -> None:
+    write("\n## Skills\n\n")
+    skills = cv["skills"]
+    for label, key in SKILL_GROUPS:
+        values = skills.get(key)
+        if values:
+            write(f"- **{label}:** {', '.join(values)}\n")
+
+
+def _md_experience(cv, write) -> None:
+    write("\n## Experience\n")
+    for r in cv["experience"]:
+        write(f"\n### {r['title']} — {r['company']}\n\n*{r['start_date']} to {r['end_date']}*\n\n")
+        for b in r.get("responsibilities", []):
+            write(f"- {b}\n")
+    if cv.get("volunteer"):
+        write("\n## Volunteer Experience\n")
+        for v in cv["volunteer"]:
+            write(f"\n### {v['role']} — {v['organization']}\n\n*{v['start_date']} to {v['end_date']}*\n")
+            highlights = v.get("highlights")
+            if highlights:
+                write("\n")
+                for b in highlights:
+                    write(f"- {b}\n")
+
+
+def _md_projects(cv, write) -> None:
+    if cv.get("projects"):
+        write("\n## Projects\n\n")
+        for pr in cv["projects"]:
+            write(f"- **{pr['name']}** ({pr.get('role','')}) — {', '.join(pr.get('technologies', []))}  \n")
+            write(f"  {pr['description']}\n")
+
+
+def _md_education(cv, write) -> None:
+    if cv.get("education"):
+        write("\n## Education\n\n")
+        for ed in cv["education"]:
+            write(f"- {ed['degree']} — {ed['institution']} ({ed['year']}){_education_extra(ed)}\n")
+    if cv.get("certifications"):
+        write("\n## Certifications\n\n")
+        for c in cv["certifications"]:
+            write(f"- {_certification_line(c)}\n")
+
+
+def _md_languages(cv, write) -> None:
+    languages = cv.get("languages")
+    if languages:
+        write("\n## Languages\n\n")
+        for lang in languages:
+            if isinstance(lang, dict):
+                write(f"- {lang['language']} ({lang.get('proficiency','')})\n")
+            else:
+                write(f"- {lang}\n")
+    if cv.get("interests"):
+        write("\n**Interests:** " + ", ".join(cv["interests"]) + "\n")
+
+
+def _md_extras(cv, write) -> None:
+    if cv.get("publications"):
+        write("\n## Publications\n\n")
+        for pub in cv["publications"]:
+            write(f"- *{pub['title']}* ({pub['venue']}, {pub['year']})\n")
+    if cv.get("awards"):
+        write("\n## Awards\n\n")
+        for a in cv["awards"]:
+            write(f"- {a['name']} ({a['year']})\n")
+    if cv.get("references"):
+        write("\n## References\n\n")
+        for r in cv["references"]:
+            write(f"- {r['name']}, {r['title']} at {r['company']} — {r['email']} · {r['phone']}\n")
+
+
+def _json_section(cv, write) -> None:
+    write(_json_encode(cv))
+    write("\n")
+
+
+RESUME_SECTIONS = {
+    "text": (_text_header, _text_summary, _text_skills, _text_experience, _text_volunteer, _text_projects,
+             _text_education, _text_certifications, _text_languages, _text_extras),
+    "markdown": (_md_header, _md_summary, _md_skills, _md_experience, _md_projects, _md_education,
+                 _md_languages, _md_extras),
+    "json": (_json_section,),
+}
+
+# Written between consecutive resumes by write_resumes (JSON is one object per line)
+RESUME_SEPARATORS = {"text": "\n" + "=" * 72 + "\n\n", "markdown": "\n---\n\n", "json": ""}
+
+
+def render_resume(cv: Dict[str, Union[str, dict, list]], out: TextIO, format: str = "text") -> None:
     """
-    Build a realistic Resume/CV from core generators.
+    Write one resume to a text stream, section by section.
 
     Args:
-        locale: e.g., 'en_US'. Affects names, phone, location hints.
-        family: job family bias (e.g., 'software_engineer'). If None, random.
-        years: employment history window in years.
-        format: 'dict' (default) for structured object, or 'text' for pretty text.
-
-    Returns:
-        dict or text string depending on 'format'.
+        cv: A resume dict from generate_resume / generate_resumes.
+        out: Any object with a ``write(str)`` method, e.g. an open text file.
+        format: 'text' (the layout of generate_resume(format='text')),
+            'markdown', or 'json' (one line).
     """
-    loc = locale or "en_US"
+    sections = RESUME_SECTIONS.get(format)
+    if sections is None:
+        raise ValueError(f"format must be one of {', '.join(RESUME_SECTIONS)}")
+    write = out.write
+    for section in sections:
+        section(cv, write)
+
+
+def _to_text(cv: Dict[str, Union[str, dict, list]]) -> str:
+    buffer = io.StringIO()
+    render_resume(cv, buffer)
+    return buffer.getvalue()[:-1]
+
+
+# Generator steps, in the order they draw from the rng
+RESUME_STEPS = (
+    "person", "email", "phone", "location", "address", "online", "job", "core_skills", "secondary", "history",
+    "responsibilities", "education", "certifications", "projects", "languages", "interests", "salary",
+    "highlights", "tools", "soft", "volunteer", "publications", "awards", "references", "availability",
+)
+
+# Resume field -> generator steps it is built from
+RESUME_FIELD_STEPS = {
+    "personal": ("person", "email", "phone", "location"),
+    "address": ("address",),
+    "headline": ("job",),
+    "summary": ("core_skills",),
+    "summary_highlights": ("highlights",),
+    "experience": ("responsibilities",),
+    "skills": ("core_skills", "secondary", "tools", "soft"),
+    "projects": ("projects",),
+    "education": ("education",),
+    "certifications": ("certifications",),
+    "languages": ("languages",),
+    "interests": ("interests",),
+    "publications": ("publications",),
+    "awards": ("awards",),
+    "volunteer": ("volunteer",),
+    "references": ("references",),
+    "online_presence": ("person", "online"),
+    "salary_expectation": ("salary",),
+    "meta": ("job", "history", "location", "availability"),
+}
+
+RESUME_FIELDS = tuple(RESUME_FIELD_STEPS)
+
+# Step -> steps it reads from
+_RESUME_REQUIRES = {
+    "email": ("person",),
+    "address": ("location",),
+    "online": ("person",),
+    "core_skills": ("job",),
+    "secondary": ("core_skills",),
+    "history": ("job",),
+    "responsibilities": ("history", "core_skills"),
+    "education": ("job",),
+    "certifications": ("job",),
+    "projects": ("core_skills",),
+    "salary": ("job",),
+    "tools": ("job",),
+    "publications": ("person",),
+    "references": ("person", "phone", "history"),
+}
+
+_ALL_RESUME_STEPS = frozenset(RESUME_STEPS)
+
+
+def resume_steps(fields: Optional[Tuple[str, ...]] = None) -> frozenset:
+    """Generator steps (see RESUME_STEPS) needed to produce ``fields``; all of them when None."""
+    if fields is None:
+        return _ALL_RESUME_STEPS
+    return resolve_steps(fields, RESUME_FIELD_STEPS, _RESUME_REQUIRES)
+
+
+class _FamilyTables:
+    """Per-family lookups of a resume (degree track, certifications, tools), resolved once per batch."""
+
+    __slots__ = ("track", "degrees", "cert_names", "tools")
+
+    def __init__(self, family: str):
+        self.track, self.degrees = _pick_degree_track(family)
+        self.cert_names = CERTS_BY_TRACK.get(self.track, CERTS_BY_TRACK["General"])
+        self.tools = TOOLS_BY_FAMILY.get(family, TOOLS_BY_FAMILY.get("software_engineer", []))
+
+
+def _build_resume(
+    tables: _LocaleTables,
+    family: Optional[str],
+    years: int,
+    today: date,
+    family_tables: Dict[str, _FamilyTables],
+    rng,
+    fields: Optional[Tuple[str, ...]] = None,
+    steps: frozenset = _ALL_RESUME_STEPS,
+) -> Dict[str, Union[str, dict, list]]:
+    # Steps not in ``steps`` are skipped without drawing from the rng; their values stay None
+    loc = tables.locale
+    first_name = last_name = person = email = phone = location = address = online = website = None
+    fam = lvl = title = ft = core_skills = secondary_skills = history = None
+    education = certs = projects = languages = interests = salary = summary_highlights = None
+    tools = soft = volunteer = publications = awards = references = None
 
     # Person & contact
-    person = generate_person(loc)
-    first_name, last_name = person["first_name"], person["last_name"]
-    email = generate_email(first_name, last_name, loc)
-    phone = generate_phone(loc)
-    location = _location_for(loc)
-    address = _address_for(loc, location)
-    online = generate_online_presence(first_name, last_name, loc)
-    linkedin = online["social_media"].get("linkedin")
-    github = online["social_media"].get("github")
-    website = f"https://www.{last_name.lower()}-{first_name.lower()}.com"
+    if "person" in steps:
+        person = generate_person(loc, rng=rng)
+        first_name, last_name = person["first_name"], person["last_name"]
+        website = f"https://www.{last_name.lower()}-{first_name.lower()}.com"
+    if "email" in steps:
+        email = generate_email(first_name, last_name, loc, rng=rng)
+    if "phone" in steps:
+        phone = generate_phone(loc, rng=rng)
+    if "location" in steps:
+        location = _location_from(tables, rng)
+    if "address" in steps:
+        address = _address_from(tables, location, rng)
+    if "online" in steps:
+        online = generate_online_presence(first_name, last_name, loc, rng=rng)
 
     # Career details
     # Seed a primary job title to bias skills
-    jt = generate_job_title(locale=loc, family=family)
-    fam = jt["family"]
-    lvl = jt["level"]
-    title = jt["title"]
-    core_skills = generate_skills(fam, level=lvl)
-    # Secondary/related skills from a different random family
-    other_fam = generate_job_title(locale=loc, family=None)["family"]
-    secondary_skills_set = set(generate_skills(other_fam)) - set(core_skills)
-    secondary_skills = list(secondary_skills_set)[:max(3, min(6, len(core_skills)))] if core_skills else []
+    if "job" in steps:
+        jt = generate_job_title(locale=loc, family=family, rng=rng)
+        fam = jt["family"]
+        lvl = jt["level"]
+        title = jt["title"]
+        ft = family_tables.get(fam)
+        if ft is None:
+            ft = family_tables[fam] = _FamilyTables(fam)
+    if "core_skills" in steps:
+        core_skills = generate_skills(fam, level=lvl, rng=rng)
+    if "secondary" in steps:
+        # Secondary/related skills from a different random family
+        other_fam = generate_job_title(locale=loc, family=None, rng=rng)["family"]
+        # Keep draw order (not set order) so seeded output does not depend on string hashing
+        core_set = set(core_skills)
+        secondary_pool = [s for s in generate_skills(other_fam, rng=rng) if s not in core_set]
+        secondary_skills = secondary_pool[:max(3, min(6, len(core_skills)))] if core_skills else []
 
     # Employment history enriched with responsibilities
-    history = generate_employment_history(years=years, locale=loc, family=fam)
-    for role in history:
-        role["responsibilities"] = _bullets_for_role(fam, core_skills)
+    if "history" in steps:
+        history = generate_employment_history(years=years, locale=loc, family=fam, rng=rng)
+    if "responsibilities" in steps:
+        for role in history:
+            role["responsibilities"] = _bullets_for_role(fam, core_skills, rng)
 
     # Education & certifications inferred by track
-    track, degrees = _pick_degree_track(fam)
-    grad_year = date.today().year - max(3, years - random.randint(0, 3))
-    education = [
-        {
-            "degree": random.choice(degrees),
-            "institution": random.choice(INSTITUTIONS),
-            "year": grad_year,
-            "gpa": round(random.uniform(3.2, 4.0), 2) if random.random() < 0.5 else None,
-            "coursework": random.sample(
-                [
-                    "Algorithms", "Distributed Systems", "Databases", "Operating Systems",
-                    "Machine Learning", "Statistics", "Networks", "Cloud Computing",
-                ], k=random.randint(2, 5)
-            ),
-        }
-    ]
-    cert_names = CERTS_BY_TRACK.get(track, CERTS_BY_TRACK["General"])
-    certs = [
-        {
-            "name": name,
-            "issuer": random.choice(["AWS", "Microsoft", "Google", "CNCF", "PMI", "Scrum.org"]),
-            "year": date.today().year - random.randint(0, 5),
-        }
-        for name in random.sample(cert_names, k=random.randint(0, min(3, len(cert_names))))
-    ]
+    if "education" in steps:
+        grad_year = today.year - max(3, years - rng.randint(0, 3))
+        education = [
+            {
+                "degree": rng.choice(ft.degrees),
+                "institution": rng.choice(INSTITUTIONS),
+                "year": grad_year,
+                "gpa": round(rng.uniform(3.2, 4.0), 2) if rng.random() < 0.5 else None,
+                "coursework": rng.sample(COURSEWORK, k=rng.randint(2, 5)),
+            }
+        ]
+    if "certifications" in steps:
+        cert_names = ft.cert_names
+        certs = [
+            {
+                "name": name,
+                "issuer": rng.choice(CERT_ISSUERS),
+                "year": today.year - rng.randint(0, 5),
+            }
+            for name in rng.sample(cert_names, k=rng.randint(0, min(3, len(cert_names))))
+        ]
 
     # Projects derived from skills
-    projects = _project_snippets(core_skills)
+    if "projects" in steps:
+        projects = _project_snippets(core_skills, rng)
 
     # Languages with proficiency & interests
-    base_langs = LANG_BY_LOCALE.get(loc, ["English"]) 
-    profs = ["Native", "Fluent", "Professional", "Intermediate", "Basic"]
-    languages = [
-        {"language": base_langs[0], "proficiency": random.choice(["Native", "Fluent"])},
-    ]
-    for lang in base_langs[1:]:
-        languages.append({"language": lang, "proficiency": random.choice(profs[2:])})
-    interests = random.sample(INTERESTS, k=random.randint(2, 5))
+    if "languages" in steps:
+        base_langs = tables.languages
+        profs = ["Native", "Fluent", "Professional", "Intermediate", "Basic"]
+        languages = [
+            {"language": base_langs[0], "proficiency": rng.choice(["Native", "Fluent"])},
+        ]
+        for lang in base_langs[1:]:
+            languages.append({"language": lang, "proficiency": rng.choice(profs[2:])})
+    if "interests" in steps:
+        interests = rng.sample(INTERESTS, k=rng.randint(2, 5))
 
     # Salary expectation aligned with family/level (informational)
-    salary = generate_salary(locale=loc, family=fam, level=lvl, title=title)
+    if "salary" in steps:
+        salary = generate_salary(locale=loc, family=fam, level=lvl, title=title, rng=rng)
 
     # Headline and summary
-    headline = f"{lvl} {title}" if lvl not in title else title
-    summary = _summarize(years, title, core_skills)
-    summary_highlights = [
-        f"Delivered {random.randint(3,10)}+ projects from design to production",
-        f"Mentored {random.randint(2,8)} engineers across teams",
-        f"Partnered with Product/Design to drive roadmap and outcomes",
-    ]
+    if "highlights" in steps:
+        summary_highlights = [
+            f"Delivered {rng.randint(3,10)}+ projects from design to production",
+            f"Mentored {rng.randint(2,8)} engineers across teams",
+            f"Partnered with Product/Design to drive roadmap and outcomes",
+        ]
     # Skills enrichments
-    tools = TOOLS_BY_FAMILY.get(fam, TOOLS_BY_FAMILY.get("software_engineer", []))
-    tools = random.sample(tools, k=min(len(tools), random.randint(3, len(tools)))) if tools else []
-    soft = random.sample(SOFT_SKILLS, k=random.randint(3, 6))
+    if "tools" in steps:
+        tools = ft.tools
+        tools = rng.sample(tools, k=min(len(tools), rng.randint(3, len(tools)))) if tools else []
+    if "soft" in steps:
+        soft = rng.sample(SOFT_SKILLS, k=rng.randint(3, 6))
 
     # Volunteer
-    volunteer = []
-    if random.random() < 0.6:
-        volunteer.append({
-            "organization": random.choice(["Code for Good", "Local Food Bank", "Open Source Collective", "STEM Mentors"]),
-            "role": random.choice(["Volunteer Developer", "Mentor", "Organizer", "Contributor"]),
-            "start_date": f"{date.today().year - random.randint(1, 4)}-01-01",
-            "end_date": "Present",
-            "highlights": [
-                "Built internal tools to streamline operations",
-                "Mentored students on projects and career guidance",
-            ],
-        })
+    if "volunteer" in steps:
+        volunteer = []
+        if rng.random() < 0.6:
+            volunteer.append({
+                "organization": rng.choice(["Code for Good", "Local Food Bank", "Open Source Collective", "STEM Mentors"]),
+                "role": rng.choice(["Volunteer Developer", "Mentor", "Organizer", "Contributor"]),
+                "start_date": f"{today.year - rng.randint(1, 4)}-01-01",
+                "end_date": "Present",
+                "highlights": [
+                    "Built internal tools to streamline operations",
+                    "Mentored students on projects and career guidance",
+                ],
+            })
 
     # Publications & awards
-    publications = []
-    if random.random() < 0.4:
-        publications.append({
-            "title": f"{random.choice(['Scaling','Observability','Reliability','Security'])} in Cloud-Native Systems",
-            "venue": random.choice(["TechBlog", "Medium", "Conference Proceedings"]),
-            "year": date.today().year - random.randint(0, 3),
-            "url": website + "/posts/1",
-        })
-    awards = []
-    if random.random() < 0.4:
-        awards.append({
-            "name": random.choice(["Employee of the Year", "Innovation Award", "Top Mentor"]),
-            "year": date.today().year - random.randint(0, 3),
-        })
+    if "publications" in steps:
+        publications = []
+        if rng.random() < 0.4:
+            publications.append({
+                "title": f"{rng.choice(['Scaling','Observability','Reliability','Security'])} in Cloud-Native Systems",
+                "venue": rng.choice(["TechBlog", "Medium", "Conference Proceedings"]),
+                "year": today.year - rng.randint(0, 3),
+                "url": website + "/posts/1",
+            })
+    if "awards" in steps:
+        awards = []
+        if rng.random() < 0.4:
+            awards.append({
+                "name": rng.choice(["Employee of the Year", "Innovation Award", "Top Mentor"]),
+                "year": today.year - rng.randint(0, 3),
+            })
 
     # References
-    references = []
-    if random.random() < 0.7:
-        references.append({
-            "name": f"{first_name} {random.choice(['Reed','Stone','Parker','Hill'])}",
-            "title": random.choice(["Manager", "Director", "Tech Lead"]),
-            "company": history[-1]["company"] if history else "",
-            "email": f"{first_name.lower()}.{last_name.lower()}@ref.example.com",
-            "phone": phone,
-        })
+    if "references" in steps:
+        references = []
+        if rng.random() < 0.7:
+            references.append({
+                "name": f"{first_name} {rng.choice(['Reed','Stone','Parker','Hill'])}",
+                "title": rng.choice(["Manager", "Director", "Tech Lead"]),
+                "company": history[-1]["company"] if history else "",
+                "email": f"{first_name.lower()}.{last_name.lower()}@ref.example.com",
+                "phone": phone,
+            })
 
-    cv: Dict[str, Union[str, dict, list]] = {
-        "personal": {
+    want = RESUME_FIELD_STEPS if fields is None else fields
+    cv: Dict[str, Union[str, dict, list]] = {}
+    if "personal" in want:
+        cv["personal"] = {
             "first_name": first_name,
             "last_name": last_name,
             "gender": person.get("gender"),
             "email": email,
             "phone": phone,
             "location": location,
-        },
-        "address": address,
-        "headline": headline,
-        "summary": summary,
-        "summary_highlights": summary_highlights,
-        "experience": history,
-        "skills": {
+        }
+    if "address" in want:
+        cv["address"] = address
+    if "headline" in want:
+        cv["headline"] = f"{lvl} {title}" if lvl not in title else title
+    if "summary" in want:
+        cv["summary"] = _summarize(years, title, core_skills)
+    if "summary_highlights" in want:
+        cv["summary_highlights"] = summary_highlights
+    if "experience" in want:
+        cv["experience"] = history
+    if "skills" in want:
+        cv["skills"] = {
             "core": core_skills,
             "secondary": secondary_skills,
             "tools": tools,
             "soft": soft,
-        },
-        "projects": projects,
-        "education": education,
-        "certifications": certs,
-        "languages": languages,
-        "interests": interests,
-        "publications": publications,
-        "awards": awards,
-        "volunteer": volunteer,
-        "references": references,
-        "online_presence": {
+        }
+    for key, value in (("projects", projects), ("education", education), ("certifications", certs),
+                       ("languages", languages), ("interests", interests), ("publications", publications),
+                       ("awards", awards), ("volunteer", volunteer), ("references", references)):
+        if key in want:
+            cv[key] = value
+    if "online_presence" in want:
+        cv["online_presence"] = {
             "username": online.get("username"),
-            "github": github,
-            "linkedin": linkedin,
+            "github": online["social_media"].get("github"),
+            "linkedin": online["social_media"].get("linkedin"),
             "website": website,
-        },
-        "salary_expectation": salary,
-        "meta": {
+        }
+    if "salary_expectation" in want:
+        cv["salary_expectation"] = salary
+    if "meta" in want:
+        cv["meta"] = {
             "family": fam,
             "level": lvl,
             "experience_years": years,
-            "track": track,
+            "track": ft.track,
             "current_company": history[-1]["company"] if history else None,
             "current_title": history[-1]["title"] if history else None,
-            "availability": random.choice(["Immediate", "2 weeks", "1 month"]),
+            "availability": rng.choice(["Immediate", "2 weeks", "1 month"]),
             "work_authorization": f"Citizen ({location['country']})",
-        },
-    }
+        }
+
+    if fields is not None:
+        # Requested order, like generate_profile(fields=...)
+        return {field: cv[field] for field in fields}
+    return cv
+
+
+def _check_resume_fields(fields, format: str) -> Optional[Tuple[str, ...]]:
+    fields = check_fields(fields, RESUME_FIELDS, "resume")
+    if fields is not None and format != "dict":
+        raise ValueError("fields can only be combined with format='dict'")
+    return fields
 
+
+def generate_resume(
+    locale: Optional[str] = None,
+    family: Optional[str] = None,
+    years: int = 8,
+    format: str = "dict",
+    rng: Optional[random.Random] = None,
+    fields: Optional[List[str]] = None,
+) -> Union[Dict[str, Union[str, dict, list]], str]:
+    """
+    Build a realistic Resume/CV from core generators.
+
+    Args:
+        locale: e.g., 'en_US'. Affects names, phone, location hints.
+        family: job family bias (e.g., 'software_engineer'). If None, random.
+        years: employment history window in years.
+        format: 'dict' (default) for structured object, or 'text' for pretty text.
+        rng: optional random.Random instance; defaults to the global random module.
+        fields: optional subset of RESUME_FIELDS. Only the generators those
+            fields depend on run (see resume_steps); 'dict' format only.
+
+    Returns:
+        dict or text string depending on 'format'.
+    """
+    fields = _check_resume_fields(fields, format)
+    rng = rng or random
+    cv = _build_resume(_LocaleTables(locale or "en_US"), family, years, date.today(), {}, rng, fields,
+                       resume_steps(fields))
     if format == "text":
         return _to_text(cv)
     return cv
+
+
+def generate_resumes(
+    n: int,
+    locale: Optional[str] = None,
+    family: Optional[str] = None,
+    years: int = 8,
+    format: str = "dict",
+    workers: Optional[int] = 1,
+    seed: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+    fields: Optional[List[str]] = None,
+) -> List[Union[Dict[str, Union[str, dict, list]], str]]:
+    """
+    Generate many resumes at once with shared per-batch setup.
+
+    Locale tables (cities, streets, country, LANG_BY_LOCALE), per-family
+    tables (degree track, CERTS_BY_TRACK, TOOLS_BY_FAMILY) and the date are
+    resolved once per batch; career data comes from ``career_registry``. Rows
+    have the same shape as ``generate_resume``, and with the same ``rng`` a
+    batch equals the corresponding ``generate_resume`` loop.
+
+    Args:
+        n: Number of resumes.
+        locale: e.g. 'en_US' (the default when None).
+        family: Job family bias. If None, random per resume.
+        years: Employment history window in years.
+        format: 'dict' or 'text'.
+        workers: Worker processes. Anything other than 1 (None uses
+            os.cpu_count()) fans out through ``generate_dataset``.
+        seed: Dataset seed for the sharded path; with a seed the rows are the
+            same for any ``workers`` value.
+        rng: Optional random.Random; draws the seed on the sharded path.
+        fields: Optional subset of RESUME_FIELDS, as for generate_resume.
+
+    Returns:
+        list of dicts, or of text strings for format='text'.
+    """
+    if format not in RESUME_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(RESUME_FORMATS)}")
+    fields = _check_resume_fields(fields, format)
+    if workers != 1 or seed is not None:
+        from .dataset import generate_dataset
+        return list(generate_dataset("resume", n, workers=workers, seed=seed, rng=rng, locale=locale,
+                                     family=family, years=years, format=format, fields=fields))
+    r = rng or random
+    tables = _LocaleTables(locale or "en_US")
+    family_tables: Dict[str, _FamilyTables] = {}
+    today = date.today()
+    steps = resume_steps(fields)
+    cvs = [_build_resume(tables, family, years, today, family_tables, r, fields, steps) for _ in range(max(n, 0))]
+    if format == "text":
+        return [_to_text(cv) for cv in cvs]
+    return cvs
+
+
+def write_resumes(
+    n: int,
+    path: Union[str, os.PathLike, Any],
+    format: str = "text",
+    locale: Optional[str] = None,
+    family: Optional[str] = None,
+    years: int = 8,
+    chunk_size: int = 1_000,
+    compression: Optional[str] = None,
+    compression_level: Optional[int] = None,
+    workers: Optional[int] = 1,
+    seed: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Generate ``n`` resumes and render them straight into a file.
+
+    Resumes are generated ``chunk_size`` at a time (through
+    ``generate_dataset``, so ``workers`` and ``seed`` behave as in
+    ``phoney.export.write``). Each one is rendered section by section into a
+    reused chunk buffer that is written to the (optionally compressed) file
+    in one call, so no resume is built as a separate string and memory stays
+    flat for any ``n``.
+
+    Args:
+        n: Number of resumes.
+        path: Output path, or a binary file object (e.g. ``sys.stdout.buffer``).
+        format: 'text', 'markdown' (separated by a ``---`` rule) or 'json'
+            (JSON Lines).
+        locale, family, years: Passed to generate_resume.
+        chunk_size: Resumes per chunk (also the dataset shard size).
+        compression: 'gzip' or 'zstd'; inferred from a .gz/.zst suffix when None.
+        compression_level: Optional codec level.
+        workers: Worker processes for generation; 1 runs in-process.
+        seed: Dataset seed; drawn from ``rng`` (or the OS) if None.
+        rng: Optional random.Random used only to draw ``seed``.
+        progress: Optional callback receiving the number of resumes written so far.
+    Returns:
+        dict: rows, bytes (encoded size before compression), file_bytes
+        (None for file objects), seconds, rows_per_s and mb_per_s.
+    """
+    from .dataset import generate_dataset
+    from .export import EXPORT_COMPRESSIONS, _chunks, _infer_compression, _open_sink
+
+    if format not in RESUME_SECTIONS:
+        raise ValueError(f"format must be one of {', '.join(RESUME_SECTIONS)}")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+    if compression is None:
+        compression = _infer_compression(path, "text")
+    elif compression not in EXPORT_COMPRESSIONS:
+        raise ValueError(f"compression must be one of {', '.join(EXPORT_COMPRESSIONS)}")
+
+    start = time.perf_counter()
+    rows = generate_dataset("resume", n, workers=workers, seed=seed, shard_size=chunk_size, rng=rng,
+                            locale=locale, family=family, years=years)
+    sections = RESUME_SECTIONS[format]
+    separator = RESUME_SEPARATORS[format]
+    # One reused text buffer per chunk: resumes are rendered into it section by
+    # section, then the chunk is encoded and written in a single call
+    buffer = io.StringIO()
+    write = buffer.write
+    sink, owned = _open_sink(path, compression, compression_level)
+    written = encoded = 0
+    try:
+        for chunk in _chunks(rows, chunk_size):
+            buffer.seek(0)
+            buffer.truncate()
+            for cv in chunk:
+                if written and separator:
+                    write(separator)
+                for section in sections:
+                    section(cv, write)
+                written += 1
+            data = buffer.getvalue().encode("utf-8")
+            sink.write(data)
+            encoded += len(data)
+            if progress is not None:
+                progress(written)
+    finally:
+        for stream in owned:
+            stream.close()
+        if not owned:
+            sink.flush()
+    seconds = time.perf_counter() - start
+    return {
+        "rows": written,
+        "bytes": encoded,
+        "file_bytes": os.path.getsize(path) if isinstance(path, (str, os.PathLike)) else None,
+        "seconds": seconds,
+        "rows_per_s": written / seconds if seconds else 0.0,
+        "mb_per_s": encoded / seconds / 1e6 if seconds else 0.0,
+    }
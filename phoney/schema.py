@@ -0,0 +1,296 @@
+"""
+Declarative tables: describe the columns once, compile them into a row builder.
+
+    from phoney.schema import Schema
+    users = Schema({
+        "id": "uuid4",
+        "name": "full_name",
+        "ip": ("ipv4", {"country": "GB"}),
+        "salary": "salary.min",
+    })
+    users.row()                                     # one dict
+    users.rows(100_000)                             # list of dicts
+    users.stream(chunk_size=10_000)                 # lazy, bounded memory
+    users.dataset(10_000_000, workers=8, seed=1)    # sharded across processes
+
+A column spec is a generator kind (phoney.dataset.DATASET_KINDS) optionally
+followed by a dotted path into its result ('salary.min', 'age.1',
+'resume.personal.email'), an alias from SCHEMA_ALIASES ('uuid4',
+'full_name', ...), a ``(spec, kwargs)`` pair, or a callable taking ``rng``.
+
+Compiling resolves every generator, binds and checks its arguments, and
+emits the Python source of a loop that calls the generators directly, so a
+row costs the generator calls and nothing else: no name lookups, no
+``Phoney`` methods, no per-column dispatch. Columns naming the same
+generator with the same arguments share one call per row, so 'first_name'
+and 'last_name' come from the same person and 'salary.min' / 'salary.max'
+from the same band.
+"""
+from __future__ import annotations
+
+import inspect
+import random
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+DEFAULT_LOCALE = "en_US"
+
+# Column names that are not generator kinds: alias -> (kind, kwargs, expression over the kind's result)
+SCHEMA_ALIASES: Dict[str, Tuple[str, Dict[str, Any], str]] = {
+    "first_name": ("person", {}, "{0}['first_name']"),
+    "last_name": ("person", {}, "{0}['last_name']"),
+    "full_name": ("person", {}, "{0}['first_name'] + ' ' + {0}['last_name']"),
+    "gender": ("person", {}, "{0}['gender']"),
+    "age": ("age", {}, "{0}[0]"),
+    "birthdate": ("age", {}, "{0}[1]"),
+    "uuid1": ("uuid", {"version": 1}, "{0}"),
+    "uuid4": ("uuid", {"version": 4}, "{0}"),
+}
+
+# Generator arguments filled from another generator of the same row: parameter -> (kind, expression
+# over its result). An email or username then matches the row's name and age, and needs no person of its own.
+SCHEMA_LINKS: Dict[str, Tuple[str, str]] = {
+    "first_name": ("person", "{0}['first_name']"),
+    "last_name": ("person", "{0}['last_name']"),
+    "age": ("age", "{0}[0]"),
+    "birth_year": ("age", "{0}[1].year"),
+}
+
+_TEMPLATE = '''\
+def _rows(n, rng, {params}):
+    out = []
+    append = out.append
+    for _ in range(n):
+{calls}
+        append({{{items}}})
+    return out
+'''
+
+
+def _resolve(column: str, spec: Any, locale: Optional[str]) -> Tuple[tuple, Optional[str], Callable[..., Any],
+                                                                     Dict[str, Any], str]:
+    """Source key, kind (None for callables), generator, kwargs and value expression (over ``{0}``) of one column."""
+    from .dataset import DATASET_KINDS
+
+    kwargs: Dict[str, Any] = {}
+    if isinstance(spec, tuple):
+        if len(spec) != 2 or not isinstance(spec[1], Mapping):
+            raise ValueError(f"Column '{column}': a tuple spec must be (generator, kwargs)")
+        spec, kwargs = spec[0], dict(spec[1])
+    if callable(spec):
+        kind, fn, expr = None, spec, "{0}"
+    elif isinstance(spec, str):
+        head, *path = spec.split(".")
+        if head.startswith("generate_"):
+            head = head[len("generate_"):]
+        # A path addresses the kind's raw result: 'age' is the alias, 'age.1' the (age, birthdate) tuple
+        alias = None if path and head in DATASET_KINDS else SCHEMA_ALIASES.get(head)
+        if alias is not None:
+            if path:
+                raise ValueError(f"Column '{column}': alias '{head}' does not take a path")
+            kind, base, expr = alias
+            kwargs = {**base, **kwargs}
+        elif head in DATASET_KINDS:
+            kind = head
+            expr = "{0}" + "".join(f"[{int(key)}]" if key.isdigit() else f"[{key!r}]" for key in path)
+        else:
+            names = sorted(set(DATASET_KINDS) | set(SCHEMA_ALIASES))
+            raise ValueError(f"Column '{column}': unknown generator '{head}'. Valid generators: {', '.join(names)}")
+        fn = DATASET_KINDS[kind]
+        if locale is not None and "locale" in inspect.signature(fn).parameters:
+            kwargs.setdefault("locale", locale)
+    else:
+        raise ValueError(f"Column '{column}': spec must be a generator name, a (name, kwargs) pair or a callable")
+
+    bad = [name for name in kwargs if not name.isidentifier() or name == "rng"]
+    if bad:
+        raise ValueError(f"Column '{column}': invalid argument name(s): {', '.join(bad)}")
+    try:
+        inspect.signature(fn).bind_partial(**kwargs)
+    except TypeError as exc:
+        raise ValueError(f"Column '{column}': {exc}") from None
+    except ValueError:
+        pass  # builtins without a signature: arguments are checked on the first call
+    key = (fn, tuple(sorted((name, repr(value)) for name, value in kwargs.items())))
+    return key, kind, fn, kwargs, expr
+
+
+def compile_schema(columns: Mapping[str, Any], locale: Optional[str] = DEFAULT_LOCALE) -> Tuple[str, Callable]:
+    """
+    Compile column specs into a batch row builder.
+
+    Args:
+        columns: Column name -> spec (see the module docstring).
+        locale: Passed to every generator taking a ``locale`` unless the
+            column sets its own.
+    Returns:
+        tuple: (source, rows) where ``rows(n, rng)`` returns a list of ``n``
+        row dicts and ``source`` is the generated Python code.
+    """
+    if not columns:
+        raise ValueError("A schema needs at least one column")
+    sources: Dict[tuple, int] = {}
+    generators: List[Tuple[Optional[str], Callable[..., Any], Dict[str, Any]]] = []
+    owners: List[str] = []
+    items: List[str] = []
+    for column, spec in columns.items():
+        if not isinstance(column, str):
+            raise ValueError(f"Column names must be strings, got {column!r}")
+        key, kind, fn, kwargs, expr = _resolve(column, spec, locale)
+        index = sources.get(key)
+        if index is None:
+            index = sources[key] = len(generators)
+            generators.append((kind, fn, kwargs))
+            owners.append(column)
+        items.append(f"{column!r}: {expr.format(f'_s{index}')}")
+
+    # First generator of each kind feeds SCHEMA_LINKS arguments; linked generators are called after it
+    first_of = {}
+    for index, (kind, _, _) in enumerate(generators):
+        first_of.setdefault(kind, index)
+    bound: Dict[str, Any] = {}
+    calls: List[str] = []
+    emitted = set()
+
+    def emit(index: int) -> None:
+        kind, fn, kwargs = generators[index]
+        args = []
+        linked = {}
+        if kind is not None:
+            params = inspect.signature(fn).parameters
+            for name, (target, expr) in SCHEMA_LINKS.items():
+                source = first_of.get(target)
+                if name in params and name not in kwargs and source is not None and source != index:
+                    if source not in emitted:
+                        emit(source)
+                    args.append(f"{name}={expr.format(f'_s{source}')}")
+                    linked[name] = None
+        # The whole call, linked arguments included, must bind now rather than fail on the first row
+        try:
+            inspect.signature(fn).bind(**linked, **kwargs, rng=None)
+        except TypeError as exc:
+            raise ValueError(f"Column '{owners[index]}': {exc}") from None
+        except ValueError:
+            pass  # builtins without a signature: arguments are checked on the first call
+        bound[f"_g{index}"] = fn
+        for j, (name, value) in enumerate(kwargs.items()):
+            bound[f"_a{index}_{j}"] = value
+            args.append(f"{name}=_a{index}_{j}")
+        args.append("rng=rng")
+        calls.append(f"        _s{index} = _g{index}({', '.join(args)})")
+        emitted.add(index)
+
+    for index in range(len(generators)):
+        if index not in emitted:
+            emit(index)
+
+    # Generators and arguments become parameter defaults: locals inside the loop, bound once
+    source = _TEMPLATE.format(params=", ".join(f"{name}={name}" for name in bound),
+                              calls="\n".join(calls), items=", ".join(items))
+    namespace = dict(bound)
+    exec(compile(source, "<phoney.schema>", "exec"), namespace)
+    return source, namespace["_rows"]
+
+
+def _schema_shard(schema: "Schema", index: int, count: int, seed: int) -> List[Dict[str, Any]]:
+    from .dataset import shard_seed
+
+    return schema._rows(count, random.Random(shard_seed(seed, index)))
+
+
+class Schema:
+    """
+    A table definition compiled into a specialized row builder.
+
+    Usage:
+        from phoney import Schema
+        orders = Schema({"id": "uuid4", "buyer": "full_name", "email": "email",
+                         "ip": ("ipv4", {"country": "GB"}), "band": "salary.min"},
+                        locale="en_GB")
+        orders.rows(1000)
+        print(orders.source)     # the generated loop
+    """
+
+    def __init__(self, columns: Mapping[str, Any], locale: Optional[str] = DEFAULT_LOCALE,
+                 rng: Optional[random.Random] = None):
+        """
+        Args:
+            columns: Column name -> spec: a generator kind with an optional
+                dotted path ('salary.min'), an alias ('uuid4', 'full_name'),
+                a (spec, kwargs) pair, or a callable taking ``rng``. Columns
+                keep this order in every row.
+            locale: Passed to every generator taking a ``locale`` unless the
+                column's kwargs set one. None leaves generator defaults.
+            rng: Optional random.Random for row/rows/stream and for drawing
+                a dataset seed; defaults to the global random module.
+        """
+        self.columns = dict(columns)
+        self.locale = locale
+        self.rng = rng
+        self.source, self._rows = compile_schema(self.columns, locale)
+
+    def __reduce__(self):
+        # Workers receive the spec and compile their own builder; the rng stays behind
+        return (Schema, (self.columns, self.locale))
+
+    def __repr__(self) -> str:
+        return f"Schema({list(self.columns)!r}, locale={self.locale!r})"
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.columns)
+
+    def row(self) -> Dict[str, Any]:
+        """Generate one row."""
+        return self._rows(1, self.rng or random)[0]
+
+    def rows(self, n: int) -> List[Dict[str, Any]]:
+        """Generate ``n`` rows in one call of the compiled loop."""
+        return self._rows(n, self.rng or random)
+
+    def stream(self, n: Optional[int] = None, chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield rows, built ``chunk_size`` at a time.
+
+        Args:
+            n: Number of rows. If None, the iterator never ends.
+            chunk_size: Rows per call of the compiled loop; at most one chunk is alive.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        return self._stream(n, chunk_size)
+
+    def _stream(self, n: Optional[int], chunk_size: int) -> Iterator[Dict[str, Any]]:
+        rows, rng = self._rows, self.rng or random
+        remaining = n
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            chunk = rows(size, rng)
+            if remaining is not None:
+                remaining -= size
+            yield from chunk
+            del chunk
+
+    def dataset(self, n: int, workers: Optional[int] = None, seed: Optional[int] = None,
+                shard_size: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Generate ``n`` rows across a process pool, streamed in order.
+
+        Sharding and seeding follow ``generate_dataset``: the same ``seed``
+        and ``shard_size`` give the same rows for any ``workers`` value.
+        Callable columns must be picklable (module-level functions) when
+        ``workers`` > 1.
+
+        Args:
+            n: Number of rows.
+            workers: Worker processes. None uses os.cpu_count(); 1 runs in-process.
+            seed: Dataset seed; drawn from the schema's rng (or the OS) if None.
+            shard_size: Rows per shard (default DEFAULT_SHARD_SIZE).
+        """
+        from .dataset import DEFAULT_SHARD_SIZE, stream_shards
+
+        return stream_shards(partial(_schema_shard, self), n, workers=workers, seed=seed,
+                             shard_size=shard_size or DEFAULT_SHARD_SIZE, rng=self.rng)
+
+
+__all__ = ["Schema", "compile_schema", "SCHEMA_ALIASES", "DEFAULT_LOCALE"]
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import random
+from array import array
+from typing import Any, Callable, Dict, Optional
+
+from .emailgen import generate_email
+from .person import generate_person
+from .username import generate_username, generate_social_handles
+
+UNIQUE_MODES = ("exact", "bloom")
+
+# Suffixed candidates tried after max_retries fresh draws; a suffix then has 2 + 63 // 4 = 17 digits, so
+# running out means the index reports everything as taken (a Bloom filter far past its capacity)
+MAX_PERTURB_ROUNDS = 64
+
+
+def _fingerprint(namespace: str, value: str) -> int:
+    # 64-bit, never 0 (0 marks an empty slot); values compare case-insensitively. A digest rather
+    # than hash(), which is salted per process, so seeded scopes repeat across runs
+    digest = hashlib.blake2b(f"{namespace}\0{value.casefold()}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") or 1
+
+
+class FingerprintSet:
+    """
+    Open-addressing hash set of 64-bit fingerprints in a flat ``array('Q')``.
+
+    Costs 16 bytes per entry at the maximum load of 0.5, against roughly 100
+    for a ``set`` of strings. Two different values sharing a fingerprint only
+    cause a spurious "seen" (an extra retry), never a duplicate.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        size = 1 << max(10, math.ceil(math.log2(max(capacity, 1) * 2)))
+        self._slots = array("Q", bytes(8 * size))
+        self._mask = size - 1
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, fp: int) -> bool:
+        """Insert a fingerprint; return False if it was already present."""
+        slots, mask = self._slots, self._mask
+        i = fp & mask
+        while True:
+            cur = slots[i]
+            if cur == 0:
+                break
+            if cur == fp:
+                return False
+            i = (i + 1) & mask
+        slots[i] = fp
+        self._count += 1
+        if self._count * 2 > len(slots):
+            self._grow()
+        return True
+
+    def _grow(self) -> None:
+        old = self._slots
+        size = len(old) * 2
+        slots = array("Q", bytes(8 * size))
+        mask = size - 1
+        for fp in old:
+            if fp:
+                i = fp & mask
+                while slots[i]:
+                    i = (i + 1) & mask
+                slots[i] = fp
+        self._slots, self._mask = slots, mask
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._slots) * self._slots.itemsize
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter sized for ``capacity`` entries at ``error_rate``.
+
+    Memory never grows (about 1.8 bytes per planned entry at 0.1%). A false
+    positive makes a fresh value look taken, so it costs a retry; uniqueness
+    itself is never violated because Bloom filters have no false negatives.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self._bits = bytearray((bits + 7) // 8)
+        self._m = len(self._bits) * 8
+        self._k = max(1, round(bits / capacity * math.log(2)))
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, fp: int) -> bool:
+        """Set the fingerprint's bits; return False if they were all set already."""
+        bits, m = self._bits, self._m
+        h1 = fp & 0xFFFFFFFF
+        h2 = (fp >> 32) | 1
+        new = False
+        for i in range(self._k):
+            pos = (h1 + i * h2) % m
+            byte, bit = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & bit:
+                bits[byte] |= bit
+                new = True
+        if new:
+            self._count += 1
+        return new
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+class UniqueScope:
+    """
+    Issue usernames, emails and social handles that never repeat within the scope.
+
+    Each generated value is checked against an index of everything issued so
+    far. On a collision the value is redrawn up to ``max_retries`` times, after
+    which digits are appended to the local part until it is unused.
+    Comparisons are case-insensitive and separate per kind (and per platform
+    for handles).
+
+    Usage:
+        from phoney import phoney
+        with phoney.unique() as u:
+            emails = [u.email(locale="en_US") for _ in range(100_000)]
+            print(u.stats())
+
+        # 100M-scale runs: fixed memory, rare extra retries
+        with phoney.unique(mode="bloom", capacity=100_000_000) as u:
+            ...
+    """
+
+    def __init__(
+        self,
+        mode: str = "exact",
+        capacity: Optional[int] = None,
+        error_rate: float = 0.001,
+        max_retries: int = 8,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Args:
+            mode: 'exact' (growing fingerprint set) or 'bloom' (fixed-size filter).
+            capacity: Expected number of values. Required for 'bloom'; presizes 'exact'.
+            error_rate: Bloom false-positive rate at ``capacity`` entries.
+            max_retries: Fresh draws before falling back to suffix perturbation.
+            rng: Optional random.Random for reproducible output.
+        """
+        if mode not in UNIQUE_MODES:
+            raise ValueError(f"mode must be one of {', '.join(UNIQUE_MODES)}")
+        if mode == "bloom":
+            if capacity is None:
+                raise ValueError("mode='bloom' requires capacity")
+            self._index = BloomFilter(capacity, error_rate)
+        else:
+            self._index = FingerprintSet(capacity or 1024)
+        self.mode = mode
+        self.capacity = capacity
+        self.max_retries = max_retries
+        self.rng = rng
+        self.issued = 0
+        self.collisions = 0
+        self.perturbed = 0
+
+    def __enter__(self) -> "UniqueScope":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def claim(self, namespace: str, value: str) -> bool:
+        """Record ``value`` under ``namespace``; False if it was already issued."""
+        return self._index.add(_fingerprint(namespace, value))
+
+    def value(self, namespace: str, draw: Callable[[], str],
+              perturb: Optional[Callable[[str, int, Any], str]] = None) -> str:
+        """
+        Return a value from ``draw()`` that is unused in ``namespace``.
+
+        Args:
+            namespace: Uniqueness domain, e.g. 'email' or 'handle:github'.
+            draw: Zero-argument generator of candidates.
+            perturb: ``perturb(candidate, round, rng)`` returns a variant with
+                a numeric suffix; defaults to appending digits.
+        Raises:
+            ValueError: if MAX_PERTURB_ROUNDS suffixed candidates are all
+                taken, i.e. the index is saturated.
+        """
+        rng = self.rng or random
+        perturb = perturb or _append_digits
+        candidate = draw()
+        for _ in range(self.max_retries):
+            if self.claim(namespace, candidate):
+                self.issued += 1
+                return candidate
+            self.collisions += 1
+            candidate = draw()
+        base = candidate
+        for attempt in range(MAX_PERTURB_ROUNDS + 1):
+            if attempt:
+                candidate = perturb(base, attempt - 1, rng)
+            if self.claim(namespace, candidate):
+                self.issued += 1
+                if attempt:
+                    self.perturbed += 1
+                return candidate
+            self.collisions += 1
+        if self.mode == "bloom":
+            raise ValueError(f"Bloom filter is saturated: every '{namespace}' candidate tests as issued after "
+                             f"{self.issued} values; raise capacity (currently {self.capacity})")
+        raise ValueError(f"No unused '{namespace}' value after {MAX_PERTURB_ROUNDS} suffixed candidates")
+
+    def username(self, first_name: Optional[str] = None, last_name: Optional[str] = None, locale: str = 'en_US') -> str:
+        """Unique ``generate_username``; random names are redrawn on every retry."""
+        rng = self.rng
+        return self.value('username', lambda: generate_username(first_name, last_name, locale, rng=rng))
+
+    def email(self, first_name: Optional[str] = None, last_name: Optional[str] = None, locale: str = 'en_US',
+              age: Optional[int] = None, birth_year: Optional[int] = None, domain: Optional[str] = None) -> str:
+        """Unique ``generate_email``; digits go before the '@' when perturbing."""
+        rng = self.rng
+
+        def draw() -> str:
+            first, last = first_name, last_name
+            if not first or not last:
+                person = generate_person(locale, rng=rng)
+                first, last = person['first_name'], person['last_name']
+            return generate_email(first, last, locale, age=age, birth_year=birth_year, domain=domain, rng=rng)
+
+        return self.value('email', draw, _perturb_email)
+
+    def social_handle(self, first_name: Optional[str] = None, last_name: Optional[str] = None,
+                      platform: str = 'twitter', locale: str = 'en_US') -> str:
+        """Unique ``generate_social_handles`` per platform."""
+        rng = self.rng
+        return self.value(f'handle:{platform}',
+                          lambda: generate_social_handles(first_name, last_name, platform, locale, rng=rng))
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the uniqueness index."""
+        return self._index.nbytes
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns:
+            dict: mode, issued (values returned), collisions (rejected
+            candidates), perturbed (values that needed a suffix),
+            collision_rate (collisions per candidate), memory_bytes and
+            bytes_per_value.
+        """
+        attempts = self.issued + self.collisions
+        return {
+            'mode': self.mode,
+            'issued': self.issued,
+            'collisions': self.collisions,
+            'perturbed': self.perturbed,
+            'collision_rate': self.collisions / attempts if attempts else 0.0,
+            'memory_bytes': self.nbytes,
+            'bytes_per_value': self.nbytes / self.issued if self.issued else 0.0,
+        }
+
+
+def _append_digits(value: str, attempt: int, rng=random) -> str:
+    # Two digits at first, one more every four rounds
+    digits = 2 + attempt // 4
+    return f"{value}{rng.randrange(10 ** (digits - 1), 10 ** digits)}"
+
+
+def _perturb_email(value: str, attempt: int, rng=random) -> str:
+    local, sep, domain = value.rpartition('@')
+    if not sep:
+        return _append_digits(value, attempt, rng)
+    return f"{_append_digits(local, attempt, rng)}@{domain}"
+
+
+def unique(mode: str = "exact", capacity: Optional[int] = None, error_rate: float = 0.001, max_retries: int = 8,
+           rng: Optional[random.Random] = None) -> UniqueScope:
+    """Open a UniqueScope; see UniqueScope for the arguments."""
+    return UniqueScope(mode=mode, capacity=capacity, error_rate=error_rate, max_retries=max_retries, rng=rng)
+
+
+__all__ = ["UniqueScope", "unique", "FingerprintSet", "BloomFilter", "UNIQUE_MODES", "MAX_PERTURB_ROUNDS"]
@@ -3,7 +3,7 @@ __all__ = ['generate_uuid']
 import uuid
 import random
 
-def generate_uuid(version=4, domain="example.com", name=None):
+def generate_uuid(version=4, domain="example.com", name=None, rng=None):
     """
     Generate a UUID with customizable parameters.
     
@@ -11,6 +11,9 @@ def generate_uuid(version=4, domain="example.com", name=None):
         version (int): UUID version (1, 3, 4, or 5)
         domain (str): Domain name for namespaced UUIDs (versions 3/5)
         name (str): Custom name for namespaced UUIDs (versions 3/5)
+        rng (random.Random): Optional random source. When given, version 4
+            UUIDs and generated names are drawn from it (reproducible with a
+            seeded generator); version 1 stays time-based.
         
     Returns:
         str: UUID string
@@ -26,8 +29,12 @@ def generate_uuid(version=4, domain="example.com", name=None):
         
         if not name:
             prefixes = ['user', 'account', 'id', 'profile', 'entity']
-            suffixes = ['', str(uuid.uuid4().fields[0])]
-            name = f"{random.choice(prefixes)}-{random.choice(suffixes)}"
+            if rng is None:
+                suffixes = ['', str(uuid.uuid4().fields[0])]
+                name = f"{random.choice(prefixes)}-{random.choice(suffixes)}"
+            else:
+                suffixes = ['', str(rng.getrandbits(32))]
+                name = f"{rng.choice(prefixes)}-{rng.choice(suffixes)}"
         
         full_name = f"{name}@{domain}"
         
@@ -37,6 +44,8 @@ def generate_uuid(version=4, domain="example.com", name=None):
             return str(uuid.uuid5(namespace, full_name))
     
     elif version == 4:
+        if rng is not None:
+            return str(uuid.UUID(int=rng.getrandbits(128), version=4))
         return str(uuid.uuid4())
     
     else:
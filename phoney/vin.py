@@ -2,47 +2,105 @@ from __future__ import annotations
 
 import random
 import string
+from typing import Optional
+
+from .checksum import vin_check_digit, _VIN_VALUES, VIN_TRANSLITERATION, VIN_WEIGHTS, _check_code_batch_args
+
+try:
+    import numpy as np
+except ImportError:  # optional: generate_vins falls back to the pure-Python path
+    np = None
 
 # VIN excludes I, O, Q
 VIN_CHARS = "ABCDEFGHJKLMNPRSTUVWXYZ0123456789"
-# Transliteration values
-TRANSLIT = {c: v for c, v in zip("ABCDEFGHJKLMNPRSTUVWXYZ", [1,2,3,4,5,6,7,8,9,1,2,3,4,5,7,9,2,3,4,5,6,7,8,9])}
-for i in range(10):
-    TRANSLIT[str(i)] = i
-# Position weights for check digit
-WEIGHTS = [8,7,6,5,4,3,2,10,0,9,8,7,6,5,4,3,2]
+
+# Kept for existing imports: transliteration values and position weights now live in phoney.checksum
+TRANSLIT = VIN_TRANSLITERATION
+WEIGHTS = VIN_WEIGHTS
+
+# Alphabet runs of the 16 non-check positions, in order (the check digit goes after the first 8):
+# WMI region, WMI manufacturer, WMI division + VDS, VIS head, VIS serial digits
+VIN_RUNS = (
+    ("123456789JHTWKLZVSY", 1),
+    ("ABCDEFGHJKLMNPRSTUVWXYZ", 1),
+    (VIN_CHARS, 6),
+    (VIN_CHARS, 2),
+    (string.digits, 6),
+)
 
 
-def _random_wmi() -> str:
+def _random_wmi(rng=random) -> str:
     # Use generic WMI-like prefixes (not tied to specific manufacturers)
     # WMI: 1st = region/manufacturer, 2nd = manufacturer, 3rd = vehicle type/division (allow alnum except I/O/Q)
-    first = random.choice("123456789JHTWKLZVSY")
-    second = random.choice("ABCDEFGHJKLMNPRSTUVWXYZ")
-    third = random.choice("ABCDEFGHJKLMNPRSTUVWXYZ0123456789")
+    first = rng.choice("123456789JHTWKLZVSY")
+    second = rng.choice("ABCDEFGHJKLMNPRSTUVWXYZ")
+    third = rng.choice("ABCDEFGHJKLMNPRSTUVWXYZ0123456789")
     return first + second + third
 
 
-def _check_digit(vin14: str) -> str:
-    total = 0
-    for i, ch in enumerate(vin14):
-        val = TRANSLIT.get(ch, 0)
-        total += val * WEIGHTS[i]
-    remainder = total % 11
-    return "X" if remainder == 10 else str(remainder)
-
-
-def generate_vin() -> str:
-    wmi = _random_wmi()
+def generate_vin(rng: Optional[random.Random] = None) -> str:
+    rng = rng or random
+    wmi = _random_wmi(rng)
     # VDS: 5 chars (positions 4-8), use VIN_CHARS (excludes I/O/Q)
-    vds = "".join(random.choice(VIN_CHARS) for _ in range(5))
+    vds = "".join(rng.choice(VIN_CHARS) for _ in range(5))
     # VIS: 8 chars (positions 10-17). Commonly last 6 are digits; keep first 2 alnum.
-    vis_head = "".join(random.choice(VIN_CHARS) for _ in range(2))
-    vis_tail = "".join(random.choice(string.digits) for _ in range(6))
+    vis_head = "".join(rng.choice(VIN_CHARS) for _ in range(2))
+    vis_tail = "".join(rng.choice(string.digits) for _ in range(6))
     vis = vis_head + vis_tail
     vin14 = wmi + vds + "0" + vis  # placeholder for check digit at pos 9 (index 8)
-    cd = _check_digit(vin14)
+    cd = vin_check_digit(vin14)
     vin = vin14[:8] + cd + vin14[9:]
     return vin
 
 
-__all__ = ["generate_vin"]
+def _vins_python(n, rng):
+    choices = rng.choices
+    columns = []
+    for alphabet, k in VIN_RUNS:
+        block = ''.join(choices(alphabet, k=n * k))
+        columns.append([block[i:i + k] for i in range(0, n * k, k)])
+    vins = []
+    append = vins.append
+    for parts in zip(*columns):
+        body = ''.join(parts)
+        append(f"{body[:8]}{vin_check_digit(body)}{body[8:]}")
+    return vins
+
+
+def _vins_numpy(n, gen):
+    out = np.empty((n, 17), dtype=np.uint8)
+    col = 0
+    for alphabet, k in VIN_RUNS:
+        symbols = np.frombuffer(alphabet.encode('ascii'), dtype=np.uint8)
+        out[:, col:col + k] = symbols[gen.integers(0, len(symbols), size=(n, k))]
+        col += k + 1 if col + k == 8 else k  # skip the check position
+    values = np.frombuffer(_VIN_VALUES, dtype=np.uint8)[out]
+    values[:, 8] = 0
+    remainder = (values.astype(np.int64) @ np.asarray(VIN_WEIGHTS, dtype=np.int64)) % 11
+    out[:, 8] = np.frombuffer(b"0123456789X", dtype=np.uint8)[remainder]
+    return out.view('S17').ravel()
+
+
+def generate_vins(n: int, rng: Optional[random.Random] = None, backend: Optional[str] = None, as_: str = "str"):
+    """
+    Generate ``n`` VINs at once, with the same character classes as ``generate_vin``.
+
+    Each alphabet run is drawn for all rows in one call (one NumPy array draw,
+    or one ``rng.choices`` per run) instead of one ``rng.choice`` per character.
+
+    - rng: optional random.Random; the NumPy backend seeds its generator from
+      it, so output is reproducible per backend.
+    - backend: 'numpy', 'python', or None to use NumPy when available.
+    - as_: 'str' for a list of str, 'numpy' for an ``S17`` array.
+    """
+    use_numpy = _check_code_batch_args(as_, backend)
+    n = max(n, 0)
+    r = rng or random
+    if use_numpy:
+        vins = _vins_numpy(n, np.random.default_rng(r.getrandbits(64) if rng is not None else None))
+        return vins if as_ == 'numpy' else vins.astype(str).tolist()
+    vins = _vins_python(n, r)
+    return np.array(vins, dtype='S17') if as_ == 'numpy' else vins
+
+
+__all__ = ["generate_vin", "generate_vins"]
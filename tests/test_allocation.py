@@ -0,0 +1,38 @@
+import pytest
+
+from phoney import checksum
+from phoney.allocation import FeistelPermutation, IdentifierAllocator
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 10, 97, 256, 1000, 4097])
+@pytest.mark.parametrize("key", [0, 1, 0xDEADBEEF])
+def test_feistel_is_a_bijection(size, key):
+    perm = FeistelPermutation(size, key)
+    assert sorted(perm(i) for i in range(size)) == list(range(size))
+
+
+def test_feistel_key_changes_the_order():
+    assert [FeistelPermutation(1000, 1)(i) for i in range(20)] != [FeistelPermutation(1000, 2)(i) for i in range(20)]
+
+
+@pytest.mark.parametrize("mode", ["sequential", "permuted"])
+def test_allocator_is_unique_and_valid(mode):
+    alloc = IdentifierAllocator("imei", prefix="35209900", mode=mode, key=7)
+    codes = alloc.take(2000)
+    assert len(set(codes)) == len(codes)
+    assert all(checksum.is_valid_imei(code) and code.startswith("35209900") for code in codes)
+
+
+def test_allocator_state_resumes_disjoint():
+    alloc = IdentifierAllocator("ean13", prefix="40123456", mode="permuted", key=3)
+    first = alloc.take(500)
+    rest = IdentifierAllocator.from_state(alloc.state()).take(500)
+    assert not set(first) & set(rest)
+    assert rest == alloc.take(500)
+
+
+def test_allocator_runs_out():
+    alloc = IdentifierAllocator("ean13", prefix="40123456789", mode="permuted", key=1)
+    assert len(set(alloc.take(10))) == 10
+    with pytest.raises(ValueError):
+        alloc.allocate()
@@ -0,0 +1,33 @@
+import pytest
+
+from phoney.cli import main
+
+
+@pytest.mark.parametrize("argv", [
+    ["gen", "profile", "--set", "foo=1"],
+    ["gen", "profile", "--set", "locale=de_DE"],
+    ["gen", "person", "-n", "2"],
+    ["gen", "skills", "-n", "2"],
+    ["gen", "resume", "-f", "text", "--set", "fields=x"],
+    ["gen", "imei", "-f", "markdown"],
+    ["gen", "nope"],
+])
+def test_usage_errors_exit_2(argv, tmp_path, capsys):
+    out = tmp_path / "out.jsonl"
+    with pytest.raises(SystemExit) as exc:
+        main(argv + ["-o", str(out), "-q"])
+    assert exc.value.code == 2
+    assert "phoney: error:" in capsys.readouterr().err
+    assert not out.exists()
+
+
+@pytest.mark.parametrize("argv", [
+    ["gen", "person", "-n", "2", "-l", "de_DE"],
+    ["gen", "skills", "-n", "2", "--set", "family=software_engineer"],
+    ["gen", "phone", "-n", "2", "--set", "max_attempts=3"],
+    ["gen", "phone", "-n", "2", "--set", "backend=python"],
+])
+def test_valid_settings_write(argv, tmp_path):
+    out = tmp_path / "out.jsonl"
+    assert main(argv + ["-o", str(out), "-q", "-s", "1"]) == 0
+    assert len(out.read_text(encoding="utf-8").splitlines()) == 2
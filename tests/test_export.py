@@ -0,0 +1,64 @@
+import csv
+import json
+
+import pytest
+
+from phoney.create_profile import PROFILE_COLUMNS
+from phoney.dataset import generate_dataset
+from phoney.export import write
+
+
+def _rows(kind, n, chunk_size, **kwargs):
+    return list(generate_dataset(kind, n, workers=1, seed=3, shard_size=chunk_size, **kwargs))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1000])
+def test_resume_parquet_round_trip(tmp_path, chunk_size):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "resumes.parquet"
+    stats = write("resume", 60, path, format="parquet", seed=3, chunk_size=chunk_size)
+    assert stats["rows"] == 60
+    assert pq.read_table(path).to_pylist() == _rows("resume", 60, chunk_size)
+
+
+def test_jsonl_round_trip(tmp_path):
+    path = tmp_path / "imeis.jsonl.gz"
+    write("imei", 25, path, seed=3, chunk_size=4)
+    import gzip
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert [json.loads(line)["imei"] for line in f] == _rows("imei", 25, 4)
+
+
+@pytest.mark.parametrize("kind", ["profile", "resume", "imei", "age", "salary"])
+def test_empty_csv_has_a_header(tmp_path, kind):
+    path = tmp_path / "empty.csv"
+    write(kind, 0, path, format="csv")
+    assert path.read_text(encoding="utf-8").strip()
+
+
+def test_profile_csv_columns(tmp_path):
+    path = tmp_path / "profiles.csv"
+    write("profile", 7, path, format="csv", chunk_size=3, seed=1)
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == list(PROFILE_COLUMNS)
+    assert len(rows) == 7
+
+    write("profile", 2, path, format="csv", fields=["email", "credit_card"])
+    with open(path, newline="", encoding="utf-8") as f:
+        assert next(csv.reader(f)) == ["email", "credit_card_issuer", "credit_card_number", "credit_card_expiry",
+                                       "credit_card_cvv"]
+
+
+def test_list_rows_are_json_in_csv(tmp_path):
+    path = tmp_path / "history.csv"
+    write("employment_history", 3, path, format="csv", seed=3, chunk_size=2)
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [json.loads(row["employment_history"]) for row in rows] == \
+        json.loads(json.dumps(_rows("employment_history", 3, 2), default=str))
+
+
+def test_bad_format():
+    with pytest.raises(ValueError):
+        write("imei", 1, "x.txt", format="xml")
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from phoney import (
+    generate_credit_cards, generate_ean13, generate_ean13s, generate_financial_batch, generate_imei, generate_imeis,
+    generate_isbn13, generate_isbn13s, generate_upca, generate_upcas, generate_vin, generate_vins, is_valid_card_number,
+    is_valid_ean13, is_valid_iban, is_valid_imei, is_valid_isbn13, is_valid_upca, is_valid_vin,
+)
+from phoney import checksum
+
+BACKENDS = ["python"] + (["numpy"] if checksum.np is not None else [])
+
+BULK = [
+    (generate_imeis, is_valid_imei),
+    (generate_vins, is_valid_vin),
+    (generate_ean13s, is_valid_ean13),
+    (generate_upcas, is_valid_upca),
+    (generate_isbn13s, is_valid_isbn13),
+]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("generate, valid", BULK)
+def test_bulk_check_digits(generate, valid, backend):
+    codes = generate(2000, rng=random.Random(5), backend=backend)
+    assert len(codes) == 2000
+    assert all(valid(code) for code in codes)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("generate", [g for g, _ in BULK])
+def test_bulk_is_seeded(generate, backend):
+    assert generate(50, rng=random.Random(9), backend=backend) == generate(50, rng=random.Random(9), backend=backend)
+
+
+@pytest.mark.parametrize("generate, valid", [
+    (generate_imei, is_valid_imei),
+    (generate_vin, is_valid_vin),
+    (generate_ean13, is_valid_ean13),
+    (generate_upca, is_valid_upca),
+    (generate_isbn13, is_valid_isbn13),
+])
+def test_single_check_digits(generate, valid):
+    rng = random.Random(3)
+    assert all(valid(generate(rng=rng)) for _ in range(500))
+
+
+def test_check_digit_rejects_a_changed_digit():
+    code = generate_ean13(rng=random.Random(1))
+    bad = code[:-1] + str((int(code[-1]) + 1) % 10)
+    assert is_valid_ean13(code) and not is_valid_ean13(bad)
+
+
+@pytest.mark.parametrize("generate", [generate_ean13, generate_upca, generate_isbn13])
+def test_non_digit_prefix_is_rejected(generate):
+    with pytest.raises(ValueError):
+        generate("12a4")
+
+
+@pytest.mark.parametrize("locale", ["en_US", "en_GB", "de_DE", "fr_FR"])
+def test_financial_batch_is_valid(locale):
+    batch = generate_financial_batch(500, locale=locale, rng=random.Random(2))
+    assert all(is_valid_card_number(number) for number in batch["credit_card_number"])
+    assert all(is_valid_iban(iban) for iban in batch["iban"])
+
+
+def test_credit_cards_pass_luhn():
+    assert all(is_valid_card_number(card["number"]) for card in generate_credit_cards(1000, rng=random.Random(8)))
@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run(code):
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    return subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout
+
+
+@pytest.mark.parametrize("first", ["import phoney; phoney.Phoney", "from phoney import phoney", "pass"])
+def test_unique_and_allocator_stay_functions(first):
+    out = _run(f"{first}\nfrom phoney import unique, allocator\nimport phoney.core\nimport phoney as p\n"
+               "print(callable(unique) and callable(p.unique) and callable(allocator) and callable(p.allocator))")
+    assert out.strip() == "True"
+
+
+def test_import_is_lazy():
+    out = _run("import sys, phoney\nprint(sorted(m for m in sys.modules if m.startswith('phoney')))")
+    assert out.strip() == "['phoney']"
+
+
+def test_baseline_attributes():
+    import phoney
+
+    assert "en_US" in phoney.get_available_locales()
+    assert phoney.load_email_domains()
+    for name in phoney.__all__:
+        assert getattr(phoney, name) is not None
@@ -0,0 +1,20 @@
+import random
+
+from phoney import generate_resume, generate_resumes
+
+
+def test_batch_equals_loop():
+    rng = random.Random(3)
+    loop = [generate_resume(locale="en_US", rng=rng) for _ in range(8)]
+    assert generate_resumes(8, locale="en_US", rng=random.Random(3)) == loop
+
+
+def test_batch_equals_loop_with_fields():
+    fields = ["headline", "skills", "experience"]
+    rng = random.Random(5)
+    loop = [generate_resume(locale="de_DE", family="software_engineer", rng=rng, fields=fields) for _ in range(5)]
+    assert generate_resumes(5, locale="de_DE", family="software_engineer", rng=random.Random(5), fields=fields) == loop
+
+
+def test_seeded_batch_does_not_depend_on_workers():
+    assert generate_resumes(6, seed=4, workers=1) == generate_resumes(6, seed=4, workers=2)
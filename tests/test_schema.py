@@ -0,0 +1,33 @@
+import random
+
+import pytest
+
+from phoney import Schema
+
+
+def test_rows_share_a_person():
+    rows = Schema({"first": "first_name", "name": "full_name", "email": "email"}, rng=random.Random(1)).rows(20)
+    assert all(row["name"].startswith(row["first"] + " ") for row in rows)
+
+
+@pytest.mark.parametrize("columns", [
+    {"s": "skills"},
+    {"s": ("skills", {"nope": 1})},
+    {"x": "not_a_generator"},
+    {"f": lambda: 1},
+])
+def test_bad_specs_fail_at_construction(columns):
+    with pytest.raises(ValueError):
+        Schema(columns)
+
+
+def test_person_needs_a_locale():
+    with pytest.raises(ValueError):
+        Schema({"p": "person"}, locale=None)
+    assert len(Schema({"p": "person"}).rows(3)) == 3
+
+
+def test_dataset_does_not_depend_on_workers():
+    schema = Schema({"id": "uuid4", "ip": "ipv4", "band": "salary.min"})
+    assert list(schema.dataset(30, workers=1, seed=2, shard_size=7)) == \
+        list(schema.dataset(30, workers=2, seed=2, shard_size=7))
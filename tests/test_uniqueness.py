@@ -0,0 +1,49 @@
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from phoney import UniqueScope
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_SCRIPT = """
+import random
+from phoney import UniqueScope
+u = UniqueScope(mode="bloom", capacity=2000, rng=random.Random(7))
+values = [u.username() for _ in range(2000)]
+print(len(set(values)), u.collisions, values[-1])
+"""
+
+
+@pytest.mark.parametrize("mode", ["exact", "bloom"])
+def test_values_are_unique(mode):
+    u = UniqueScope(mode=mode, capacity=5000, rng=random.Random(1))
+    values = [u.username() for _ in range(5000)]
+    assert len({v.casefold() for v in values}) == len(values)
+    assert u.stats()["issued"] == 5000
+
+
+def test_seeded_scope_repeats_across_processes():
+    outputs = set()
+    for hashseed in ("1", "2", "3"):
+        env = dict(os.environ, PYTHONHASHSEED=hashseed, PYTHONPATH=str(ROOT))
+        outputs.add(subprocess.run([sys.executable, "-c", _SCRIPT], env=env, capture_output=True, text=True,
+                                   check=True).stdout)
+    assert len(outputs) == 1
+
+
+def test_saturated_bloom_filter_raises():
+    u = UniqueScope(mode="bloom", capacity=50, rng=random.Random(1))
+    with pytest.raises(ValueError, match="saturated"):
+        for _ in range(5000):
+            u.username()
+
+
+def test_namespaces_are_separate():
+    u = UniqueScope()
+    assert u.claim("a", "x") and u.claim("b", "x")
+    assert not u.claim("a", "X")
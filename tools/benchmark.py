@@ -0,0 +1,571 @@
+"""
+Micro-benchmarks for phoney's hot paths.
+
+Each subcommand times one generator family and prints rows/second so that
+changes to the bulk code paths can be compared against the single-call loop.
+
+Usage:
+  python tools/benchmark.py profiles --count 20000
+  python tools/benchmark.py phone --count 20000 --locale en_US --locale de_DE
+  python tools/benchmark.py phones --count 1000000 --locale en_US
+  python tools/benchmark.py ip --count 100000 --country GB
+  python tools/benchmark.py presence --count 20000
+  python tools/benchmark.py unique --count 200000 --mode bloom
+  python tools/benchmark.py financial --count 50000 --locale en_GB
+  python tools/benchmark.py checksum --count 500000
+  python tools/benchmark.py identifiers --count 1000000
+  python tools/benchmark.py profile-output --count 50000 --memory
+  python tools/benchmark.py export --kind imei --count 1000000
+  python tools/benchmark.py export --kind resume --count 2000 --chunk-size 5 --check
+  python tools/benchmark.py importtime --check
+  python tools/benchmark.py career --count 5000 --locale en_US
+  python tools/benchmark.py resumes --count 5000 --workers 4
+  python tools/benchmark.py resume-render --count 5000
+  python tools/benchmark.py fields --count 20000
+  python tools/benchmark.py schema --count 50000 --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+def _rate(label: str, count: int, fn) -> float:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed else float("inf")
+    print(f"{label:<40} {rate:>12,.0f} rows/s  ({elapsed:.3f}s)")
+    return rate
+
+
+def bench_profiles(args: argparse.Namespace) -> None:
+    from phoney import generate_profile, generate_profiles
+
+    n = args.count
+    generate_profiles(100, locale=args.locale)  # warm locale caches
+    base = _rate("generate_profile loop", n, lambda: [generate_profile(args.locale) for _ in range(n)])
+    bulk = _rate("generate_profiles", n, lambda: generate_profiles(n, locale=args.locale))
+    print(f"speed-up: {bulk / base:.2f}x")
+
+
+def bench_phone(args: argparse.Namespace) -> None:
+    from phoney.phone import COUNTRY_CODES, generate_phone
+
+    n = args.count
+    for locale in args.locale or sorted(COUNTRY_CODES):
+        generate_phone(locale)  # compile the locale's plan
+        _rate(f"generate_phone {locale}", n, lambda: [generate_phone(locale) for _ in range(n)])
+
+
+def bench_phones(args: argparse.Namespace) -> None:
+    from phoney.phone import generate_phone, generate_phones, np
+
+    n = args.count
+    generate_phones(100, locale=args.locale, backend="python")  # compile the locale's plan
+    base = _rate("generate_phone loop", n, lambda: [generate_phone(args.locale) for _ in range(n)])
+    _rate("generate_phones (python)", n, lambda: generate_phones(n, locale=args.locale, backend="python"))
+    if np is None:
+        print("numpy not installed; skipping the numpy backend")
+        return
+    bulk = _rate("generate_phones (numpy)", n, lambda: generate_phones(n, locale=args.locale, backend="numpy"))
+    print(f"speed-up: {bulk / base:.2f}x")
+
+
+def bench_ip(args: argparse.Namespace) -> None:
+    from phoney.internet import generate_ipv4, generate_ipv4_batch, generate_ipv6, generate_ipv6_batch, np, prefix_registry
+
+    n = args.count
+    cc = args.country
+    print(f"{cc}: {len(prefix_registry.ipv4(cc))} IPv4 / {len(prefix_registry.ipv6(cc))} IPv6 prefixes")
+    _rate(f"generate_ipv4 country={cc}", n, lambda: [generate_ipv4(country=cc) for _ in range(n)])
+    _rate(f"generate_ipv6 country={cc}", n, lambda: [generate_ipv6(country=cc) for _ in range(n)])
+    for backend in ("python", "numpy") if np is not None else ("python",):
+        for as_ in ("int", "bytes"):
+            _rate(f"generate_ipv4_batch {as_} ({backend})", n,
+                  lambda: generate_ipv4_batch(n, country=cc, as_=as_, backend=backend))
+            _rate(f"generate_ipv6_batch {as_} ({backend})", n,
+                  lambda: generate_ipv6_batch(n, country=cc, as_=as_, backend=backend))
+
+
+def _peak_bytes(fn) -> int:
+    """Peak traced memory allocated while running fn once."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_presence(args: argparse.Namespace) -> None:
+    from phoney import generate_online_presence
+
+    n = args.count
+    call = lambda: generate_online_presence("Anna", "Rossi", args.locale)  # noqa: E731
+    call()  # warm locale caches
+    _rate("generate_online_presence", n, lambda: [call() for _ in range(n)])
+    print(f"peak bytes allocated per call: {_peak_bytes(call):,}")
+
+
+def bench_unique(args: argparse.Namespace) -> None:
+    from phoney import UniqueScope, generate_email
+
+    n = args.count
+    scope = UniqueScope(mode=args.mode, capacity=n)
+    _rate("generate_email loop", n, lambda: [generate_email(locale=args.locale) for _ in range(n)])
+    _rate(f"UniqueScope.email ({args.mode})", n, lambda: [scope.email(locale=args.locale) for _ in range(n)])
+    for key, value in scope.stats().items():
+        print(f"  {key:<16} {value:,.4f}" if isinstance(value, float) else f"  {key:<16} {value}")
+
+
+def bench_financial(args: argparse.Namespace) -> None:
+    from phoney import generate_financial_batch, generate_financial_data
+
+    n = args.count
+    base = _rate("generate_financial_data loop", n, lambda: [generate_financial_data(args.locale) for _ in range(n)])
+    bulk = _rate("generate_financial_batch", n, lambda: generate_financial_batch(n, args.locale))
+    print(f"speed-up: {bulk / base:.2f}x")
+
+
+def _per_digit_luhn(digits: str) -> int:
+    # The per-character loop the generators used before phoney.checksum
+    total = 0
+    for i, ch in enumerate(digits[::-1]):
+        d = int(ch) * (2 if i % 2 == 0 else 1)
+        total += d - 9 if d > 9 else d
+    return -total % 10
+
+
+def _per_digit_gs1(digits: str) -> int:
+    total = 0
+    for i, ch in enumerate(digits):
+        total += int(ch) * (1 if i % 2 == 0 else 3)
+    return -total % 10
+
+
+def bench_checksum(args: argparse.Namespace) -> None:
+    import random
+
+    from phoney import checksum
+
+    n = args.count
+    rng = random.Random(0)
+    imeis = [f"{rng.randrange(10 ** 14):014d}" for _ in range(n)]
+    eans = [body[:12] for body in imeis]
+    base = _rate("Luhn per-digit loop", n, lambda: [_per_digit_luhn(b) for b in imeis])
+    fast = _rate("checksum.luhn_check_digit", n, lambda: [checksum.luhn_check_digit(b) for b in imeis])
+    print(f"speed-up: {fast / base:.2f}x")
+    base = _rate("GS1 per-digit loop", n, lambda: [_per_digit_gs1(b) for b in eans])
+    fast = _rate("checksum.gs1_check_digit", n, lambda: [checksum.gs1_check_digit(b) for b in eans])
+    print(f"speed-up: {fast / base:.2f}x")
+    vins = ["1M8GDM9A0KP042788"] * n
+    _rate("checksum.vin_check_digit", n, lambda: [checksum.vin_check_digit(v) for v in vins])
+    if checksum.np is not None:
+        np = checksum.np
+        matrix = np.frombuffer("".join(imeis).encode("ascii"), dtype=np.uint8).reshape(n, 14) - 48
+        _rate("checksum.luhn_check_digits (numpy)", n, lambda: checksum.luhn_check_digits(matrix))
+        _rate("checksum.gs1_check_digits (numpy)", n, lambda: checksum.gs1_check_digits(matrix[:, :12]))
+
+
+def bench_identifiers(args: argparse.Namespace) -> None:
+    from phoney import (
+        generate_ean13, generate_ean13s, generate_imei, generate_imeis, generate_vin, generate_vins,
+    )
+
+    n = args.count
+    loop_n = max(n // 10, 1)
+    for name, single, bulk in (("imei", generate_imei, generate_imeis), ("vin", generate_vin, generate_vins),
+                               ("ean13", generate_ean13, generate_ean13s)):
+        base = _rate(f"generate_{name} loop", loop_n, lambda: [single() for _ in range(loop_n)])
+        for backend, as_ in (("python", "str"), ("numpy", "str"), ("numpy", "numpy")):
+            try:
+                rate = _rate(f"{bulk.__name__} ({backend}, as_={as_})", n, lambda: bulk(n, backend=backend, as_=as_))
+            except ValueError as exc:
+                print(f"{bulk.__name__} ({backend}): skipped ({exc})")
+                continue
+            print(f"  speed-up: {rate / base:.1f}x")
+
+
+def bench_profile_output(args: argparse.Namespace) -> None:
+    from phoney import generate_profiles
+
+    n = args.count
+    generate_profiles(100, locale=args.locale)  # warm locale caches
+    converters = {"columns": ("rows (list of dicts)", None)}
+    try:
+        import pandas as pd
+        converters["pandas"] = ("rows + pandas.json_normalize", lambda rows: pd.json_normalize(rows, sep="_"))
+    except ImportError:
+        print("pandas not installed: skipping output='pandas'")
+    try:
+        import pyarrow as pa
+        converters["arrow"] = ("rows + pyarrow.Table.from_pylist", pa.Table.from_pylist)
+    except ImportError:
+        print("pyarrow not installed: skipping output='arrow'")
+
+    rows = generate_profiles(n, locale=args.locale)
+    for output, (label, convert) in converters.items():
+        if convert is not None:
+            _rate(f"  conversion only: {label}", n, lambda: convert(rows))
+        direct = (lambda o: lambda: generate_profiles(n, locale=args.locale, output=o))(output)
+        via_rows = (lambda c: lambda: c(generate_profiles(n, locale=args.locale)) if c else
+                    generate_profiles(n, locale=args.locale))(convert)
+        base = _rate(label, n, via_rows)
+        fast = _rate(f"output='{output}'", n, direct)
+        print(f"  speed-up: {fast / base:.2f}x")
+        if args.memory:
+            print(f"  peak traced memory: {_peak_bytes(via_rows) / 2 ** 20:,.1f} MiB (rows) vs "
+                  f"{_peak_bytes(direct) / 2 ** 20:,.1f} MiB (output='{output}')")
+
+
+def _read_back(path: Path, fmt: str, compression) -> list:
+    import gzip
+    import json
+
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        return pq.read_table(path).to_pylist()
+    if compression == "zstd":
+        import zstandard
+        text = zstandard.ZstdDecompressor().stream_reader(open(path, "rb")).read().decode("utf-8")
+    else:
+        text = (gzip.open if compression == "gzip" else open)(path, "rb").read().decode("utf-8")
+    if fmt == "jsonl":
+        return [json.loads(line) for line in text.splitlines()]
+    import csv
+    import io
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+def bench_export(args: argparse.Namespace) -> None:
+    import json
+    import tempfile
+
+    from phoney.dataset import generate_dataset
+    from phoney.export import _dumps, _flatten, _record, write
+
+    formats = [("csv", None), ("csv", "gzip"), ("jsonl", None), ("jsonl", "gzip")]
+    for module, fmt, compression in (("zstandard", "jsonl", "zstd"), ("pyarrow", "parquet", None)):
+        try:
+            __import__(module)
+            formats.append((fmt, compression))
+        except ImportError:
+            print(f"{module} not installed: skipping {fmt}" + (f"+{compression}" if compression else ""))
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt, compression in formats:
+            path = Path(tmp) / f"out.{fmt}"
+            stats = write(args.kind, args.count, path, format=fmt, compression=compression, seed=0,
+                          workers=args.workers, chunk_size=args.chunk_size)
+            label = fmt + (f"+{compression}" if compression else "")
+            print(f"{label:<14} {stats['rows_per_s']:>12,.0f} rows/s  {stats['mb_per_s']:>7.1f} MB/s  "
+                  f"{stats['file_bytes'] / 1e6:>9.1f} MB on disk  ({stats['seconds']:.2f}s)")
+            if args.check:
+                # Read the file back and compare with the same seed's rows
+                records = [_record(args.kind, row) for row in
+                           generate_dataset(args.kind, args.count, seed=0, shard_size=args.chunk_size, workers=1)]
+                if fmt == "parquet":
+                    expected = records
+                elif fmt == "jsonl":
+                    expected = [json.loads(_dumps(record)) for record in records]
+                else:
+                    expected = [{k: "" if v is None else str(v) for k, v in _flatten(record).items()}
+                                for record in records]
+                # Wall-clock columns are the only ones a seed does not fix
+                strip = lambda rows: [{k: v for k, v in row.items() if k != "created_at"} for row in rows]
+                if strip(_read_back(path, fmt, compression)) != strip(expected):
+                    print(f"{label}: read-back differs from the generated rows")
+                    sys.exit(1)
+
+
+# (label, code) probes for the importtime guard; each runs in a fresh interpreter
+_IMPORT_PROBES = (
+    ("python -c pass", "pass"),
+    ("import phoney", "import phoney"),
+    ("from phoney import generate_uuid", "from phoney import generate_uuid; generate_uuid()"),
+    ("from phoney import phoney (everything)", "from phoney import phoney; phoney.uuid()"),
+)
+
+# What the lazy package may load for the first three probes
+_IMPORT_ALLOWED = {
+    "import phoney": {"phoney"},
+    "from phoney import generate_uuid": {"phoney", "phoney.uuidgen"},
+}
+
+
+def _import_probe(code: str, repeat: int):
+    import json
+    import os
+    import subprocess
+
+    root = str(Path(__file__).resolve().parents[1])
+    env = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    report = "import sys, json; print(json.dumps(sorted(m for m in sys.modules if m.split('.')[0] in ('phoney', 'numpy'))))"
+    best, modules, self_us = float("inf"), [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        done = subprocess.run([sys.executable, "-X", "importtime", "-c", f"{code}\n{report}"], cwd=root, env=env,
+                              capture_output=True, text=True, check=True)
+        best = min(best, time.perf_counter() - start)
+        modules = json.loads(done.stdout.strip().splitlines()[-1])
+        for line in done.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == "phoney":
+                self_us = int(parts[1].strip())
+    return best * 1000, modules, self_us
+
+
+def bench_importtime(args: argparse.Namespace) -> None:
+    failures = []
+    baseline = None
+    for label, code in _IMPORT_PROBES:
+        wall_ms, modules, cumulative_us = _import_probe(code, args.repeat)
+        if baseline is None:
+            baseline = wall_ms
+        phoney_modules = [m for m in modules if m.split(".")[0] == "phoney"]
+        numpy_loaded = any(m.split(".")[0] == "numpy" for m in modules)
+        print(f"{label:<40} {wall_ms:>8.1f} ms  (+{wall_ms - baseline:6.1f} over bare python)  "
+              f"{len(phoney_modules):>2} phoney modules{'  + numpy' if numpy_loaded else ''}")
+        allowed = _IMPORT_ALLOWED.get(label)
+        if allowed is not None:
+            extra = sorted(set(modules) - allowed)
+            if extra:
+                failures.append(f"{label}: unexpectedly imported {', '.join(extra)}")
+            if wall_ms - baseline > args.budget_ms:
+                failures.append(f"{label}: {wall_ms - baseline:.1f} ms over bare python (budget {args.budget_ms} ms)")
+    if args.check:
+        for failure in failures:
+            print(f"FAIL {failure}")
+        if failures:
+            sys.exit(1)
+        print("OK: lazy imports within budget")
+
+
+def bench_career(args: argparse.Namespace) -> None:
+    from phoney.career import career_registry, generate_employment_history
+
+    n = args.count
+
+    def cold():
+        for _ in range(n):
+            career_registry.invalidate()
+            generate_employment_history(locale=args.locale)
+
+    _rate("employment history, re-read per call", n, cold)
+    generate_employment_history(locale=args.locale)  # warm the registry
+    _rate("employment history, cached", n, lambda: [generate_employment_history(locale=args.locale)
+                                                    for _ in range(n)])
+
+
+def bench_resumes(args: argparse.Namespace) -> None:
+    import random
+
+    from phoney.resume import generate_resume, generate_resumes
+
+    n = args.count
+    rng = random.Random(0)
+    generate_resumes(100, locale=args.locale, rng=rng)  # warm locale and career caches
+    base = _rate("generate_resume loop", n, lambda: [generate_resume(locale=args.locale, rng=rng) for _ in range(n)])
+    bulk = _rate("generate_resumes", n, lambda: generate_resumes(n, locale=args.locale, rng=rng))
+    print(f"speed-up: {bulk / base:.2f}x")
+    if args.workers > 1:
+        pool = _rate(f"generate_resumes workers={args.workers}", n,
+                     lambda: generate_resumes(n, locale=args.locale, workers=args.workers, seed=0))
+        print(f"speed-up: {pool / base:.2f}x")
+
+
+def bench_resume_render(args: argparse.Namespace) -> None:
+    import io
+    import os
+    import tempfile
+
+    from phoney.resume import RESUME_SECTIONS, _to_text, generate_resumes, render_resume, write_resumes
+
+    n = args.count
+    cvs = generate_resumes(n, locale=args.locale)
+
+    def joined():
+        out = io.StringIO()
+        for cv in cvs:
+            out.write(_to_text(cv))
+            out.write("\n")
+
+    def streamed(format):
+        out = io.StringIO()
+        for cv in cvs:
+            render_resume(cv, out, format)
+
+    _rate("render text: build string + write", n, joined)
+    for format in RESUME_SECTIONS:
+        _rate(f"render_resume {format}", n, lambda: streamed(format))
+    with tempfile.TemporaryDirectory() as tmp:
+        for format in ("text", "markdown"):
+            path = os.path.join(tmp, f"resumes.{format}")
+            stats = write_resumes(n, path, format=format, locale=args.locale)
+            print(f"{'write_resumes ' + format:<40} {stats['rows_per_s']:>12,.0f} rows/s  "
+                  f"({stats['mb_per_s']:.1f} MB/s, generation included)")
+
+
+_FIELD_SETS = {
+    "profile": (None, ["uuid", "full_name", "email", "phone", "username"], ["full_name", "email"], ["email"],
+                ["first_name"], ["uuid"]),
+    "resume": (None, ["personal", "experience", "skills"], ["personal", "headline"], ["personal"], ["headline"]),
+}
+
+
+def bench_fields(args: argparse.Namespace) -> None:
+    from phoney.create_profile import generate_profiles, profile_steps
+    from phoney.resume import generate_resumes, resume_steps
+
+    batch = {"profile": (generate_profiles, profile_steps), "resume": (generate_resumes, resume_steps)}
+    for kind in args.kind or sorted(batch):
+        generate, steps = batch[kind]
+        n = args.count if kind == "profile" else max(1, args.count // 10)
+        generate(100, locale=args.locale)  # warm locale caches
+        for fields in _FIELD_SETS[kind]:
+            label = f"{kind} {','.join(fields) if fields else 'all fields'}"
+            _rate(f"{label[:30]:<30} {len(steps(fields)):>2} steps", n,
+                  lambda: generate(n, locale=args.locale, fields=fields))
+
+
+def bench_schema(args: argparse.Namespace) -> None:
+    import random
+
+    from phoney import Phoney, Schema
+
+    n = args.count
+    columns = {"id": "uuid4", "name": "full_name", "email": "email", "ip": ("ipv4", {"country": "GB"}),
+               "salary": "salary.min"}
+    p = Phoney(rng=random.Random(1))
+    schema = Schema(columns, locale=args.locale, rng=random.Random(1))
+    schema.rows(100)  # warm locale caches
+
+    def hand_loop():
+        # Same columns, same work: the email is built from the row's name, as the schema links it
+        rows = []
+        for _ in range(n):
+            row_id = p.uuid(4)
+            name = p.full_name(locale=args.locale)
+            first, last = name.split(" ", 1)
+            rows.append({"id": row_id, "name": name, "email": p.email(first, last, locale=args.locale),
+                         "ip": p.ipv4(country="GB", locale=args.locale), "salary": p.salary(locale=args.locale)["min"]})
+        return rows
+
+    base = _rate("hand loop over Phoney methods", n, hand_loop)
+    rows = _rate("Schema.rows", n, lambda: schema.rows(n))
+    _rate("Schema.stream (chunk 1000)", n, lambda: sum(1 for _ in schema.stream(n)))
+    if args.workers != 1:
+        _rate(f"Schema.dataset workers={args.workers}", n,
+              lambda: sum(1 for _ in schema.dataset(n, workers=args.workers, seed=1, shard_size=max(1, n // 16))))
+    print(f"speed-up: {rows / base:.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark phoney generators.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("profiles", help="generate_profile loop vs generate_profiles")
+    p.add_argument("--count", type=int, default=20000)
+    p.add_argument("--locale", default="en_US")
+    p.set_defaults(func=bench_profiles)
+
+    p = sub.add_parser("phone", help="generate_phone per locale")
+    p.add_argument("--count", type=int, default=20000)
+    p.add_argument("--locale", action="append", help="repeatable; default: every locale")
+    p.set_defaults(func=bench_phone)
+
+    p = sub.add_parser("phones", help="generate_phone loop vs generate_phones backends")
+    p.add_argument("--count", type=int, default=1000000)
+    p.add_argument("--locale", default="en_US")
+    p.set_defaults(func=bench_phones)
+
+    p = sub.add_parser("ip", help="generate_ipv4 / generate_ipv6 for one country")
+    p.add_argument("--count", type=int, default=100000)
+    p.add_argument("--country", default="GB")
+    p.set_defaults(func=bench_ip)
+
+    p = sub.add_parser("presence", help="generate_online_presence time and per-call allocation")
+    p.add_argument("--count", type=int, default=20000)
+    p.add_argument("--locale", default="en_US")
+    p.set_defaults(func=bench_presence)
+
+    p = sub.add_parser("unique", help="UniqueScope.email vs plain generate_email")
+    p.add_argument("--count", type=int, default=200000)
+    p.add_argument("--locale", default="en_US")
+    p.add_argument("--mode", choices=("exact", "bloom"), default="exact")
+    p.set_defaults(func=bench_unique)
+
+    p = sub.add_parser("financial", help="generate_financial_data loop vs generate_financial_batch")
+    p.add_argument("--count", type=int, default=50000)
+    p.add_argument("--locale", default="en_US")
+    p.set_defaults(func=bench_financial)
+
+    p = sub.add_parser("checksum", help="per-digit check-digit loops vs phoney.checksum kernels")
+    p.add_argument("--count", type=int, default=500000)
+    p.set_defaults(func=bench_checksum)
+
+    p = sub.add_parser("identifiers", help="IMEI/VIN/EAN-13 loops vs the bulk variants")
+    p.add_argument("--count", type=int, default=1000000)
+    p.set_defaults(func=bench_identifiers)
+
+    p = sub.add_parser("profile-output", help="generate_profiles rows + conversion vs column-oriented output")
+    p.add_argument("--count", type=int, default=50000)
+    p.add_argument("--locale", default="en_US")
+    p.add_argument("--memory", action="store_true", help="also report peak traced memory (slow)")
+    p.set_defaults(func=bench_profile_output)
+
+    p = sub.add_parser("export", help="phoney.export.write throughput per format and compression")
+    p.add_argument("--kind", default="profile")
+    p.add_argument("--count", type=int, default=50000)
+    p.add_argument("--workers", type=int, default=1)
+    p.add_argument("--chunk-size", type=int, default=10000)
+    p.add_argument("--check", action="store_true", help="read each file back and exit 1 if it differs")
+    p.set_defaults(func=bench_export)
+
+    p = sub.add_parser("importtime", help="import cost of the lazy package (regression guard with --check)")
+    p.add_argument("--repeat", type=int, default=5, help="fresh interpreters per probe; the fastest counts")
+    p.add_argument("--budget-ms", type=float, default=40.0,
+                   help="max wall time over bare python for the lazy probes")
+    p.add_argument("--check", action="store_true", help="exit 1 if a lazy probe loads extra modules or is over budget")
+    p.set_defaults(func=bench_importtime)
+
+    p = sub.add_parser("career", help="employment histories with and without the career data cache")
+    p.add_argument("--count", type=int, default=5_000)
+    p.add_argument("--locale", default="en_US")
+    p.set_defaults(func=bench_career)
+
+    p = sub.add_parser("resumes", help="generate_resume loop vs generate_resumes (optionally across processes)")
+    p.add_argument("--count", type=int, default=5_000)
+    p.add_argument("--locale", default="en_US")
+    p.add_argument("--workers", type=int, default=1)
+    p.set_defaults(func=bench_resumes)
+
+    p = sub.add_parser("resume-render", help="resume text rendering: joined strings vs the streaming renderer")
+    p.add_argument("--count", type=int, default=5_000)
+    p.add_argument("--locale", default="en_US")
+    p.set_defaults(func=bench_resume_render)
+
+    p = sub.add_parser("fields", help="generate_profiles / generate_resumes throughput per fields= projection")
+    p.add_argument("--count", type=int, default=20_000, help="profiles per run (resumes: count / 10)")
+    p.add_argument("--locale", default="en_US")
+    p.add_argument("--kind", action="append", choices=("profile", "resume"))
+    p.set_defaults(func=bench_fields)
+
+    p = sub.add_parser("schema", help="Schema.rows / stream / dataset vs a hand-written loop")
+    p.add_argument("--count", type=int, default=50_000)
+    p.add_argument("--locale", default="en_US")
+    p.add_argument("--workers", type=int, default=1, help="also time Schema.dataset with this many processes")
+    p.set_defaults(func=bench_schema)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()